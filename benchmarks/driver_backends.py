@@ -0,0 +1,81 @@
+# Compares command latency of the chromedriver and raw DevTools (cdp) driver backends on a real profile:
+#   python -m benchmarks.driver_backends <profile name> [rounds]
+import sys
+import time
+
+from rich.table import Table
+from rich.console import Console
+from selenium.webdriver.common.by import By
+
+from src.chrome.chrome import Chrome
+from src.chrome.cdp import CdpDriver
+from src.chrome.driver_pool import driver_pool
+from src.utils.metrics import get_percentile
+
+
+OPERATIONS = {
+    'execute_script': lambda driver: driver.execute_script('return document.readyState;'),
+    'current_url': lambda driver: driver.current_url,
+    'find_element': lambda driver: driver.find_element(By.TAG_NAME, 'body'),
+    'get_attribute': lambda driver: driver.find_element(By.TAG_NAME, 'body').get_attribute('class'),
+    'get': lambda driver: driver.get('about:blank')
+}
+
+
+def measure(driver, rounds: int) -> dict[str, list[float]]:
+    timings = {}
+    for name, operation in OPERATIONS.items():
+        operation(driver)  # warm up
+        values = []
+        for _ in range(rounds):
+            started_at = time.perf_counter()
+            operation(driver)
+            values.append((time.perf_counter() - started_at) * 1000)
+        timings[name] = sorted(values)
+
+    return timings
+
+
+def main(profile_name: str, rounds: int) -> None:
+    chrome = Chrome()
+    chrome_process = chrome.launch_profile(profile_name, debug=True, headless=True)
+    if not chrome_process or not chrome.wait_until_ready(profile_name, chrome_process):
+        sys.exit(f'{profile_name} - профиль не запустился')
+
+    debugger_address = f'127.0.0.1:{chrome.get_debug_port(profile_name)}'
+    results = {}
+    try:
+        driver = driver_pool.create_session(debugger_address)
+        try:
+            results['chromedriver'] = measure(driver, rounds)
+        finally:
+            driver_pool.close_session(driver)
+
+        driver = CdpDriver(debugger_address)
+        try:
+            results['cdp'] = measure(driver, rounds)
+        finally:
+            driver.quit()
+    finally:
+        driver_pool.shutdown()
+        chrome_process.terminate()
+        chrome_process.wait()
+        chrome.release_debug_port(profile_name)
+
+    table = Table(title=f'Задержка команд, мс ({rounds} повторов)', style="cyan")
+    table.add_column("Операция", style="magenta")
+    for backend in results:
+        table.add_column(f"{backend} p50", style="green")
+        table.add_column(f"{backend} p95", style="green")
+
+    for name in OPERATIONS:
+        table.add_row(name, *(
+            f'{get_percentile(timings[name], quantile):.2f}'
+            for timings in results.values() for quantile in (0.5, 0.95)
+        ))
+
+    Console().print(table)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 50)
@@ -1,4 +1,25 @@
 general_config = {
     'show_debug_logs': False,                   # Показывать DEBUG логи в консоли (True / False)
-    'max_workers': 10                           # Максимальное количество потоков для многопоточных процессов (1+)
+    'max_workers': 10,                          # Максимальное количество потоков для многопоточных процессов (1+)
+    'profiles_layout': 'shared',                # Расположение новых профилей: 'shared' - общая папка данных Chrome, 'sharded' - своя папка данных у каждого профиля (нужно для многопоточного прогона скриптов)
+    'debug_ports_range': (9222, 9300),          # Диапазон портов для подключения к профилям (от, до), порты переиспользуются после закрытия профиля
+    'launch_ready_timeout_sec': 30,             # Максимальное время ожидания готовности профиля после запуска (сек)
+    'chromedriver_pool_size': 2,                # Количество процессов chromedriver, общих для всех профилей (1+)
+    'chromedriver_max_sessions': 100,           # Количество подключений к профилям, после которого процесс chromedriver перезапускается (1+)
+    'driver_backend': 'selenium',               # Способ управления профилями в chrome скриптах: 'selenium' - через chromedriver, 'cdp' - напрямую через DevTools протокол (быстрее, экспериментально)
+    'script_click_delay_sec': 0.05,             # Пауза до и после клика в chrome скриптах (сек), переопределяется ключом "pacing" в config.json скрипта
+    'script_wait_timeout_sec': 5,               # Максимальное время ожидания элемента / загрузки страницы в chrome скриптах (сек)
+    'script_poll_interval_sec': 0.05,           # Интервал проверки условия при ожидании в chrome скриптах (сек)
+    'launch_max_parallel': 4,                   # Сколько профилей может одновременно находиться в стадии запуска при массовом запуске (1+)
+    'launch_min_free_ram_mb': 1024,             # Новые профили не запускаются, пока свободной памяти меньше (МБ)
+    'launch_max_load_per_cpu': 1.5,             # Новые профили не запускаются, пока средняя нагрузка (load average за минуту) на ядро выше
+    'launch_max_disk_mb_per_sec': 200,          # Новые профили не запускаются, пока чтение + запись диска выше (МБ/сек)
+    'launch_jitter_sec': (0.2, 1.0),            # Случайная пауза перед каждым запуском (от, до), чтобы профили не стартовали одновременно
+    'launch_settle_sec': 15,                    # Через сколько секунд профиль точно считается запущенным (сек)
+    'launch_settled_cpu_percent': 25,           # Профиль считается запущенным раньше, если его процессы потребляют меньше CPU (%)
+    'launch_poll_interval_sec': 0.5,            # Как часто проверять ресурсы, пока запуск приостановлен (сек)
+    'shutdown_timeout_sec': 10,                 # Сколько ждать штатного закрытия профилей перед принудительным завершением (сек)
+    'metrics_enabled': True,                    # Сохранять метрики каждого прогона (счетчики и длительности) в data/metrics/*.json
+    'metrics_prometheus_file': False,           # Дополнительно писать метрики последнего прогона в data/metrics/metrics.prom (формат Prometheus)
+    'metadata_backend': 'json'                  # Хранилище комментариев и данных профилей: 'json' - data/comments_for_profiles.json, 'sqlite' - data/metadata.db (быстрый поиск на тысячах профилей, комментарии из json импортируются при первом запуске)
 }
@@ -17,8 +17,10 @@ logger.add("data/debug_log.log", level="DEBUG", format=log_format)
 def main():
     main_activities_list = {
         '🚀 запуск профилей': menu.launch_multiple_profiles,
+        '🖥 запущенные профили': menu.manage_running_profiles,
         '📖 просмотр профилей': menu.show_all_profiles,
         '📝 задать комментарии': menu.update_comments,
+        '🏷 задать теги': menu.update_tags,
         '🤖 прогон скриптов [chrome]': menu.run_chrome_scripts_on_multiple_profiles,
         '🤖 прогон скриптов [manager]': menu.run_manager_scripts_on_multiple_profiles,
         '🧩 работа с расширениями': menu.manage_extensions,
@@ -0,0 +1,349 @@
+import json
+import time
+import threading
+import itertools
+import urllib.request
+
+import websocket
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (WebDriverException,
+                                        JavascriptException,
+                                        NoSuchElementException,
+                                        NoSuchShadowRootException,
+                                        NoSuchWindowException,
+                                        StaleElementReferenceException,
+                                        TimeoutException)
+
+
+FIND_ELEMENTS_JS = """
+function(by, value) {
+    const root = this instanceof Node ? this : document;
+    if (by === 'xpath') {
+        const snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+    }
+    const selectors = {
+        'css selector': value,
+        'tag name': value,
+        'id': '#' + CSS.escape(value),
+        'class name': '.' + CSS.escape(value),
+        'name': '[name="' + CSS.escape(value) + '"]'
+    };
+    return Array.from(root.querySelectorAll(selectors[by]));
+}
+"""
+
+GET_ATTRIBUTE_JS = """
+function(name) {
+    const value = this[name];
+    if (name in this && value !== null && typeof value !== 'object' && typeof value !== 'function') {
+        return typeof value === 'boolean' ? (value ? 'true' : null) : String(value);
+    }
+    return this.getAttribute(name);
+}
+"""
+
+IS_DISPLAYED_JS = """
+function() {
+    const style = getComputedStyle(this);
+    return style.visibility !== 'hidden' && style.display !== 'none' && this.getClientRects().length > 0;
+}
+"""
+
+# Returns null when the click was done in JS: options of a closed native <select>
+# and other zero-sized elements have no point a mouse event could hit
+CLICK_POINT_JS = """
+function() {
+    if (this instanceof HTMLOptionElement) {
+        const select = this.closest('select');
+        this.selected = select && select.multiple ? !this.selected : true;
+        for (const type of ['input', 'change']) {
+            (select || this).dispatchEvent(new Event(type, {bubbles: true}));
+        }
+        return null;
+    }
+
+    this.scrollIntoView({block: 'center', inline: 'center'});
+    const rect = this.getBoundingClientRect();
+    if (!rect.width || !rect.height) {
+        this.click();
+        return null;
+    }
+    return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+}
+"""
+
+CLEAR_JS = """
+function() {
+    this.focus();
+    this.value = '';
+    this.dispatchEvent(new Event('input', {bubbles: true}));
+    this.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+
+class CdpConnection:
+    def __init__(self, ws_url: str, timeout: int | float = 30):
+        self.ws = websocket.create_connection(ws_url, timeout=timeout, suppress_origin=True)
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+
+    def send(self, method: str, params: dict | None = None) -> dict:
+        with self.lock:
+            message_id = next(self.ids)
+            self.ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+
+            while True:
+                message = json.loads(self.ws.recv())
+                if message.get('id') == message_id:  # events and stale replies are skipped
+                    break
+
+        if 'error' in message:
+            error = message['error'].get('message', '')
+            if 'Could not find object with given id' in error or 'Cannot find context' in error:
+                raise StaleElementReferenceException(error)
+            raise WebDriverException(f'{method}: {error}')
+
+        return message.get('result', {})
+
+    def close(self) -> None:
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+class CdpSearchContext:
+    driver: 'CdpDriver'
+    object_id: str
+
+    def find_element(self, by: str = By.ID, value: str | None = None) -> 'CdpElement':
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f'{by}={value}')
+
+        return elements[0]
+
+    def find_elements(self, by: str = By.ID, value: str | None = None) -> list['CdpElement']:
+        result = self.driver.call_function(FIND_ELEMENTS_JS, [by, value], self.object_id, by_value=False)
+        return self.driver.unpack_array(result)
+
+
+class CdpElement(CdpSearchContext):
+    def __init__(self, driver: 'CdpDriver', object_id: str):
+        self.driver = driver
+        self.object_id = object_id
+
+    def call(self, function_declaration: str, *args):
+        return self.driver.call_function(function_declaration, list(args), self.object_id)
+
+    @property
+    def id(self) -> str:
+        return self.object_id
+
+    @property
+    def tag_name(self) -> str:
+        return self.call('function() { return this.tagName.toLowerCase(); }')
+
+    @property
+    def text(self) -> str:
+        return self.call('function() { return this.innerText; }')
+
+    @property
+    def shadow_root(self) -> 'CdpShadowRoot':
+        result = self.driver.call_function('function() { return this.shadowRoot; }', [], self.object_id, by_value=False)
+        if not result.get('objectId'):
+            raise NoSuchShadowRootException('no shadow root')
+
+        return CdpShadowRoot(self.driver, result['objectId'])
+
+    def get_attribute(self, name: str) -> str | None:
+        return self.call(GET_ATTRIBUTE_JS, name)
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        return self.call('function(name) { return this.getAttribute(name); }', name)
+
+    def get_property(self, name: str):
+        return self.call('function(name) { return this[name]; }', name)
+
+    def is_selected(self) -> bool:
+        return self.call('function() { return !!(this.checked || this.selected); }')
+
+    def is_enabled(self) -> bool:
+        return self.call('function() { return !this.disabled; }')
+
+    def is_displayed(self) -> bool:
+        return self.call(IS_DISPLAYED_JS)
+
+    def click(self) -> None:
+        point = self.call(CLICK_POINT_JS)
+        if point is None:
+            return
+
+        for event_type in ('mousePressed', 'mouseReleased'):
+            self.driver.connection.send('Input.dispatchMouseEvent', {
+                'type': event_type,
+                'x': point['x'],
+                'y': point['y'],
+                'button': 'left',
+                'clickCount': 1
+            })
+
+    def clear(self) -> None:
+        self.call(CLEAR_JS)
+
+    def send_keys(self, *values) -> None:
+        self.call('function() { this.focus(); }')
+        self.driver.connection.send('Input.insertText', {'text': ''.join(str(i) for i in values)})
+
+
+class CdpShadowRoot(CdpSearchContext):
+    def __init__(self, driver: 'CdpDriver', object_id: str):
+        self.driver = driver
+        self.object_id = object_id
+
+
+class CdpSwitchTo:
+    def __init__(self, driver: 'CdpDriver'):
+        self.driver = driver
+
+    def window(self, window_name: str) -> None:
+        self.driver.attach(window_name)
+
+
+class CdpDriver(CdpSearchContext):
+    object_id = None  # document-level lookups run against window
+
+    def __init__(self, debugger_address: str, page_load_timeout: int | float = 30):
+        self.debugger_address = debugger_address
+        self.page_load_timeout = page_load_timeout
+        self.driver = self
+        self.connection = None
+        self.current_window_handle = None
+        self.switch_to = CdpSwitchTo(self)
+
+        pages = self.__get_pages()
+        if not pages:
+            raise NoSuchWindowException('no page targets')
+        self.attach(pages[0]['id'])
+
+    @property
+    def window_handles(self) -> list[str]:
+        return [i['id'] for i in self.__get_pages()]
+
+    @property
+    def current_url(self) -> str:
+        return self.execute_script('return location.href;')
+
+    def attach(self, target_id: str) -> None:
+        target = next((i for i in self.__get_pages() if i['id'] == target_id), None)
+        if not target:
+            raise NoSuchWindowException(target_id)
+
+        if self.connection:
+            self.connection.close()
+
+        self.connection = CdpConnection(target['webSocketDebuggerUrl'], self.page_load_timeout)
+        self.current_window_handle = target_id
+        self.__http_get(f'/json/activate/{target_id}')
+
+    def get(self, url: str) -> None:
+        result = self.connection.send('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            raise WebDriverException(f'{url}: {result["errorText"]}')
+
+        # Page.navigate returns before the new document commits, the old one may still report 'complete'
+        loader_id = result.get('loaderId')  # absent for same-document navigations
+        deadline = time.monotonic() + self.page_load_timeout
+        while not self.__is_loaded(loader_id):
+            if time.monotonic() > deadline:
+                raise TimeoutException(f'{url} не загрузился')
+            time.sleep(0.05)
+
+    def execute_script(self, script: str, *args):
+        target = next((i.object_id for i in args if isinstance(i, CdpElement)), None)
+        return self.call_function(f'function() {{ {script} }}', list(args), target)
+
+    def call_function(self,
+                      function_declaration: str,
+                      args: list,
+                      object_id: str | None = None,
+                      by_value: bool = True):
+        if object_id is None and not any(isinstance(i, CdpElement) for i in args):
+            # document-level call in one round trip, plain arguments are inlined as JSON
+            response = self.connection.send('Runtime.evaluate', {
+                'expression': f'({function_declaration}).apply(window, {json.dumps(args)})',
+                'awaitPromise': True
+            })
+        else:
+            response = self.connection.send('Runtime.callFunctionOn', {
+                'functionDeclaration': function_declaration,
+                'objectId': object_id or self.__get_window_object_id(),
+                'arguments': [{'objectId': i.object_id} if isinstance(i, CdpElement) else {'value': i} for i in args],
+                'awaitPromise': True
+            })
+
+        if 'exceptionDetails' in response:
+            details = response['exceptionDetails']
+            raise JavascriptException(details.get('exception', {}).get('description', details.get('text')))
+
+        result = response['result']
+        if not by_value:
+            return result
+
+        return self.unpack_value(result)
+
+    def unpack_value(self, result: dict):
+        if result.get('subtype') == 'node':
+            return CdpElement(self, result['objectId'])
+        if result.get('subtype') == 'array':
+            return [self.unpack_value(i) for i in self.__get_items(result['objectId'])]
+        if result.get('type') == 'object' and result.get('objectId'):  # plain objects are fetched as JSON
+            response = self.connection.send('Runtime.callFunctionOn', {
+                'functionDeclaration': 'function() { return this; }',
+                'objectId': result['objectId'],
+                'returnByValue': True
+            })
+            return response['result'].get('value')
+
+        return result.get('value')
+
+    def unpack_array(self, result: dict) -> list[CdpElement]:
+        return [CdpElement(self, i['objectId']) for i in self.__get_items(result['objectId'])]
+
+    def close(self) -> None:
+        target_id = self.current_window_handle
+        self.connection.close()
+        self.connection = None
+        self.current_window_handle = None
+        self.__http_get(f'/json/close/{target_id}')
+
+    def quit(self) -> None:
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    def __get_window_object_id(self) -> str:  # only needed when a document-level call also passes elements
+        return self.connection.send('Runtime.evaluate', {'expression': 'window'})['result']['objectId']
+
+    def __is_loaded(self, loader_id: str | None) -> bool:
+        try:
+            if loader_id and self.connection.send('Page.getFrameTree')['frameTree']['frame']['loaderId'] != loader_id:
+                return False
+            return self.execute_script('return document.readyState;') == 'complete'
+        except WebDriverException:  # execution context is being replaced by the new document
+            return False
+
+    def __get_items(self, object_id: str) -> list[dict]:
+        properties = self.connection.send('Runtime.getProperties', {'objectId': object_id, 'ownProperties': True})
+        items = [i for i in properties['result'] if i['name'].isdigit()]
+        return [i['value'] for i in sorted(items, key=lambda i: int(i['name']))]
+
+    def __get_pages(self) -> list[dict]:
+        targets = json.loads(self.__http_get('/json/list'))
+        return [i for i in targets if i['type'] == 'page' and not i['url'].startswith('devtools://')]
+
+    def __http_get(self, path: str) -> str:
+        with urllib.request.urlopen(f'http://{self.debugger_address}{path}', timeout=self.page_load_timeout) as response:
+            return response.read().decode('utf-8')
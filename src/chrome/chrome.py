@@ -1,188 +1,501 @@
 import subprocess
 import time
-import socket
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium import webdriver
 from loguru import logger
 
-from src.utils.helpers import set_comments_for_profiles
+from config import general_config
+from src.utils.helpers import (set_comments_for_profiles,
+                               copy_extension,
+                               record_profile_launch,
+                               record_script_result,
+                               get_profile_path,
+                               get_profile_root_path,
+                               get_profile_user_data_dir,
+                               is_profile_sharded,
+                               is_user_data_dir_in_use)
 from src.utils.constants import *
+from src.utils.script_configs import load_script_configs
+from src.utils.metrics import metrics
+from src.manager.preferences import build_preferences, write_preferences
+from .port_pool import debug_port_pool
+from .driver_pool import driver_pool
+from .cdp import CdpDriver
+from .tab_guard import TabGuard
+from .process_registry import process_registry
+from .launch_plan import launch_plans
+from .readiness import wait_for_debug_port
 from .scripts import *
+from .scripts.utils import proxies_data, secrets_data, use_pacing, reset_wait_stats, get_wait_stats
+
+
+# Chrome runs one browser per user-data-dir, a second launch into the shared dir is handed to the first browser
+shared_layout_lock = threading.Lock()
 
 
 class Chrome:
     def __init__(self):
         self.debug_ports = {}
-        self.chosen_debug_ports = []
+        self.launch_times = {}
+        self.launch_latencies = {}
+        self.script_timings = {}
+        self.lock = threading.Lock()
 
         self.scripts = {
             'chrome_initial_setup': {
                 'human_name': 'Первичная настройка Chrome',
                 'method': chrome_initial_setup,
+                'config_schema': CHROME_INITIAL_SETUP_CONFIG_SCHEMA
             },
             'omega_proxy_setup': {
                 'human_name': 'Настройка Omega Proxy',
-                'method': omega_proxy_setup
+                'method': omega_proxy_setup,
+                'config_schema': OMEGA_PROXY_SETUP_CONFIG_SCHEMA,
+                'data_file': proxies_data
             },
             'agent_switcher': {
                 'human_name': 'Настройка Agent Switcher',
-                'method': agent_switcher
+                'method': agent_switcher,
+                'config_schema': AGENT_SWITCHER_CONFIG_SCHEMA
             },
             'rabby_import': {
                 'human_name': 'Импорт Rabby Wallet',
-                'method': rabby_import
+                'method': rabby_import,
+                'config_schema': RABBY_IMPORT_CONFIG_SCHEMA,
+                'data_file': secrets_data
             }
         }
 
     def create_new_profile(self, profile_name: str) -> None:
+        self.create_new_profiles([profile_name])
+
+    def create_new_profiles(self,
+                            profile_names: list[str],
+                            default_extensions: list[str] | None = None,
+                            seed_preferences: bool = False) -> list[str]:
+        with ThreadPoolExecutor(max_workers=max(1, general_config['max_workers'])) as executor:
+            results = executor.map(
+                lambda name: self.__create_profile_dirs(name, default_extensions or [], seed_preferences),
+                profile_names
+            )
+            created_profiles = [name for name, created in zip(profile_names, results) if created]
+
+        if created_profiles:
+            set_comments_for_profiles(created_profiles, "")  # reset comments in a single write
+            logger.info(f'ℹ️ Создано профилей: {len(created_profiles)} из {len(profile_names)}')
+
+        return created_profiles
+
+    @staticmethod
+    def __create_profile_dirs(profile_name: str, default_extensions: list[str], seed_preferences: bool) -> bool:
         try:
-            profile_path = self.__get_profile_path(profile_name)
+            profile_root_path = get_profile_root_path(profile_name)
+            if general_config['profiles_layout'] == 'sharded':
+                profile_path = profile_root_path / SHARDED_PROFILE_DIRECTORY
+            else:
+                profile_path = profile_root_path
             profile_extensions_path = os.path.join(profile_path, "Extensions")
 
-            os.makedirs(profile_path)  # can trigger FileExistsError
+            os.makedirs(profile_root_path)  # can trigger FileExistsError
             os.makedirs(profile_extensions_path, exist_ok=True)
 
-            set_comments_for_profiles(profile_name, "")  # reset comment
+            for ext_id in default_extensions:
+                src_path = os.path.join(DEFAULT_EXTENSIONS_PATH, ext_id)
+                dest_path = os.path.join(profile_extensions_path, ext_id)
+                copy_extension(src_path, dest_path, profile_name, ext_id)
+
+            if seed_preferences:
+                write_preferences(profile_path, build_preferences(profile_name))
 
             logger.info(f'✅  {profile_name} - профиль создан')
+            return True
         except FileExistsError:
             logger.warning(f'⚠️ {profile_name} - профиль уже существует')
         except Exception as e:
             logger.error(f'⛔  {profile_name} - не удалось создать профиль')
             logger.debug(f'{profile_name} - не удалось создать профиль, причина: {e}')
 
-    def init_profile_preferences(self, profile_name: str) -> bool:
-        initialized = False
-
-        try:
-            launch_args = self.__create_launch_flags(profile_name, False, False, False)
-
-            with open(os.devnull, 'w') as devnull:  # to avoid Chrome log spam
-                chrome_process = subprocess.Popen([CHROME_PATH, *launch_args], stdout=devnull, stderr=devnull)
-
-            logger.info(f'✅  {profile_name} - профиль запущен')
-        except Exception as e:
-            logger.error(f'⛔  {profile_name} - не удалось запустить профиль для инициализации настроек')
-            logger.debug(f'{profile_name} - не удалось запустить профиль для инициализации настроек, причина: {e}')
-            return initialized
-
-        time.sleep(2)
-
-        try:
-            chrome_process.terminate()
-            chrome_process.wait()
-            logger.debug(f'{profile_name} - профиль закрыт')
-        except Exception as e:
-            logger.error(f'⛔  {profile_name} - не удалось закрыть профиль')
-            logger.debug(f'{profile_name} - не удалось закрыть профиль, причина: {e}')
-
-        return initialized
+        return False
 
     def launch_profile(self,
                        profile_name: str,
                        debug=False,
                        headless: bool = False,
                        maximized: bool = False) -> subprocess.Popen | None:
+        if debug and not is_profile_sharded(profile_name) and is_user_data_dir_in_use(CHROME_DATA_PATH):
+            # the launch would be handed to the running browser and the debug port never bound
+            logger.error(f'⛔  {profile_name} - общая папка данных Chrome занята другим браузером, '
+                         f'запуск с портом для подключения невозможен')
+            metrics.inc('launches_total', status='refused', debug=debug)
+            return None
+
         try:
-            launch_args = self.__create_launch_flags(profile_name, debug, headless, maximized)
+            # plan, port and spawn; readiness of debug launches is measured by launch_ready_seconds
+            with metrics.track('launch_seconds', debug=debug):
+                launch_args = self.__create_launch_flags(profile_name, debug, headless, maximized)
+
+                debug_port = self.get_debug_port(profile_name)
+                if debug_port:
+                    debug_port_pool.unbind(debug_port)
 
-            with open(os.devnull, 'w') as devnull:  # to avoid Chrome log spam
-                chrome_process = subprocess.Popen([CHROME_PATH, *launch_args], stdout=devnull, stderr=devnull)
+                with self.lock:
+                    self.launch_times[profile_name] = (time.time(), time.monotonic())
 
-            logger.info(f'✅  {profile_name} - профиль запущен')
+                handed_off = not is_profile_sharded(profile_name) and is_user_data_dir_in_use(CHROME_DATA_PATH)
+                with open(os.devnull, 'w') as devnull:  # to avoid Chrome log spam
+                    chrome_process = subprocess.Popen([CHROME_PATH, *launch_args], stdout=devnull, stderr=devnull)
+
+                process_registry.register(profile_name, chrome_process, {
+                    "debug": debug,
+                    "headless": headless,
+                    "maximized": maximized
+                }, handed_off)
+
+            if handed_off:
+                logger.info(f'✅  {profile_name} - профиль открыт в уже запущенном браузере (общая папка данных Chrome)')
+            else:
+                logger.info(f'✅  {profile_name} - профиль запущен')
+            record_profile_launch(profile_name)
+            metrics.inc('launches_total', status='success', debug=debug)
 
             return chrome_process
         except Exception as e:
+            self.release_debug_port(profile_name)
+            metrics.inc('launches_total', status='failed', debug=debug)
             logger.error(f'⛔  {profile_name} - не удалось запустить профиль')
             logger.debug(f'{profile_name} - не удалось запустить профиль, причина: {e}')
 
-    def run_scripts(self, profile_name: str, scripts_list: list[str], headless: bool = False) -> None:
+    def run_scripts(self,
+                    profile_name: str,
+                    scripts_list: list[str],
+                    headless: bool = False,
+                    script_configs: dict | None = None) -> str:
+        if not os.path.isdir(get_profile_path(profile_name)):
+            logger.warning(f'⚠️ {profile_name} - профиль не найден, пропущен')
+            return 'skipped'
+
+        if script_configs is None:
+            script_configs = self.preflight_script_configs(scripts_list)
+            if script_configs is None:
+                return 'skipped'
+
+        if is_profile_sharded(profile_name):
+            return self.__run_scripts(profile_name, scripts_list, headless, script_configs)
+
+        with shared_layout_lock:
+            return self.__run_scripts(profile_name, scripts_list, headless, script_configs)
+
+    def __run_scripts(self,
+                      profile_name: str,
+                      scripts_list: list[str],
+                      headless: bool,
+                      script_configs: dict) -> str:
+        status = 'success'
+        chrome_process = None
+        driver = None
+        tab_guard = None
+        started_at = time.perf_counter()
+
         try:
             chrome_process = self.launch_profile(profile_name, True, headless, True)
             if not chrome_process:
                 raise Exception('не удалось запустить браузер')
 
-            time.sleep(1)
+            debug_port = self.get_debug_port(profile_name)
+            if not debug_port:
+                status = 'skipped'
+                raise Exception('отсутствует порт для подключения')
 
-            logger.debug(f'{profile_name} - подключаюсь к порту {self.debug_ports[profile_name]}')
+            if not self.wait_until_ready(profile_name, chrome_process):
+                raise Exception('профиль не ответил на порту для подключения')
+
+            logger.debug(f'{profile_name} - подключаюсь к порту {debug_port}')
             driver = self.__establish_debug_port_connection(profile_name)
             logger.debug(f'{profile_name} - соединение установлено')
 
+            tab_guard = self.__start_tab_guard(profile_name, driver)
+
             logger.debug(f'{profile_name} - скрипты для прогона: {scripts_list}')
             for script in scripts_list:
                 try:
                     human_name = self.scripts[script]['human_name']
                     logger.info(f'ℹ️ {profile_name} - запускаю скрипт "{human_name}"')
                     script_data_path = os.path.join(DATA_PATH, 'scripts', "chrome", script)
-                    self.scripts[script]['method'](
-                        profile_name,
-                        script_data_path,
-                        driver
-                    )
+                    config = script_configs[script]
+                    with use_pacing(config.get("pacing") if config else None):
+                        reset_wait_stats()
+                        script_started_at = time.perf_counter()
+                        try:
+                            with metrics.track('script_seconds', component='chrome', script=script):
+                                self.scripts[script]['method'](
+                                    profile_name,
+                                    script_data_path,
+                                    driver,
+                                    config
+                                )
+                        finally:
+                            self.record_script_timing(profile_name, script, time.perf_counter() - script_started_at)
                     logger.info(f'✅  {profile_name} - скрипт "{human_name}" выполнен')
+                    record_script_result(profile_name, script, True)
                 except Exception as e:
+                    status = 'failed'
+                    record_script_result(profile_name, script, False)
                     human_name = self.scripts[script]['human_name']
                     logger.error(f'⛔  {profile_name} - скрипт "{human_name}" завершен с ошибкой')
                     logger.debug(f'{profile_name} - скрипт "{human_name}" завершен с ошибкой, причина: {e}')
 
+            time.sleep(1)
+
         except Exception as e:
+            if status != 'skipped':
+                status = 'failed'
             logger.error(f'⛔  {profile_name} - не удалось запустить профиль, выполнение скриптов прервано')
             logger.debug(f'{profile_name} - не удалось запустить профиль, причина: {e}')
-            return
-
-        time.sleep(1)
 
         try:
-            driver.quit()
-            chrome_process.terminate()
-            chrome_process.wait()
-            logger.debug(f'{profile_name} - профиль закрыт')
+            with metrics.track('teardown_seconds'):
+                if tab_guard:
+                    tab_guard.stop()
+                    metrics.inc('tabs_closed_total', tab_guard.closed_tabs)
+                    logger.debug(f'{profile_name} - закрыто лишних вкладок: {tab_guard.closed_tabs}')
+                if isinstance(driver, CdpDriver):
+                    driver.quit()
+                elif driver:
+                    driver_pool.close_session(driver)
+                if chrome_process:
+                    chrome_process.terminate()
+                    try:
+                        chrome_process.wait(general_config['shutdown_timeout_sec'])
+                    except subprocess.TimeoutExpired:  # a hung browser must not hold the worker thread
+                        logger.debug(f'{profile_name} - профиль не закрылся за '
+                                     f'{general_config["shutdown_timeout_sec"]} сек, завершаю принудительно')
+                        chrome_process.kill()
+                        chrome_process.wait()
+                    process_registry.unregister(profile_name)
+                    logger.debug(f'{profile_name} - профиль закрыт')
         except Exception as e:
             logger.error(f'⛔  {profile_name} - не удалось закрыть профиль')
             logger.debug(f'{profile_name} - не удалось закрыть профиль, причина: {e}')
+        finally:
+            self.release_debug_port(profile_name)
+
+        metrics.observe('profile_run_seconds', time.perf_counter() - started_at, status=status)
+        return status
+
+    def run_scripts_on_profiles(self,
+                                profile_names: list[str],
+                                scripts_list: list[str],
+                                headless: bool = False) -> dict[str, list[str]]:
+        summary = {
+            'success': [],
+            'failed': [],
+            'skipped': []
+        }
+
+        script_configs = self.preflight_script_configs(scripts_list)
+        if script_configs is None:
+            summary['skipped'].extend(profile_names)
+            return summary
 
-    def __establish_debug_port_connection(self, profile_name) -> webdriver.Chrome:
-        debug_port = self.debug_ports[profile_name]
+        skipped_scripts = self.preflight_script_data(profile_names, scripts_list)
+        scripts_by_profile = {
+            name: [script for script in scripts_list if script not in skipped_scripts.get(name, ())]
+            for name in profile_names
+        }
+        skipped_profiles = [name for name in profile_names if not scripts_by_profile[name]]
+        summary['skipped'].extend(skipped_profiles)
+        profile_names = [name for name in profile_names if scripts_by_profile[name]]
+
+        shared_profiles = [name for name in profile_names if not is_profile_sharded(name)]
+        max_workers = max(1, general_config['max_workers'])
+        threads_count = max_workers if len(shared_profiles) < len(profile_names) else 1
+        logger.info(f'ℹ️ Прогон скриптов на {len(profile_names)} профилях, потоков: {threads_count}')
+        if len(shared_profiles) > 1 and max_workers > 1:
+            logger.warning(f'⚠️ Профили в общей папке данных Chrome ({len(shared_profiles)}) запускаются по одному: '
+                           f'Chrome держит один процесс на папку данных. Для многопоточного прогона перенеси их '
+                           f'manager скриптом "Перенос профилей в отдельные папки данных"')
+
+        with (metrics.run('chrome_scripts'),
+              ThreadPoolExecutor(max_workers=max_workers) as executor,
+              ThreadPoolExecutor(max_workers=1) as shared_executor):
+            metrics.inc('profiles_skipped_total', len(skipped_profiles), reason='no_data')
+            metrics.inc('scripts_skipped_total', sum(map(len, skipped_scripts.values())), reason='no_data')
+            futures = {
+                (shared_executor if name in shared_profiles else executor).submit(
+                    self.run_scripts, name, scripts_by_profile[name], headless, script_configs
+                ): name
+                for name in profile_names
+            }
 
-        chrome_options = Options()
-        chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{debug_port}")
-        service = Service(CHROME_DRIVER_PATH)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+            for future in as_completed(futures):
+                profile_name = futures[future]
+                try:
+                    status = future.result()
+                except Exception as e:
+                    status = 'failed'
+                    logger.debug(f'{profile_name} - непредвиденная ошибка при прогоне скриптов, причина: {e}')
+
+                summary[status].append(profile_name)
+
+        logger.info(f'ℹ️ Итог прогона: успешно - {len(summary["success"])}, '
+                    f'с ошибками - {len(summary["failed"])}, '
+                    f'пропущено - {len(summary["skipped"])}')
+        if summary['failed']:
+            logger.warning(f'⚠️ Профили с ошибками: {summary["failed"]}')
+        if summary['skipped']:
+            logger.warning(f'⚠️ Пропущенные профили: {summary["skipped"]}')
+
+        self.log_launch_latencies(profile_names)
+        self.log_script_timings(scripts_list)
+
+        return summary
+
+    def preflight_script_configs(self, scripts_list: list[str]) -> dict | None:
+        script_configs, errors = load_script_configs(DATA_PATH / 'scripts' / "chrome", self.scripts, scripts_list)
+        if errors:
+            for error in errors:
+                logger.error(f'⛔  Некорректный конфиг скрипта: {error}')
+            logger.error('⛔  Прогон скриптов отменен, исправь конфиги и запусти снова')
+            return None
+
+        return script_configs
+
+    def preflight_script_data(self, profile_names: list[str], scripts_list: list[str]) -> dict[str, set[str]]:
+        skipped_scripts = {}
+        for script in scripts_list:
+            data_file = self.scripts[script].get('data_file')
+            if not data_file:
+                continue
+
+            human_name = self.scripts[script]['human_name']
+            script_data_path = os.path.join(DATA_PATH, 'scripts', "chrome", script)
+            report = data_file.preflight(script_data_path, profile_names)
+
+            for error in report['errors']:
+                logger.warning(f'⚠️ Скрипт "{human_name}" - {error}')
+            if report['duplicates']:
+                logger.warning(f'⚠️ Скрипт "{human_name}" - профили указаны в {data_file.file_name} несколько раз, '
+                               f'используется первая строка: {report["duplicates"]}')
+            if report['missing']:
+                logger.warning(f'⚠️ Скрипт "{human_name}" - нет данных в {data_file.file_name}, '
+                               f'скрипт будет пропущен на профилях: {report["missing"]}')
+                for name in report['missing']:
+                    skipped_scripts.setdefault(name, set()).add(script)
+
+        return skipped_scripts
+
+    def record_script_timing(self, profile_name: str, script: str, duration: float) -> None:
+        waited, waits_count = get_wait_stats()
+        logger.debug(f'{profile_name} - скрипт "{self.scripts[script]["human_name"]}": {duration:.2f} сек, '
+                     f'из них ожидание {waited:.2f} сек ({waits_count} ожиданий), действия {duration - waited:.2f} сек')
+
+        with self.lock:
+            self.script_timings.setdefault(script, []).append((duration, waited))
+        metrics.observe('script_wait_seconds', waited, component='chrome', script=script)
+
+    def log_script_timings(self, scripts_list: list[str]) -> None:
+        with self.lock:
+            timings = {script: self.script_timings.pop(script, []) for script in scripts_list}
+
+        for script, values in timings.items():
+            if not values:
+                continue
+
+            total = sum(duration for duration, _ in values)
+            waited = sum(waited for _, waited in values)
+            logger.info(f'ℹ️ Скрипт "{self.scripts[script]["human_name"]}": в среднем {total / len(values):.2f} сек на профиль, '
+                        f'ожидание {waited / len(values):.2f} сек ({waited / total * 100 if total else 0:.0f}%), '
+                        f'действия {(total - waited) / len(values):.2f} сек')
+
+    def log_launch_latencies(self, profile_names: list[str]) -> None:
+        with self.lock:
+            latencies = [self.launch_latencies.pop(name) for name in profile_names if name in self.launch_latencies]
+
+        first_launches = sorted(latency for latency, repeated_launch in latencies if not repeated_launch)
+        repeated_launches = sorted(latency for latency, repeated_launch in latencies if repeated_launch)
+
+        for human_name, values in (('первый запуск', first_launches), ('повторный запуск', repeated_launches)):
+            if values:
+                logger.info(f'ℹ️ Готовность профилей ({human_name}): '
+                            f'мин {values[0]:.2f} сек, '
+                            f'медиана {values[len(values) // 2]:.2f} сек, '
+                            f'макс {values[-1]:.2f} сек')
+
+    def get_debug_port(self, profile_name: str) -> int | None:
+        with self.lock:
+            return self.debug_ports.get(profile_name)
+
+    def wait_until_ready(self, profile_name: str, chrome_process: subprocess.Popen) -> bool:
+        debug_port = self.get_debug_port(profile_name)
+        if not debug_port:
+            return False
+
+        with self.lock:
+            launched_at, launched_at_monotonic = self.launch_times[profile_name]
+
+        ready = wait_for_debug_port(
+            debug_port,
+            general_config['launch_ready_timeout_sec'],
+            get_profile_user_data_dir(profile_name),
+            launched_at,
+            chrome_process
+        )
+
+        latency = time.monotonic() - launched_at_monotonic
+        registry_entry = process_registry.get_entry(profile_name) or {}
+        repeated_launch = registry_entry.get("repeated_launch", False)
+        metrics.observe('launch_ready_seconds', latency,
+                        status='success' if ready else 'failed',
+                        launch='repeated' if repeated_launch else 'first')
+        if ready:
+            with self.lock:
+                self.launch_latencies[profile_name] = (latency, repeated_launch)
+            logger.debug(f'{profile_name} - профиль готов к подключению через {latency:.2f} сек')
+
+        return ready
+
+    def release_debug_port(self, profile_name: str) -> None:
+        with self.lock:
+            debug_port = self.debug_ports.pop(profile_name, None)
+
+        if debug_port:
+            debug_port_pool.release(debug_port)
+
+    def __establish_debug_port_connection(self, profile_name) -> webdriver.Remote | CdpDriver:
+        debug_port = self.get_debug_port(profile_name)
+
+        started_at = time.monotonic()
+        with metrics.track('driver_attach_seconds', backend=general_config['driver_backend']):
+            if general_config['driver_backend'] == 'cdp':
+                driver = CdpDriver(f"127.0.0.1:{debug_port}")
+            else:
+                driver = driver_pool.create_session(f"127.0.0.1:{debug_port}")
+        logger.debug(f'{profile_name} - драйвер подключен за {time.monotonic() - started_at:.2f} сек')
 
         return driver
 
+    def __start_tab_guard(self, profile_name: str, driver: webdriver.Remote | CdpDriver) -> TabGuard | None:
+        try:
+            tab_guard = TabGuard(f"127.0.0.1:{self.get_debug_port(profile_name)}", [driver.current_window_handle]).start()
+            driver.tab_guard = tab_guard
+            return tab_guard
+        except Exception as e:
+            logger.debug(f'{profile_name} - не удалось включить защиту от лишних вкладок, '
+                         f'вкладки будут закрываться перед действиями, причина: {e}')
+            return None
+
     def __create_launch_flags(self,
                               profile_name: str,
                               debug: bool = False,
                               headless: bool = False,
                               maximized: bool = False) -> list[str]:
-        profile_path = self.__get_profile_path(profile_name)
-        profile_extensions_path = os.path.join(profile_path, "Extensions")
-        profile_html_path = self.__get_profile_welcome_page(profile_name)
-
-        all_extensions = []
-        for ext_id in os.listdir(profile_extensions_path):
-            versions_dir = os.path.join(profile_extensions_path, ext_id)
-            if os.path.isdir(versions_dir):
-                for version in os.listdir(versions_dir):
-                    version_path = os.path.join(versions_dir, version)
-                    if os.path.isfile(os.path.join(version_path, "manifest.json")):
-                        all_extensions.append(version_path)
-
-        load_arg = ",".join(all_extensions)
+        launch_plan = launch_plans.get_plan(profile_name)
 
         flags = [
-            f"--user-data-dir={CHROME_DATA_PATH}",
-            f"--profile-directory={f'Profile {profile_name}'}",
-            "--no-first-run",
-            f"--load-extension={load_arg}",
-            f"file:///{profile_html_path}",
-            "--no-sync",
-            "--disable-features=IdentityConsistency",
-            "--disable-accounts-receiver",
+            *launch_plan["flags"],
             "--headless" if headless else None,
             "--start-maximized" if maximized else None
         ]
@@ -190,44 +503,12 @@ class Chrome:
         flags = [i for i in flags if i is not None]
 
         if debug:
-            free_port = self.__find_free_port()
+            free_port = debug_port_pool.lease(profile_name)
             if free_port:
-                self.debug_ports[profile_name] = free_port
+                with self.lock:
+                    self.debug_ports[profile_name] = free_port
                 flags.append(f'--remote-debugging-port={free_port}')
             else:
                 logger.warning(f'⚠️ {profile_name} - отсутствуют свободные порты для подключения')
 
         return flags
-
-    @staticmethod
-    def __get_profile_path(profile_name: str) -> str:
-        return os.path.join(CHROME_DATA_PATH, f'Profile {profile_name}')
-
-    @staticmethod
-    def __get_profile_welcome_page(profile_name: str):
-        os.makedirs(PROFILE_WELCOME_PAGES_OUTPUT_PATH, exist_ok=True)
-        profile_welcome_page_path = os.path.join(PROFILE_WELCOME_PAGES_OUTPUT_PATH, f"{profile_name}.html")
-
-        # USE CACHE
-        # if os.path.exists(profile_welcome_page_path):
-        #     return profile_welcome_page_path
-
-        with open(PROFILE_WELCOME_PAGE_TEMPLATE_PATH, 'r') as template_file:
-            template_content = template_file.read()
-
-        profile_page_content = template_content.replace("{{ profile_name }}", profile_name)
-
-        with open(profile_welcome_page_path, 'w') as profile_page_file:
-            profile_page_file.write(profile_page_content)
-
-        return profile_welcome_page_path
-
-    def __find_free_port(self, start_port=9222, max_port=9300) -> int | None:
-        for port in range(start_port, max_port):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                result = s.connect_ex(('127.0.0.1', port))
-                if result != 0 and port not in self.chosen_debug_ports:
-                    self.chosen_debug_ports.append(port)
-                    return port
-
-        return None
@@ -0,0 +1,112 @@
+import atexit
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from loguru import logger
+
+from config import general_config
+from src.utils.constants import *
+
+
+class PooledService:
+    def __init__(self):
+        self.service = Service(CHROME_DRIVER_PATH)
+        self.service.start()
+        self.active_sessions = 0
+        self.total_sessions = 0
+
+    def is_healthy(self) -> bool:
+        return self.service.process.poll() is None and self.service.is_connectable()
+
+    def stop(self) -> None:
+        try:
+            self.service.stop()
+        except Exception as e:
+            logger.debug(f'не удалось остановить chromedriver, причина: {e}')
+
+
+class ChromeDriverPool:
+    def __init__(self, size: int, max_sessions_per_service: int):
+        self.size = max(1, size)
+        self.max_sessions_per_service = max(1, max_sessions_per_service)
+        self.lock = threading.Lock()
+        self.services = []
+        self.sessions = {}
+
+    def create_session(self, debugger_address: str) -> webdriver.Remote:
+        pooled_service = self.__acquire()
+
+        try:
+            chrome_options = Options()
+            chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+            driver = webdriver.Remote(command_executor=pooled_service.service.service_url, options=chrome_options)
+        except Exception:
+            self.__release(pooled_service)
+            raise
+
+        with self.lock:
+            self.sessions[id(driver)] = pooled_service
+
+        return driver
+
+    def close_session(self, driver: webdriver.Remote) -> None:
+        try:
+            driver.quit()  # detaches from the browser, chromedriver keeps running
+        finally:
+            with self.lock:
+                pooled_service = self.sessions.pop(id(driver), None)
+
+            if pooled_service:
+                self.__release(pooled_service)
+
+    def shutdown(self) -> None:
+        with self.lock:
+            services, self.services = self.services, []
+            self.sessions.clear()
+
+        for pooled_service in services:
+            pooled_service.stop()
+
+    def __acquire(self) -> PooledService:
+        with self.lock:
+            for pooled_service in [i for i in self.services if not i.is_healthy()]:
+                logger.debug('chromedriver не отвечает, перезапускаю')
+                self.services.remove(pooled_service)
+                pooled_service.stop()
+
+            available = [i for i in self.services if i.total_sessions < self.max_sessions_per_service]
+            idle = [i for i in available if i.active_sessions == 0]
+
+            if idle or len(available) >= self.size:
+                pooled_service = min(idle or available, key=lambda i: i.active_sessions)
+            else:
+                pooled_service = PooledService()
+                self.services.append(pooled_service)
+
+            pooled_service.active_sessions += 1
+            pooled_service.total_sessions += 1
+
+            return pooled_service
+
+    def __release(self, pooled_service: PooledService) -> None:
+        with self.lock:
+            pooled_service.active_sessions -= 1
+
+            retired = (pooled_service.active_sessions == 0
+                       and pooled_service.total_sessions >= self.max_sessions_per_service
+                       and pooled_service in self.services)
+            if retired:
+                self.services.remove(pooled_service)
+
+        if retired:
+            logger.debug(f'chromedriver обслужил {pooled_service.total_sessions} сессий, перезапускаю')
+            pooled_service.stop()
+
+
+driver_pool = ChromeDriverPool(
+    general_config['chromedriver_pool_size'],
+    general_config['chromedriver_max_sessions']
+)
+atexit.register(driver_pool.shutdown)
@@ -0,0 +1,151 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from config import general_config
+from src.utils.constants import *
+from src.utils.helpers import get_profile_user_data_dir, get_profile_directory_name
+from src.utils.profile_catalog import profile_catalog, get_extension_paths
+from src.utils.files import write_json_atomic
+
+
+class LaunchPlanCache:
+    def __init__(self, plans_path: str | Path):
+        self.plans_path = Path(plans_path)
+        self.lock = threading.Lock()
+        self.plans = None
+        self.dirty = False
+        self.template = None
+
+    def get_plan(self, profile_name: str) -> dict:
+        return self.get_plans([profile_name])[str(profile_name)]
+
+    def get_plans(self, profile_names: list[str]) -> dict[str, dict]:
+        profile_names = [str(profile_name) for profile_name in profile_names]
+        template_hash, template_content = self.__get_template()
+
+        with profile_catalog.lock:  # entries are live catalog dicts, read them before another refresh
+            entries = profile_catalog.get_profiles(profile_names)
+            extensions = {
+                profile_name: (get_extensions_signature(entries.get(profile_name)),
+                               get_extension_paths(entries.get(profile_name)))
+                for profile_name in profile_names
+            }
+
+        with self.lock:
+            self.__load()
+            plans = {profile_name: self.plans.get(profile_name) for profile_name in profile_names}
+
+        stale_profile_names = [
+            profile_name for profile_name, plan in plans.items()
+            if not (plan
+                    and plan["template_hash"] == template_hash
+                    and plan["extensions_signature"] == extensions[profile_name][0]
+                    and os.path.isfile(plan["welcome_page"]))
+        ]
+        if stale_profile_names:
+            with ThreadPoolExecutor(max_workers=general_config['max_workers']) as executor:
+                plans.update(zip(stale_profile_names, executor.map(
+                    lambda profile_name: build_plan(profile_name, template_hash, template_content, *extensions[profile_name]),
+                    stale_profile_names
+                )))
+
+            with self.lock:
+                self.plans.update((profile_name, plans[profile_name]) for profile_name in stale_profile_names)
+                self.dirty = True
+
+            self.save()
+
+        return plans
+
+    def prebuild(self, profile_names: list[str]) -> None:
+        self.get_plans(profile_names)
+        profile_catalog.save()
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.dirty:
+                return
+
+            try:
+                write_json_atomic(self.plans_path, self.plans)
+                self.dirty = False
+            except OSError as e:
+                logger.debug(f'не удалось сохранить планы запуска профилей, причина: {e}')
+
+    def __get_template(self) -> tuple[str, str]:
+        mtime = os.stat(PROFILE_WELCOME_PAGE_TEMPLATE_PATH).st_mtime_ns
+        with self.lock:
+            if not self.template or self.template[0] != mtime:
+                with open(PROFILE_WELCOME_PAGE_TEMPLATE_PATH, 'r') as template_file:
+                    template_content = template_file.read()
+
+                template_hash = hashlib.sha256(template_content.encode('utf-8')).hexdigest()
+                self.template = (mtime, template_hash, template_content)
+
+            return self.template[1], self.template[2]
+
+    def __load(self) -> None:
+        if self.plans is not None:
+            return
+
+        try:
+            with open(self.plans_path, 'r', encoding="utf-8") as f:
+                self.plans = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.plans = {}
+
+
+def build_plan(profile_name: str, template_hash: str, template_content: str,
+               extensions_signature: str, extension_paths: list[str]) -> dict:
+    welcome_page_path = render_welcome_page(profile_name, template_content)
+
+    flags = [
+        f"--user-data-dir={get_profile_user_data_dir(profile_name)}",
+        f"--profile-directory={get_profile_directory_name(profile_name)}",
+        "--no-first-run",
+        f"--load-extension={','.join(extension_paths)}",
+        f"file:///{welcome_page_path}",
+        "--no-sync",
+        "--disable-features=IdentityConsistency",
+        "--disable-accounts-receiver"
+    ]
+
+    return {
+        "template_hash": template_hash,
+        "extensions_signature": extensions_signature,
+        "extension_paths": extension_paths,
+        "welcome_page": welcome_page_path,
+        "flags": flags
+    }
+
+
+def render_welcome_page(profile_name: str, template_content: str) -> str:
+    os.makedirs(PROFILE_WELCOME_PAGES_OUTPUT_PATH, exist_ok=True)
+    profile_welcome_page_path = os.path.join(PROFILE_WELCOME_PAGES_OUTPUT_PATH, f"{profile_name}.html")
+
+    profile_page_content = template_content.replace("{{ profile_name }}", profile_name)
+
+    with open(profile_welcome_page_path, 'w') as profile_page_file:
+        profile_page_file.write(profile_page_content)
+
+    return profile_welcome_page_path
+
+
+def get_extensions_signature(entry: dict | None) -> str:
+    entry = entry or {}
+    signature = [
+        entry.get("path"),
+        entry.get("extensions_mtime"),
+        sorted((ext_id, ext_info["mtime"]) for ext_id, ext_info in entry.get("extensions", {}).items())
+    ]
+
+    return hashlib.sha256(json.dumps(signature).encode('utf-8')).hexdigest()
+
+
+launch_plans = LaunchPlanCache(DATA_PATH / "launch_plans.json")
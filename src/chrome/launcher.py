@@ -0,0 +1,131 @@
+import time
+import random
+import subprocess
+
+import psutil
+from loguru import logger
+from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, MofNCompleteColumn
+
+from config import general_config
+from src.utils.metrics import metrics
+
+
+class ResourceMonitor:
+    def __init__(self):
+        self.cpu_count = psutil.cpu_count() or 1
+        self.last_disk_sample = None
+
+    def sample(self) -> dict:
+        disk_counters = psutil.disk_io_counters()
+        now = time.monotonic()
+
+        disk_mb_per_sec = 0.0
+        if disk_counters and self.last_disk_sample:
+            previous_bytes, previous_at = self.last_disk_sample
+            elapsed = max(now - previous_at, 1e-3)
+            disk_mb_per_sec = (disk_counters.read_bytes + disk_counters.write_bytes - previous_bytes) / elapsed / 1024 ** 2
+        if disk_counters:
+            self.last_disk_sample = (disk_counters.read_bytes + disk_counters.write_bytes, now)
+
+        return {
+            "free_ram_mb": psutil.virtual_memory().available / 1024 ** 2,
+            "load_per_cpu": psutil.getloadavg()[0] / self.cpu_count,
+            "disk_mb_per_sec": disk_mb_per_sec
+        }
+
+    def get_blocking_reason(self, sample: dict) -> str | None:
+        if sample["free_ram_mb"] < general_config['launch_min_free_ram_mb']:
+            return f'мало свободной памяти ({sample["free_ram_mb"]:.0f} МБ)'
+        if sample["load_per_cpu"] > general_config['launch_max_load_per_cpu']:
+            return f'высокая нагрузка на CPU ({sample["load_per_cpu"]:.2f} на ядро)'
+        if sample["disk_mb_per_sec"] > general_config['launch_max_disk_mb_per_sec']:
+            return f'высокая нагрузка на диск ({sample["disk_mb_per_sec"]:.0f} МБ/сек)'
+
+        return None
+
+
+class ResourceAwareLauncher:
+    def __init__(self, chrome, monitor: ResourceMonitor | None = None):
+        self.chrome = chrome
+        self.monitor = monitor or ResourceMonitor()
+        self.starting = {}
+        self.processes = {}  # psutil measures cpu between calls on the same Process object
+
+    def launch(self, profile_names: list[str], **launch_kwargs) -> dict[str, subprocess.Popen]:
+        launched = {}
+        pending = list(profile_names)
+        started_at = time.monotonic()
+        self.monitor.sample()  # first disk sample is the baseline
+
+        with metrics.run('launch'), Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[throughput]}"),
+            TimeElapsedColumn()
+        ) as progress:
+            task = progress.add_task("🚀 запуск профилей", total=len(pending), throughput="")
+
+            while pending:
+                reason = self.__get_admission_blocker()
+                if reason:
+                    progress.update(task, description=f"⏳ ожидание: {reason}")
+                    time.sleep(general_config['launch_poll_interval_sec'])
+                    metrics.inc('launch_throttled_seconds_total', general_config['launch_poll_interval_sec'])
+                    continue
+
+                time.sleep(random.uniform(*general_config['launch_jitter_sec']))  # stagger disk-heavy startups
+                profile_name = pending.pop(0)
+                chrome_process = self.chrome.launch_profile(profile_name, **launch_kwargs)
+                if chrome_process:
+                    launched[profile_name] = chrome_process
+                    self.starting[profile_name] = (chrome_process, time.monotonic())
+                    self.__get_process_tree_cpu(chrome_process.pid)  # baseline for the next measurement
+
+                elapsed_min = (time.monotonic() - started_at) / 60
+                progress.update(
+                    task,
+                    advance=1,
+                    description="🚀 запуск профилей",
+                    throughput=f"{len(launched) / max(elapsed_min, 1e-6):.1f} профилей/мин"
+                )
+
+        elapsed = time.monotonic() - started_at
+        logger.info(f'ℹ️ Запущено профилей: {len(launched)} из {len(profile_names)} за {elapsed:.1f} сек')
+
+        return launched
+
+    def __get_admission_blocker(self) -> str | None:
+        self.__refresh_starting()
+        if len(self.starting) >= general_config['launch_max_parallel']:
+            return f'стартуют {len(self.starting)} профилей'
+
+        return self.monitor.get_blocking_reason(self.monitor.sample())
+
+    def __refresh_starting(self) -> None:
+        now = time.monotonic()
+        for profile_name, (chrome_process, launched_at) in list(self.starting.items()):
+            elapsed = now - launched_at
+            if chrome_process.poll() is not None or elapsed >= general_config['launch_settle_sec']:
+                del self.starting[profile_name]
+            elif elapsed >= 1 and self.__get_process_tree_cpu(chrome_process.pid) < general_config['launch_settled_cpu_percent']:
+                del self.starting[profile_name]  # browser finished its startup burst
+
+    def __get_process_tree_cpu(self, pid: int) -> float:
+        try:
+            if pid not in self.processes:
+                self.processes[pid] = psutil.Process(pid)
+            tree_pids = [pid, *(child.pid for child in self.processes[pid].children(recursive=True))]
+        except psutil.Error:
+            return 0.0
+
+        cpu_percent = 0.0
+        for tree_pid in tree_pids:
+            try:
+                if tree_pid not in self.processes:
+                    self.processes[tree_pid] = psutil.Process(tree_pid)
+                cpu_percent += self.processes[tree_pid].cpu_percent(interval=None)
+            except psutil.Error:
+                self.processes.pop(tree_pid, None)
+
+        return cpu_percent
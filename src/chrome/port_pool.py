@@ -0,0 +1,59 @@
+import socket
+import threading
+from collections import deque
+
+from config import general_config
+
+
+class DebugPortPool:
+    def __init__(self, start_port: int, end_port: int):
+        self.lock = threading.Lock()
+        self.free_ports = deque(range(start_port, end_port + 1))
+        self.leases = {}
+        self.reservations = {}
+
+    def lease(self, owner: str) -> int | None:
+        with self.lock:
+            for _ in range(len(self.free_ports)):
+                port = self.free_ports.popleft()
+                reservation = self.__reserve(port)
+                if reservation:
+                    self.leases[port] = owner
+                    self.reservations[port] = reservation
+                    return port
+
+                self.free_ports.append(port)  # taken by another process, retry it later
+
+        return None
+
+    def unbind(self, port: int) -> None:
+        # Must be called right before Chrome starts, so it can bind the port itself
+        with self.lock:
+            reservation = self.reservations.pop(port, None)
+
+        if reservation:
+            reservation.close()
+
+    def release(self, port: int) -> None:
+        self.unbind(port)
+
+        with self.lock:
+            if self.leases.pop(port, None) is not None:
+                self.free_ports.append(port)
+
+    def leased_count(self) -> int:
+        with self.lock:
+            return len(self.leases)
+
+    @staticmethod
+    def __reserve(port: int) -> socket.socket | None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind(('127.0.0.1', port))
+            return sock
+        except OSError:
+            sock.close()
+            return None
+
+
+debug_port_pool = DebugPortPool(*general_config['debug_ports_range'])
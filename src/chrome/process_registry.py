@@ -0,0 +1,209 @@
+import json
+import time
+import threading
+import subprocess
+from pathlib import Path
+
+import psutil
+from loguru import logger
+
+from src.utils.constants import *
+from src.utils.files import write_json_atomic
+from src.utils.helpers import is_user_data_dir_in_use, terminate_process_gracefully
+
+
+class ProcessRegistry:
+    def __init__(self, registry_path: str | Path):
+        self.registry_path = Path(registry_path)
+        self.lock = threading.RLock()
+        self.entries = None
+        self.launches = None  # launch counters outlive the running entries, so repeated launches across runs are known
+        self.popens = {}
+
+    def register(self,
+                 profile_name: str,
+                 chrome_process: subprocess.Popen,
+                 launch_options: dict,
+                 handed_off: bool = False) -> None:
+        with self.lock:
+            self.__load()
+            self.reap()
+
+            create_time = None
+            if not handed_off:  # the launcher passes the profile to the running browser and exits at once
+                try:
+                    create_time = psutil.Process(chrome_process.pid).create_time()
+                except psutil.Error:
+                    pass
+
+            launch_info = self.launches.setdefault(profile_name, {"count": 0, "last_launched_at": None})
+            launch_info["count"] += 1
+            launch_info["last_launched_at"] = time.time()
+
+            self.entries[profile_name] = {
+                "pid": None if handed_off else chrome_process.pid,
+                "create_time": create_time,
+                "launched_at": launch_info["last_launched_at"],
+                "launch_options": launch_options,
+                "repeated_launch": launch_info["count"] > 1,
+                "handed_off": handed_off
+            }
+            self.popens[profile_name] = chrome_process  # kept until reaped, even when handed off
+            self.__save()
+
+    def unregister(self, profile_name: str) -> None:
+        with self.lock:
+            self.__load()
+            self.popens.pop(profile_name, None)
+            if self.entries.pop(profile_name, None):
+                self.__save()
+
+    def get_entry(self, profile_name: str) -> dict | None:
+        with self.lock:
+            self.__load()
+            return self.entries.get(profile_name)
+
+    def get_running(self) -> dict[str, psutil.Process]:
+        with self.lock:
+            self.__load()
+            self.reap()
+
+            running = {}
+            for profile_name, entry in list(self.entries.items()):
+                if entry.get("handed_off"):
+                    continue
+
+                process = get_live_process(entry)
+                if process:
+                    running[profile_name] = process
+                else:
+                    del self.entries[profile_name]  # closed by the user or crashed
+
+            self.__save()
+            return running
+
+    def get_handed_off(self) -> list[str]:
+        with self.lock:
+            self.__load()
+            handed_off = [profile_name for profile_name, entry in self.entries.items() if entry.get("handed_off")]
+            if handed_off and not is_user_data_dir_in_use(CHROME_DATA_PATH):  # the shared browser is gone
+                for profile_name in handed_off:
+                    del self.entries[profile_name]
+                self.__save()
+                return []
+
+            return handed_off
+
+    def sample(self, profile_names: list[str] | None = None, interval: float = 0.3) -> dict[str, dict]:
+        running = self.get_running()
+        trees = {}
+        for profile_name, process in running.items():
+            if profile_names is not None and profile_name not in profile_names:
+                continue
+
+            try:
+                trees[profile_name] = [process, *process.children(recursive=True)]
+            except psutil.Error:
+                continue
+
+        launched_at = {profile_name: (self.get_entry(profile_name) or {}).get("launched_at", time.time()) for profile_name in trees}
+        for tree in trees.values():
+            for process in tree:
+                try:
+                    process.cpu_percent(interval=None)  # first call only sets the baseline
+                except psutil.Error:
+                    pass
+
+        time.sleep(interval)  # one shared interval for every profile
+
+        samples = {}
+        for profile_name, tree in trees.items():
+            rss, cpu_percent, alive = 0, 0.0, 0
+            for process in tree:
+                try:
+                    with process.oneshot():
+                        rss += process.memory_info().rss
+                        cpu_percent += process.cpu_percent(interval=None)
+                    alive += 1
+                except psutil.Error:
+                    continue
+
+            samples[profile_name] = {
+                "pid": tree[0].pid,
+                "processes": alive,
+                "rss_mb": rss / 1024 ** 2,
+                "cpu_percent": cpu_percent,
+                "uptime_sec": time.time() - launched_at[profile_name]
+            }
+
+        return samples
+
+    def close(self, profile_name: str, timeout: int | float = 10) -> bool:
+        process = self.get_running().get(profile_name)
+        if not process:
+            if not (self.get_entry(profile_name) or {}).get("handed_off"):  # lives in the shared browser, not ours to close
+                self.unregister(profile_name)
+            return False
+
+        # the browser shuts its renderers and helpers down itself, killing them first looks like a crash
+        try:
+            terminate_process_gracefully(process)  # taskkill on windows, psutil terminate is a hard kill there
+            process.wait(timeout)
+        except psutil.TimeoutExpired:
+            process.kill()
+            process.wait(timeout)
+        except psutil.NoSuchProcess:
+            pass
+
+        with self.lock:
+            chrome_process = self.popens.get(profile_name)
+            if chrome_process:
+                chrome_process.poll()  # collect the exit status, otherwise it stays a zombie
+        self.unregister(profile_name)
+
+        return True
+
+    def reap(self) -> int:
+        reaped = 0
+        with self.lock:
+            for profile_name, chrome_process in list(self.popens.items()):
+                if chrome_process.poll() is not None:
+                    del self.popens[profile_name]
+                    reaped += 1
+
+        return reaped
+
+    def __load(self) -> None:
+        if self.entries is not None:
+            return
+
+        try:
+            with open(self.registry_path, 'r', encoding="utf-8") as f:
+                registry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            registry = {}
+
+        self.entries = registry.get("running", {})
+        self.launches = registry.get("launches", {})
+
+    def __save(self) -> None:
+        try:
+            write_json_atomic(self.registry_path, {"running": self.entries, "launches": self.launches})
+        except OSError as e:
+            logger.debug(f'не удалось сохранить реестр процессов, причина: {e}')
+
+
+def get_live_process(entry: dict) -> psutil.Process | None:
+    try:
+        process = psutil.Process(entry["pid"])
+        if process.status() == psutil.STATUS_ZOMBIE:
+            return None
+        if entry["create_time"] and abs(process.create_time() - entry["create_time"]) > 1:
+            return None  # pid was reused by another process
+    except psutil.Error:
+        return None
+
+    return process
+
+
+process_registry = ProcessRegistry(DATA_PATH / "process_registry.json")
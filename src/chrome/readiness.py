@@ -0,0 +1,67 @@
+import os
+import json
+import time
+import subprocess
+import urllib.request
+from pathlib import Path
+from typing import Callable
+
+
+def wait_until(condition: Callable[[], bool],
+               timeout: int | float,
+               initial_delay: float = 0.05,
+               max_delay: float = 0.5,
+               process: subprocess.Popen | None = None) -> bool:
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+
+    while True:
+        if condition():
+            return True
+
+        if process and process.poll() is not None:  # browser exited, nothing to wait for
+            return False
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def is_debug_port_ready(debug_port: int,
+                        user_data_dir: str | Path | None = None,
+                        launched_at: float | None = None) -> bool:
+    if user_data_dir and launched_at and read_devtools_active_port(user_data_dir, launched_at) == debug_port:
+        return True
+
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{debug_port}/json/version', timeout=1) as response:
+            return 'webSocketDebuggerUrl' in json.load(response)
+    except (OSError, ValueError):
+        return False
+
+
+def read_devtools_active_port(user_data_dir: str | Path, launched_at: float) -> int | None:
+    file_path = os.path.join(user_data_dir, 'DevToolsActivePort')
+    try:
+        if os.path.getmtime(file_path) < launched_at:  # left from a previous launch
+            return None
+
+        with open(file_path, 'r') as f:
+            return int(f.readline().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def wait_for_debug_port(debug_port: int,
+                        timeout: int | float,
+                        user_data_dir: str | Path | None = None,
+                        launched_at: float | None = None,
+                        process: subprocess.Popen | None = None) -> bool:
+    return wait_until(
+        lambda: is_debug_port_ready(debug_port, user_data_dir, launched_at),
+        timeout,
+        process=process
+    )
@@ -1,4 +1,4 @@
-from .agent_switcher import agent_switcher
-from .chrome_initial_setup import chrome_initial_setup
-from .omega_proxy_setup import omega_proxy_setup
-from .rabby_import import rabby_import
+from .agent_switcher import agent_switcher, AGENT_SWITCHER_CONFIG_SCHEMA
+from .chrome_initial_setup import chrome_initial_setup, CHROME_INITIAL_SETUP_CONFIG_SCHEMA
+from .omega_proxy_setup import omega_proxy_setup, OMEGA_PROXY_SETUP_CONFIG_SCHEMA
+from .rabby_import import rabby_import, RABBY_IMPORT_CONFIG_SCHEMA
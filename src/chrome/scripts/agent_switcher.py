@@ -1,7 +1,5 @@
-import os
-import time
-import json
 from pathlib import Path
+from typing import Mapping
 
 from selenium import webdriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -10,62 +8,60 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
 
-from .utils import js_click, close_all_other_tabs
+from src.utils.script_configs import RUN_DELAY_SCHEMA
+from .utils import js_click, close_all_other_tabs, open_page, pause, wait_for_selected, wait_for_stable
 
 
-def agent_switcher(profile_name: str | int, script_data_path: str | Path, driver: webdriver.Chrome):
-    with open(os.path.join(script_data_path, 'config.json'), 'r', encoding="utf-8") as f:
-        config = json.load(f)
+AGENT_SWITCHER_CONFIG_SCHEMA = {
+    **RUN_DELAY_SCHEMA,
+    "extension_id": str,
+    "general_settings": [{"human_name": str, "must_be_enabled": bool}],
+    "generator_settings": [{"human_name": str, "id": str, "must_be_enabled": bool}]
+}
 
+
+def agent_switcher(profile_name: str | int, script_data_path: str | Path, driver: webdriver.Chrome, config: Mapping):
     working_tab = driver.current_window_handle
     wait = WebDriverWait(driver, 3)
 
     if config["run_delay_sec"]:
         logger.debug(f"{profile_name} - waiting {config['run_delay_sec']} sec")
-        time.sleep(config["run_delay_sec"])
+        pause(config["run_delay_sec"])
 
     close_all_other_tabs(driver, working_tab)
 
     # General settings
-    driver.get(f'chrome-extension://{config["extension_id"]}/options/index.html#/general')
-    time.sleep(0.5)
+    open_page(driver, f'chrome-extension://{config["extension_id"]}/options/index.html#/general')
 
     base_row_xpath = '(//aside//div[contains(@class, "row")])'
 
-    for i in range(2):
-        for index, setting in enumerate(config['general_settings']):
-            checkbox_xpath = f'{base_row_xpath}[{index + 1}]//input[@type="checkbox"]'  # Xpath matches starts with index 1
-            checkbox = wait.until(EC.element_to_be_clickable((By.XPATH, checkbox_xpath)))
-
-            toggle_checkbox(driver, checkbox, setting["must_be_enabled"], working_tab)
-            logger.debug(f'{profile_name} - general setting "{setting["human_name"]}" adjusted to {setting["must_be_enabled"]}')
+    # Every toggle is confirmed before moving on, so a single pass is enough
+    for index, setting in enumerate(config['general_settings']):
+        checkbox_xpath = f'{base_row_xpath}[{index + 1}]//input[@type="checkbox"]'  # Xpath matches starts with index 1
+        checkbox = wait.until(EC.element_to_be_clickable((By.XPATH, checkbox_xpath)))
 
-        time.sleep(0.5)
+        toggle_checkbox(driver, checkbox, setting["must_be_enabled"], working_tab)
+        logger.debug(f'{profile_name} - general setting "{setting["human_name"]}" adjusted to {setting["must_be_enabled"]}')
 
     # Generator settings
-    driver.get(f'chrome-extension://{config["extension_id"]}/options/index.html#/generator')
-    time.sleep(0.5)
-
-    for i in range(2):
-        for setting in config['generator_settings']:
-            checkbox_xpath = f'//input[@id="{setting["id"]}"]'
-            checkbox = wait.until(EC.element_to_be_clickable((By.XPATH, checkbox_xpath)))
+    open_page(driver, f'chrome-extension://{config["extension_id"]}/options/index.html#/generator')
 
-            toggle_checkbox(driver, checkbox, setting["must_be_enabled"], working_tab)
-            logger.debug(f'{profile_name} - generator setting "{setting["human_name"]}" adjusted to {setting["must_be_enabled"]}')
+    for setting in config['generator_settings']:
+        checkbox_xpath = f'//input[@id="{setting["id"]}"]'
+        checkbox = wait.until(EC.element_to_be_clickable((By.XPATH, checkbox_xpath)))
 
-        time.sleep(0.5)
+        toggle_checkbox(driver, checkbox, setting["must_be_enabled"], working_tab)
+        logger.debug(f'{profile_name} - generator setting "{setting["human_name"]}" adjusted to {setting["must_be_enabled"]}')
 
     # Generate UA
-    driver.get(f'chrome-extension://{config["extension_id"]}/popup/index.html')
-    time.sleep(0.5)
+    open_page(driver, f'chrome-extension://{config["extension_id"]}/popup/index.html')
 
     for i in range(2):
         generate_ua_btn = wait.until(
             EC.element_to_be_clickable((By.XPATH, '//span[contains(text(), "Get new agent")]/..')))
         close_all_other_tabs(driver, working_tab)
+        wait_for_stable(driver, generate_ua_btn)
         js_click(driver, generate_ua_btn)
-        time.sleep(0.5)
 
 
 def toggle_checkbox(
@@ -78,4 +74,4 @@ def toggle_checkbox(
             close_all_other_tabs(driver, working_tab)
 
         js_click(driver, checkbox)
-        time.sleep(0.1)
+        wait_for_selected(checkbox, must_be_enabled)
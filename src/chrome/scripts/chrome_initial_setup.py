@@ -1,46 +1,45 @@
-import time
-import os
-import json
+from typing import Mapping
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from loguru import logger
 
-from .utils import js_click, close_all_other_tabs
+from src.utils.script_configs import RUN_DELAY_SCHEMA
+from .utils import (close_all_other_tabs,
+                    open_page,
+                    pause,
+                    wait_for_attribute,
+                    wait_for_shadow_path,
+                    apply_shadow_controls)
 
 
-def chrome_initial_setup(profile_name: str | int, script_data_path: str, driver: webdriver.Chrome) -> None:
-    with open(os.path.join(script_data_path, 'config.json'), 'r', encoding="utf-8") as f:
-        config = json.load(f)
+CHROME_INITIAL_SETUP_CONFIG_SCHEMA = {
+    **RUN_DELAY_SCHEMA,
+    "startup_settings": {
+        "remember_tabs": {"human_name": str, "value": bool}
+    }
+}
 
+
+def chrome_initial_setup(profile_name: str | int, script_data_path: str, driver: webdriver.Chrome, config: Mapping) -> None:
     working_tab = driver.current_window_handle
 
     if config["run_delay_sec"]:
         logger.debug(f"{profile_name} - waiting {config['run_delay_sec']} sec")
-        time.sleep(config["run_delay_sec"])
+        pause(config["run_delay_sec"])
 
     close_all_other_tabs(driver, working_tab)
 
     turn_off_sync(profile_name, driver, working_tab)
     turn_off_autofill(profile_name, driver, working_tab)
     adjust_privacy_choices(profile_name, driver, working_tab)
-    adjust_tabs_memorizing(profile_name, driver, working_tab, config["startup_settings"]["remember_tabs"])
+    adjust_tabs_memorizing(profile_name, driver, working_tab, config["startup_settings"]["remember_tabs"]["value"])
 
     # TODO: fix this shit
     # if profile_name:
     #     set_profile_name(profile_name, driver, working_tab)
 
 
-def dive_into_shadowroots(driver: webdriver.Chrome, host_tags):
-    final_sr = driver
-    for host in host_tags:
-        element = final_sr.find_element(By.CSS_SELECTOR, host)
-        shadow_root = element.shadow_root
-        final_sr = shadow_root
-
-    return final_sr
-
-
 def turn_off_sync(name: str | int, driver: webdriver.Chrome, working_tab: str) -> None:
     try:
         host_tags = [
@@ -60,18 +59,13 @@ def turn_off_sync(name: str | int, driver: webdriver.Chrome, working_tab: str) -
             "settings-toggle-button#searchSuggestToggle"
         ]
 
-        driver.get("chrome://settings/syncSetup")
-        time.sleep(0.5)
-
-        mother_sr = dive_into_shadowroots(driver, host_tags)
-        for child_host in child_host_tags:
-            element = mother_sr.find_element(By.CSS_SELECTOR, child_host)
-            final_sr = element.shadow_root
+        open_page(driver, "chrome://settings/syncSetup")
+        close_all_other_tabs(driver, working_tab)
 
-            toggle = final_sr.find_element(By.CSS_SELECTOR, 'cr-toggle')
-            if toggle.get_attribute('aria-pressed') == 'true':
-                close_all_other_tabs(driver, working_tab)
-                js_click(driver, toggle)
+        apply_shadow_controls(driver, host_tags, [
+            {"path": [child_host, "cr-toggle"], "attribute": "aria-pressed", "expected": "false"}
+            for child_host in child_host_tags
+        ])
 
         logger.info(f"✅  {name} - синхронизация выключена")
     except Exception as e:
@@ -90,10 +84,9 @@ def set_profile_name(name: str | int, driver: webdriver.Chrome, working_tab: str
             # "cr-input"
         ]
 
-        driver.get("chrome://settings/manageProfile")
-        time.sleep(0.5)
+        open_page(driver, "chrome://settings/manageProfile")
 
-        final_sr = dive_into_shadowroots(driver, host_tags)
+        final_sr = wait_for_shadow_path(driver, host_tags)
         click_to_save_element = final_sr.find_element(By.CSS_SELECTOR, 'h1')
         # driver.execute_script("arguments[0].style.border='3px solid red'", click_to_save_element)
 
@@ -107,7 +100,7 @@ def set_profile_name(name: str | int, driver: webdriver.Chrome, working_tab: str
 
         close_all_other_tabs(driver, working_tab)
         click_to_save_element.click()
-        time.sleep(0.4)
+        wait_for_attribute(name_input, 'value', str(name))
 
         logger.info(f'✅  {name} - имя профиля установлено')
     except Exception as e:
@@ -122,25 +115,14 @@ def turn_off_autofill(name: str | int, driver: webdriver.Chrome, working_tab: st
             "settings-section"
         ]
 
-        driver.get('chrome://password-manager/settings')
-        time.sleep(0.5)
-
-        final_sr = dive_into_shadowroots(driver, host_tags)
-
-        pass_toggle_host = final_sr.find_element(By.ID, 'passwordToggle')
-        sr = pass_toggle_host.shadow_root
-        pass_toggle = sr.find_element(By.CSS_SELECTOR, 'cr-toggle')
-        if pass_toggle.get_attribute('aria-pressed') == 'true':
-            close_all_other_tabs(driver, working_tab)
-            js_click(driver, pass_toggle)
-        
-        auto_sign_in_toggle_host = final_sr.find_element(By.ID, 'autosigninToggle')
-        sr = auto_sign_in_toggle_host.shadow_root
-        auto_sign_in_toggle = sr.find_element(By.CSS_SELECTOR, 'cr-toggle')
-        if auto_sign_in_toggle.get_attribute('aria-pressed') == 'true':
-            close_all_other_tabs(driver, working_tab)
-            js_click(driver, auto_sign_in_toggle)
-        
+        open_page(driver, 'chrome://password-manager/settings')
+        close_all_other_tabs(driver, working_tab)
+
+        apply_shadow_controls(driver, host_tags, [
+            {"path": ["#passwordToggle", "cr-toggle"], "attribute": "aria-pressed", "expected": "false"},
+            {"path": ["#autosigninToggle", "cr-toggle"], "attribute": "aria-pressed", "expected": "false"}
+        ])
+
         logger.info(f"✅  {name} - автозаполнение паролей отключено")
     except Exception as e:
         logger.error(f"⛔  {name} - не удалось отключить автозаполнение паролей")
@@ -158,68 +140,27 @@ def adjust_privacy_choices(name: str | int, driver: webdriver.Chrome, working_ta
             "settings-privacy-guide-page"
         ]
 
-        driver.get('chrome://settings/privacy/guide?step=welcome')
-        time.sleep(0.5)
-
-        unique_sr = dive_into_shadowroots(driver, host_tags)
-
-        welcome_fragment_element = unique_sr.find_element(By.CSS_SELECTOR, 'privacy-guide-welcome-fragment')
-        welcome_fragment_sr = welcome_fragment_element.shadow_root
-        start_button = welcome_fragment_sr.find_element(By.ID, 'startButton')
-        close_all_other_tabs(driver, working_tab)
-        js_click(driver, start_button)
-
-        host_tags = [
-            'privacy-guide-msbb-fragment',
-            'settings-toggle-button'
-        ]
-
-        searches_and_browser_better_sr = dive_into_shadowroots(unique_sr, host_tags)
-        searches_and_browser_better_toggle = searches_and_browser_better_sr.find_element(By.ID, 'control')
-        if searches_and_browser_better_toggle.get_attribute('aria-pressed') == 'true':
-            close_all_other_tabs(driver, working_tab)
-            js_click(driver, searches_and_browser_better_toggle)
-
-        next_button = unique_sr.find_element(By.ID, 'nextButton')
-        next_button.click()
-
-        host_tags = [
-            'privacy-guide-safe-browsing-fragment',
-            'settings-collapse-radio-button#safeBrowsingRadioStandard'
-        ]
-
-        safe_browsing_sr = dive_into_shadowroots(unique_sr, host_tags)
-        standard_mode_radio_btn = safe_browsing_sr.find_element(By.ID, 'button')
-        if standard_mode_radio_btn.get_attribute('aria-checked') == 'false': 
-            safe_browsing_btn = safe_browsing_sr.find_element(By.ID, 'radioCollapse')
-            close_all_other_tabs(driver, working_tab)
-            js_click(driver, safe_browsing_btn)
+        safe_browsing_host = ["privacy-guide-safe-browsing-fragment", "settings-collapse-radio-button#safeBrowsingRadioStandard"]
+        block_cookies_host = ["privacy-guide-cookies-fragment", "settings-collapse-radio-button#block3PIncognito"]
+        next_button = {"path": ["#nextButton"], "click": True}
 
-        next_button = unique_sr.find_element(By.ID, 'nextButton')
+        open_page(driver, 'chrome://settings/privacy/guide?step=welcome')
         close_all_other_tabs(driver, working_tab)
-        js_click(driver, next_button)
 
-        host_tags = [
-            'privacy-guide-cookies-fragment',
-            'settings-collapse-radio-button#block3PIncognito'
+        # Every step renders only after the previous one is left, so it's one batch per step
+        steps = [
+            [{"path": ["privacy-guide-welcome-fragment", "#startButton"], "click": True}],
+            [{"path": ["privacy-guide-msbb-fragment", "settings-toggle-button", "#control"], "attribute": "aria-pressed", "expected": "false"}],
+            [next_button],
+            [{"path": [*safe_browsing_host, "#button"], "attribute": "aria-checked", "expected": "true", "click_path": [*safe_browsing_host, "#radioCollapse"]}],
+            [next_button],
+            [{"path": [*block_cookies_host, "#button"], "attribute": "aria-checked", "expected": "true", "click_path": [*block_cookies_host, "#radioCollapse"]}],
+            [next_button],
+            [{"path": ["privacy-guide-completion-fragment", "#leaveButton"], "click": True}]
         ]
 
-        block_cookies_in_incognito_sr = dive_into_shadowroots(unique_sr, host_tags)
-        block_cookies_in_incognito_radio_btn = block_cookies_in_incognito_sr.find_element(By.ID, 'button')
-        if block_cookies_in_incognito_radio_btn.get_attribute('aria-checked') == 'false': 
-            block_cookies_in_incognito_btn = block_cookies_in_incognito_sr.find_element(By.ID, 'radioCollapse')
-            close_all_other_tabs(driver, working_tab)
-            js_click(driver, block_cookies_in_incognito_btn)
-
-        next_button = unique_sr.find_element(By.ID, 'nextButton')
-        close_all_other_tabs(driver, working_tab)
-        js_click(driver, next_button)
-
-        finish_fragment_element = unique_sr.find_element(By.CSS_SELECTOR, 'privacy-guide-completion-fragment')
-        finish_fragment_sr = finish_fragment_element.shadow_root
-        done_button = finish_fragment_sr.find_element(By.ID, 'leaveButton')
-        close_all_other_tabs(driver, working_tab)
-        js_click(driver, done_button)
+        for controls in steps:
+            apply_shadow_controls(driver, host_tags, controls)
 
         logger.info(f"✅  {name} - настройки приватности обновлены")
     except Exception as e:
@@ -236,18 +177,13 @@ def adjust_tabs_memorizing(name: str | int, driver: webdriver.Chrome, working_ta
             "settings-on-startup-page"
         ]
 
-        driver.get('chrome://settings/onStartup')
-        time.sleep(0.5)
-
-        final_sr = dive_into_shadowroots(driver, host_tags)
-
-        if remember:
-            chosen_option = final_sr.find_element(By.CSS_SELECTOR, f"controlled-radio-button[name='1']")
-        else:
-            chosen_option = final_sr.find_element(By.CSS_SELECTOR, f"controlled-radio-button[name='5']")
-
+        open_page(driver, 'chrome://settings/onStartup')
         close_all_other_tabs(driver, working_tab)
-        js_click(driver, chosen_option)
+
+        option_name = '1' if remember else '5'
+        apply_shadow_controls(driver, host_tags, [
+            {"path": [f"controlled-radio-button[name='{option_name}']"], "click": True}
+        ])
 
         logger.info(f"✅  {name} - настройки запоминания вкладок обновлены")
     except Exception as e:
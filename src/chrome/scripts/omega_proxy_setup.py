@@ -1,7 +1,5 @@
-import os
-import time
-import json
 from pathlib import Path
+from typing import Mapping
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,25 +8,28 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from loguru import logger
 
-from .utils import parse_proxy, js_click, close_all_other_tabs, get_txt_line_by_profile_name
+from src.utils.script_configs import RUN_DELAY_SCHEMA
+from .utils import parse_proxy, js_click, close_all_other_tabs, proxies_data, pause
 
 
-def omega_proxy_setup(profile_name: str | int, script_data_path: str | Path, driver: webdriver.Chrome) -> None:
-    with open(os.path.join(script_data_path, 'config.json'), 'r') as f:
-        config = json.load(f)
+OMEGA_PROXY_SETUP_CONFIG_SCHEMA = {
+    **RUN_DELAY_SCHEMA,
+    "extension_id": str
+}
 
-    proxies_file_path = os.path.join(script_data_path, 'proxies.txt')
-    profile_data = get_txt_line_by_profile_name(profile_name, proxies_file_path)
+
+def omega_proxy_setup(profile_name: str | int, script_data_path: str | Path, driver: webdriver.Chrome, config: Mapping) -> None:
+    profile_data = proxies_data.get(script_data_path, profile_name)
     if not profile_data:
         raise Exception('прокси не найден')
-    proxy = profile_data.split('|')[1]
+    proxy = profile_data[0]
 
     working_tab = driver.current_window_handle
     wait = WebDriverWait(driver, 3)
 
     if config["run_delay_sec"]:
         logger.debug(f"{profile_name} - waiting {config['run_delay_sec']} sec")
-        time.sleep(config["run_delay_sec"])
+        pause(config["run_delay_sec"])
 
     close_all_other_tabs(driver, working_tab)
 
@@ -61,7 +62,6 @@ def omega_proxy_setup(profile_name: str | int, script_data_path: str | Path, dri
     auth_button = wait.until(EC.element_to_be_clickable((By.XPATH, '(//button[@title="Authentication"])[1]')))
     close_all_other_tabs(driver, working_tab)
     js_click(driver, auth_button)
-    time.sleep(0.1)
 
     username_input = wait.until(EC.element_to_be_clickable((By.XPATH, '//div[@tabindex="-1"]//div[@class="modal-content"]//input[@placeholder="Username"]')))
     close_all_other_tabs(driver, working_tab)
@@ -77,7 +77,6 @@ def omega_proxy_setup(profile_name: str | int, script_data_path: str | Path, dri
     close_all_other_tabs(driver, working_tab)
     js_click(driver, save_auth_btn)
 
-    time.sleep(0.1)
     apply_changes_btn = wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@ng-click="applyOptions()"]')))
     close_all_other_tabs(driver, working_tab)
     js_click(driver, apply_changes_btn)
@@ -93,7 +92,6 @@ def omega_proxy_setup(profile_name: str | int, script_data_path: str | Path, dri
     close_all_other_tabs(driver, working_tab)
     set_proxy_btn.click()
 
-    time.sleep(0.1)
     apply_changes_btn = wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@ng-click="applyOptions()"]')))
     close_all_other_tabs(driver, working_tab)
     js_click(driver, apply_changes_btn)
@@ -105,22 +103,7 @@ def omega_proxy_setup(profile_name: str | int, script_data_path: str | Path, dri
     if 'ng-not-empty' in input_element.get_attribute('class'):
         close_all_other_tabs(driver, working_tab)
         js_click(driver, input_element)
-        time.sleep(0.1)
 
         apply_changes_btn = wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@ng-click="applyOptions()"]')))
         close_all_other_tabs(driver, working_tab)
         js_click(driver, apply_changes_btn)
-
-
-def get_proxy_by_profile_name(profile_name: str | int, script_data_path: str) -> str | None:
-    with open(os.path.join(script_data_path, 'proxies.txt'), 'r') as f:
-        proxies_data = [i.strip() for i in f.readlines()]
-
-    selected_proxy = None
-    for line in proxies_data:
-        name, _proxy = line.split('|')
-        if name == str(profile_name):
-            selected_proxy = _proxy
-            break
-
-    return selected_proxy
@@ -1,7 +1,5 @@
-import os
-import time
-import json
 from pathlib import Path
+from typing import Mapping
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,18 +7,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
 
-from .utils import js_click, close_all_other_tabs, get_txt_line_by_profile_name, is_twelve_words_string
+from src.utils.script_configs import RUN_DELAY_SCHEMA
+from .utils import js_click, close_all_other_tabs, is_twelve_words_string, secrets_data, pause, get_pacing
 
 
-def rabby_import(profile_name: str | int, script_data_path: str | Path, driver: webdriver.Chrome):
-    with open(os.path.join(script_data_path, 'config.json'), 'r', encoding="utf-8") as f:
-        config = json.load(f)
+RABBY_IMPORT_CONFIG_SCHEMA = {
+    **RUN_DELAY_SCHEMA,
+    "extension_id": str
+}
 
-    secrets_file_path = os.path.join(script_data_path, 'secrets.txt')
-    profile_data = get_txt_line_by_profile_name(profile_name, secrets_file_path)
+
+def rabby_import(profile_name: str | int, script_data_path: str | Path, driver: webdriver.Chrome, config: Mapping):
+    profile_data = secrets_data.get(script_data_path, profile_name)
     if not profile_data:
         raise Exception('приватный ключ или сид фраза не найдены')
-    _, secret, password = profile_data.split('|')
+    secret, password = profile_data
 
     is_seed_phrase = is_twelve_words_string(secret)
     working_tab = driver.current_window_handle
@@ -28,7 +29,7 @@ def rabby_import(profile_name: str | int, script_data_path: str | Path, driver:
 
     if config["run_delay_sec"]:
         logger.debug(f"{profile_name} - waiting {config['run_delay_sec']} sec")
-        time.sleep(config["run_delay_sec"])
+        pause(config["run_delay_sec"])
 
     close_all_other_tabs(driver, working_tab)
 
@@ -72,4 +73,4 @@ def rabby_import(profile_name: str | int, script_data_path: str | Path, driver:
         import_selected_secrets_btn = wait.until(EC.element_to_be_clickable((By.XPATH, import_selected_secrets_btn_xpath)))
         js_click(driver, import_selected_secrets_btn)
 
-    time.sleep(0.2)
\ No newline at end of file
+    pause(get_pacing()["click_delay_sec"])  # let the wallet persist the imported account
\ No newline at end of file
@@ -1 +1,4 @@
 from .helpers import *
+from .data_sources import *
+from .waits import *
+from .shadow_dom import *
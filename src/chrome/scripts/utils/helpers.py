@@ -1,9 +1,8 @@
-import time
-from pathlib import Path
-
 from selenium.webdriver.remote.webelement import WebElement
 from selenium import webdriver
 
+from .waits import get_pacing, pause
+
 
 def parse_proxy(proxy: str) -> tuple[str, str, str, str, str]:
     proto = proxy.split('://')[0]
@@ -18,15 +17,20 @@ def parse_proxy(proxy: str) -> tuple[str, str, str, str, str]:
 def js_click(
         _driver: webdriver.Chrome,
         element: WebElement,
-        sleep_before: int | float = 0.2,
-        sleep_after: int | float = 0.2
+        sleep_before: int | float | None = None,
+        sleep_after: int | float | None = None
 ) -> None:
-    time.sleep(sleep_before)
+    click_delay = get_pacing()["click_delay_sec"]
+    pause(click_delay if sleep_before is None else sleep_before)
     _driver.execute_script("arguments[0].click();", element)
-    time.sleep(sleep_after)
+    pause(click_delay if sleep_after is None else sleep_after)
 
 
 def close_all_other_tabs(_driver: webdriver.Chrome, current_tab: str) -> None:
+    tab_guard = getattr(_driver, 'tab_guard', None)
+    if tab_guard and tab_guard.is_active:  # stray tabs are closed by the guard as soon as they appear
+        return
+
     for handle in _driver.window_handles:
         if handle != current_tab:
             _driver.switch_to.window(handle)
@@ -35,20 +39,6 @@ def close_all_other_tabs(_driver: webdriver.Chrome, current_tab: str) -> None:
     _driver.switch_to.window(current_tab)
 
 
-def get_txt_line_by_profile_name(profile_name: str | int, file_path: str | Path) -> str | None:
-    with open(file_path, 'r') as f:
-        data = [i.strip() for i in f.readlines()]
-
-    selected_line = None
-    for line in data:
-        name, profile_data = line.split('|', 1)
-        if name == str(profile_name):
-            selected_line = line
-            break
-
-    return selected_line
-
-
 def is_twelve_words_string(text: str) -> bool:
     words = text.split()
     return len(words) == 12
@@ -0,0 +1,68 @@
+from .waits import wait_for
+
+
+# Resolves every control first and acts only when all of them are rendered,
+# so a retry never repeats half of the clicks
+SHADOW_CONTROLS_JS = """
+const [hostPath, controls] = arguments;
+
+function resolve(root, path) {
+    let node = root;
+    for (const selector of path) {
+        const scope = node.shadowRoot || node;
+        node = scope.querySelector(selector);
+        if (!node) return null;
+    }
+    return node;
+}
+
+const host = resolve(document, hostPath);
+if (!host) return null;
+
+const resolved = [];
+for (const control of controls) {
+    const element = resolve(host, control.path);
+    const clickTarget = control.click_path ? resolve(host, control.click_path) : element;
+    if (!element || !clickTarget) return null;
+    resolved.push([element, clickTarget]);
+}
+
+return controls.map((control, index) => {
+    const [element, clickTarget] = resolved[index];
+    const before = control.attribute ? element.getAttribute(control.attribute) : null;
+    const mustClick = control.act && (control.click || (control.expected !== undefined && before !== control.expected));
+    if (mustClick) clickTarget.click();
+
+    return {
+        before: before,
+        after: control.attribute ? element.getAttribute(control.attribute) : null,
+        clicked: Boolean(mustClick)
+    };
+});
+"""
+
+
+def apply_shadow_controls(driver,
+                          host_path: list[str],
+                          controls: list[dict],
+                          timeout: int | float | None = None) -> list[dict]:
+    results = wait_for(
+        lambda: driver.execute_script(SHADOW_CONTROLS_JS, host_path, [{**control, "act": True} for control in controls]),
+        timeout,
+        f'элементы в {" > ".join(host_path)}'
+    )
+
+    # Polymer reflects some attributes asynchronously, re-read only when the first read lagged behind
+    pending = [control for control, result in zip(controls, results)
+               if "expected" in control and result["after"] != control["expected"]]
+    if pending:
+        def is_applied() -> bool:
+            rechecked = driver.execute_script(SHADOW_CONTROLS_JS, host_path, pending)
+            if not rechecked or len(rechecked) != len(pending):
+                return False  # the page re-rendered and the controls are not resolved yet
+
+            return all(result["after"] == control["expected"] for control, result in zip(pending, rechecked))
+
+        wait_for(is_applied, timeout, 'применение настроек')
+
+    return results
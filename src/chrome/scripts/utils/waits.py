@@ -0,0 +1,131 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Mapping
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from config import general_config
+
+
+DEFAULT_PACING = {
+    "click_delay_sec": general_config['script_click_delay_sec'],
+    "wait_timeout_sec": general_config['script_wait_timeout_sec'],
+    "poll_interval_sec": general_config['script_poll_interval_sec']
+}
+
+local = threading.local()  # every profile runs its scripts in its own thread
+
+
+def get_pacing() -> dict:
+    return getattr(local, "pacing", DEFAULT_PACING)
+
+
+@contextmanager
+def use_pacing(overrides: Mapping | None = None):
+    previous_pacing = getattr(local, "pacing", None)
+    local.pacing = {**DEFAULT_PACING, **(overrides or {})}
+    try:
+        yield local.pacing
+    finally:
+        if previous_pacing is None:
+            del local.pacing
+        else:
+            local.pacing = previous_pacing
+
+
+def reset_wait_stats() -> None:
+    local.waited_sec = 0.0
+    local.waits_count = 0
+
+
+def get_wait_stats() -> tuple[float, int]:
+    return getattr(local, "waited_sec", 0.0), getattr(local, "waits_count", 0)
+
+
+@contextmanager
+def timed_wait():
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        local.waited_sec = getattr(local, "waited_sec", 0.0) + time.perf_counter() - started_at
+        local.waits_count = getattr(local, "waits_count", 0) + 1
+
+
+def pause(seconds: int | float) -> None:
+    if seconds <= 0:
+        return
+
+    with timed_wait():
+        time.sleep(seconds)
+
+
+def wait_for(condition: Callable, timeout: int | float | None = None, description: str = 'условие'):
+    pacing = get_pacing()
+    timeout = pacing["wait_timeout_sec"] if timeout is None else timeout
+
+    with timed_wait():
+        deadline = time.monotonic() + timeout
+        last_error = None
+        while True:
+            try:
+                result = condition()
+                if result:
+                    return result
+            except WebDriverException as e:  # element not rendered yet, stale, detached shadow root, etc.
+                last_error = e
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f'не дождался: {description} за {timeout} сек'
+                                       + (f' ({last_error.msg})' if last_error else ''))
+
+            time.sleep(pacing["poll_interval_sec"])
+
+
+def wait_for_dom_ready(driver, timeout: int | float | None = None) -> None:
+    wait_for(
+        lambda: driver.execute_script("return document.readyState") == "complete",
+        timeout,
+        'загрузка страницы'
+    )
+
+
+def open_page(driver, url: str, timeout: int | float | None = None) -> None:
+    driver.get(url)
+    wait_for_dom_ready(driver, timeout)
+
+
+def wait_for_shadow_path(search_context, host_tags: list[str], timeout: int | float | None = None):
+    def resolve():
+        shadow_root = search_context
+        for host in host_tags:
+            shadow_root = shadow_root.find_element(By.CSS_SELECTOR, host).shadow_root
+        return shadow_root
+
+    return wait_for(resolve, timeout, f'shadow root {" > ".join(host_tags)}')
+
+
+def wait_for_stable(driver, element, timeout: int | float | None = None):
+    last_rect = [None]
+
+    def is_stable():
+        rect = driver.execute_script(
+            "const r = arguments[0].getBoundingClientRect(); return [r.x, r.y, r.width, r.height];",
+            element
+        )
+        stable = rect == last_rect[0] and rect[2] > 0 and rect[3] > 0
+        last_rect[0] = rect
+        return stable
+
+    wait_for(is_stable, timeout, 'остановка анимации элемента')
+    return element
+
+
+def wait_for_attribute(element, attribute: str, expected: str, timeout: int | float | None = None) -> None:
+    wait_for(lambda: element.get_attribute(attribute) == expected, timeout, f'{attribute} = {expected}')
+
+
+def wait_for_selected(element, expected: bool = True, timeout: int | float | None = None) -> None:
+    wait_for(lambda: element.is_selected() == expected, timeout, f'переключатель в положении {expected}')
@@ -0,0 +1,79 @@
+import json
+import itertools
+import threading
+import urllib.request
+
+import websocket
+from loguru import logger
+
+
+class TabGuard:
+    def __init__(self, debugger_address: str, keep_target_ids: list[str] | set[str], timeout: int | float = 5):
+        self.debugger_address = debugger_address
+        self.keep_target_ids = set(keep_target_ids)
+        self.timeout = timeout
+        self.ws = None
+        self.thread = None
+        self.stopped = threading.Event()
+        self.send_lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.closed_tabs = 0
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.thread and self.thread.is_alive() and not self.stopped.is_set())
+
+    def start(self) -> 'TabGuard':
+        with urllib.request.urlopen(f'http://{self.debugger_address}/json/version', timeout=self.timeout) as response:
+            browser_ws_url = json.loads(response.read().decode('utf-8'))['webSocketDebuggerUrl']
+
+        self.ws = websocket.create_connection(browser_ws_url, timeout=self.timeout, suppress_origin=True)
+        self.ws.settimeout(None)  # the reader blocks until an event arrives or the socket is closed
+
+        # Chrome replays targetCreated for already open tabs, so leftovers are closed as well
+        self.__send('Target.setDiscoverTargets', {'discover': True})
+
+        self.thread = threading.Thread(target=self.__watch, name=f'tab-guard-{self.debugger_address}', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+
+        if self.thread:
+            self.thread.join(self.timeout)
+
+    def __watch(self) -> None:
+        while not self.stopped.is_set():
+            try:
+                message = json.loads(self.ws.recv())
+            except Exception as e:
+                if not self.stopped.is_set():
+                    logger.debug(f'{self.debugger_address} - защита от лишних вкладок отключена, причина: {e}')
+                    self.stopped.set()
+                return
+
+            if message.get('method') != 'Target.targetCreated':
+                continue
+
+            target_info = message['params']['targetInfo']
+            if target_info['type'] != 'page' or target_info['targetId'] in self.keep_target_ids:
+                continue
+            if target_info.get('url', '').startswith('devtools://'):
+                continue
+
+            try:
+                self.__send('Target.closeTarget', {'targetId': target_info['targetId']})
+                self.closed_tabs += 1
+                logger.debug(f'{self.debugger_address} - закрыта лишняя вкладка {target_info.get("url", "")}')
+            except Exception as e:
+                logger.debug(f'{self.debugger_address} - не удалось закрыть вкладку, причина: {e}')
+
+    def __send(self, method: str, params: dict) -> None:
+        with self.send_lock:  # replies are ignored, the reader only cares about events
+            self.ws.send(json.dumps({'id': next(self.ids), 'method': method, 'params': params}))
@@ -1,9 +1,11 @@
 from .create_multiple_profiles import create_multiple_profiles
 from .launch_multiple_profiles import launch_multiple_profiles
 from .manage_extensions import manage_extensions
+from .manage_running_profiles import manage_running_profiles
 from .run_chrome_scripts_on_multiple_profiles import run_chrome_scripts_on_multiple_profiles
 from .run_manager_scripts_on_multiple_profiles import run_manager_scripts_on_multiple_profiles
 from .show_all_profiles import show_all_profiles
 from .update_comments import update_comments
+from .update_tags import update_tags
 
 from .utils import *
@@ -1,7 +1,7 @@
 import questionary
 from loguru import logger
 
-from src.utils.helpers import get_profiles_list
+from src.utils.helpers import get_profiles_list, get_all_default_extensions_info
 from src.chrome.chrome import Chrome
 from .utils import custom_style
 
@@ -68,6 +68,45 @@ def create_multiple_profiles() -> None:
         start = highest_existing_numeric_name + 1
         profiles_to_create = list(range(start, start + amount))
 
+    if not profiles_to_create:
+        logger.warning('⚠️ Профили для создания не заданы')
+        return
+
+    default_extensions = select_default_extensions()
+
+    seed_preferences_choice = questionary.select(
+        "Создать файл настроек Preferences сразу (без запуска браузера)?",
+        choices=[
+            '✅  да',
+            '❌  нет'
+        ],
+        style=custom_style
+    ).ask()
+
+    seed_preferences = True if seed_preferences_choice and 'да' in seed_preferences_choice else False
+
     chrome = Chrome()
-    for name in profiles_to_create:
-        chrome.create_new_profile(str(name))
+    chrome.create_new_profiles(
+        [str(name) for name in profiles_to_create],
+        default_extensions,
+        seed_preferences
+    )
+
+
+def select_default_extensions() -> list[str]:
+    default_extensions_info = get_all_default_extensions_info()
+    if not default_extensions_info:
+        return []
+
+    choices = [
+        f"{ext_id} ({name})" if name else ext_id
+        for ext_id, name in default_extensions_info.items()
+    ]
+
+    selected_extensions = questionary.checkbox(
+        "Выбери дефолтные расширения для новых профилей (можно не выбирать)",
+        choices=choices,
+        style=custom_style
+    ).ask()
+
+    return [choice.split(" ")[0] for choice in selected_extensions or []]
@@ -1,7 +1,6 @@
-from time import sleep
-import concurrent.futures
-
 from src.chrome.chrome import Chrome
+from src.chrome.launch_plan import launch_plans
+from src.chrome.launcher import ResourceAwareLauncher
 from .utils import select_profiles
 
 
@@ -10,15 +9,13 @@ def launch_multiple_profiles():
     if not selected_profiles:
         return
 
-    chrome = Chrome()
-
-    for name in selected_profiles:
-        chrome.launch_profile(
-            str(name),
-            debug=False,
-            headless=False,
-            maximized=False
-        )
-
-        sleep(0.5)
+    profile_names = [str(name) for name in selected_profiles]
+    launch_plans.prebuild(profile_names)
 
+    launcher = ResourceAwareLauncher(Chrome())
+    launcher.launch(
+        profile_names,
+        debug=False,
+        headless=False,
+        maximized=False
+    )
@@ -10,7 +10,12 @@ from config import general_config
 from src.utils.helpers import (get_all_default_extensions_info,
                                get_profiles_extensions_info,
                                copy_extension,
-                               remove_extensions)
+                               remove_extensions,
+                               empty_trash,
+                               empty_trash_in_background,
+                               get_profile_path,
+                               cleanup_extension_store,
+                               format_size)
 from src.utils.constants import *
 from .utils import select_profiles, custom_style
 
@@ -71,7 +76,7 @@ def add_default_extensions(selected_profiles: list[str], replace=False) -> None:
     with ThreadPoolExecutor(max_workers=general_config['max_workers']) as executor:
         futures = []
         for profile in selected_profiles:
-            profile_extensions_path = CHROME_DATA_PATH / f"Profile {profile}" / "Extensions"
+            profile_extensions_path = get_profile_path(profile) / "Extensions"
             os.makedirs(profile_extensions_path, exist_ok=True)
 
             for ext_id in selected_ids:
@@ -79,6 +84,12 @@ def add_default_extensions(selected_profiles: list[str], replace=False) -> None:
                 dest_path = os.path.join(profile_extensions_path, ext_id)
                 futures.append(executor.submit(copy_extension, src_path, dest_path, profile, ext_id, replace))
 
+    saved_bytes = sum(future.result()["saved_bytes"] for future in futures)
+    if saved_bytes:
+        logger.info(f'ℹ️ Сэкономлено места на диске: {format_size(saved_bytes)}')
+
+    cleanup_extension_store()
+
 
 def remove_extensions_menu(selected_profiles: list[str]) -> None:
     profiles_extension_info = get_profiles_extensions_info(selected_profiles)
@@ -104,8 +115,20 @@ def remove_extensions_menu(selected_profiles: list[str]) -> None:
         logger.warning('⚠️ Расширения не выбраны')
         return
 
-    for profile in selected_profiles:
-        remove_extensions(profile, selected_ids)
+    empty_trash()  # leftovers of an interrupted run
+
+    with ThreadPoolExecutor(max_workers=general_config['max_workers']) as executor:
+        results = list(executor.map(lambda profile: remove_extensions(profile, selected_ids), selected_profiles))
+
+    trashed_paths_by_profile = {result["profile"]: result["trashed_paths"] for result in results if result["trashed_paths"]}
+
+    failed_profiles = [result["profile"] for result in results if result["failed"]]
+    if failed_profiles:
+        logger.warning(f'⚠️ Не все расширения удалены в профилях: {failed_profiles}')
+
+    logger.info(f'ℹ️ Расширения удалены в {len(trashed_paths_by_profile)} профилях, файлы удаляются в фоне')
+    if trashed_paths_by_profile:
+        empty_trash_in_background(trashed_paths_by_profile)
 
 
 
@@ -0,0 +1,120 @@
+import time
+
+import questionary
+from loguru import logger
+from rich.table import Table
+from rich.console import Console
+
+from src.chrome.chrome import Chrome
+from src.chrome.process_registry import process_registry
+from .utils import custom_style
+
+
+def manage_running_profiles():
+    samples = process_registry.sample()
+    handed_off_profiles = sort_profile_names(process_registry.get_handed_off())
+    if not samples and not handed_off_profiles:
+        logger.warning('⚠️ Запущенные профили отсутствуют')
+        return
+
+    profile_names = sort_profile_names(samples)
+
+    if handed_off_profiles:
+        # Chrome hands a launch in the shared data folder to the browser that already runs there,
+        # so these profiles have no process of their own and can be closed only with that browser
+        logger.info(f'ℹ️ Открыты в общем браузере, закрываются только вместе с ним: {handed_off_profiles}')
+
+    if not samples:
+        return
+
+    console = Console()
+    table = Table(style="cyan")
+    table.add_column("Название", style="magenta")
+    table.add_column("PID", style="green")
+    table.add_column("Процессов", style="green")
+    table.add_column("RSS, МБ", style="green")
+    table.add_column("CPU, %", style="green")
+    table.add_column("Работает", style="green")
+
+    for profile_name in profile_names:
+        sample = samples[profile_name]
+        table.add_row(
+            profile_name,
+            str(sample["pid"]),
+            str(sample["processes"]),
+            f'{sample["rss_mb"]:.0f}',
+            f'{sample["cpu_percent"]:.1f}',
+            time.strftime('%H:%M:%S', time.gmtime(sample["uptime_sec"]))
+        )
+
+    table.add_section()
+    table.add_row(
+        "Всего",
+        "",
+        str(sum(sample["processes"] for sample in samples.values())),
+        f'{sum(sample["rss_mb"] for sample in samples.values()):.0f}',
+        f'{sum(sample["cpu_percent"] for sample in samples.values()):.1f}',
+        ""
+    )
+    console.print(table)
+
+    running_activity = questionary.select(
+        "Выбери действие с запущенными профилями",
+        choices=[
+            '❌  закрыть профили',
+            '🔄 перезапустить профили',
+            '🏠 назад в меню'
+        ],
+        style=custom_style
+    ).ask()
+
+    if not running_activity or 'назад в меню' in running_activity:
+        return
+
+    selected_profiles = questionary.checkbox(
+        "Выбери профили",
+        choices=profile_names,
+        style=custom_style
+    ).ask()
+
+    if not selected_profiles:
+        logger.warning('⚠️ Профили не выбраны')
+        return
+
+    if 'закрыть профили' in running_activity:
+        close_running_profiles(selected_profiles)
+    elif 'перезапустить профили' in running_activity:
+        restart_running_profiles(selected_profiles)
+
+
+def sort_profile_names(profile_names) -> list[str]:
+    return sorted(profile_names, key=lambda name: (not name.isdigit(), int(name) if name.isdigit() else name))
+
+
+def close_running_profiles(profile_names: list[str]) -> None:
+    for profile_name in profile_names:
+        try:
+            if process_registry.close(profile_name):
+                logger.info(f'✅  {profile_name} - профиль закрыт')
+            else:
+                logger.warning(f'⚠️ {profile_name} - профиль уже не запущен')
+        except Exception as e:
+            logger.error(f'⛔  {profile_name} - не удалось закрыть профиль')
+            logger.debug(f'{profile_name} - не удалось закрыть профиль, причина: {e}')
+
+
+def restart_running_profiles(profile_names: list[str]) -> None:
+    chrome = Chrome()
+    for profile_name in profile_names:
+        entry = process_registry.get_entry(profile_name)
+        launch_options = {**entry["launch_options"]} if entry else {}
+        launch_options["debug"] = False  # the script session that used the debug port is gone after the restart
+
+        try:
+            process_registry.close(profile_name)
+        except Exception as e:
+            logger.error(f'⛔  {profile_name} - не удалось закрыть профиль')
+            logger.debug(f'{profile_name} - не удалось закрыть профиль, причина: {e}')
+            continue
+
+        chrome.launch_profile(profile_name, **launch_options)
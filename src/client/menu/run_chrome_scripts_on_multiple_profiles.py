@@ -54,9 +54,8 @@ def run_chrome_scripts_on_multiple_profiles():
 
     headless = True if 'да' in headless_choice else False
 
-    for name in selected_profiles:
-        chrome.run_scripts(
-            str(name),
-            chosen_scripts,
-            headless
-        )
+    chrome.run_scripts_on_profiles(
+        [str(name) for name in selected_profiles],
+        chosen_scripts,
+        headless
+    )
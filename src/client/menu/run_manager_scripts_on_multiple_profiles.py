@@ -43,8 +43,7 @@ def run_manager_scripts_on_multiple_profiles():
         if 'да' in shuffle_choice:
             shuffle(chosen_scripts)
 
-    for name in selected_profiles:
-        manager.run_scripts(
-            str(name),
-            chosen_scripts
-        )
+    manager.run_scripts_on_profiles(
+        [str(name) for name in selected_profiles],
+        chosen_scripts
+    )
@@ -2,7 +2,8 @@ from loguru import logger
 from rich.table import Table
 from rich.console import Console
 
-from src.utils.helpers import get_comments_for_profiles
+from src.utils.helpers import get_comments_for_profiles, get_tags_for_profiles, get_profiles_sizes
+from config import general_config
 from .utils import get_all_sorted_profiles
 
 
@@ -15,8 +16,18 @@ def show_all_profiles():
     console = Console()
     table = Table(style="cyan")
     table.add_column("Название", style="magenta")
+    table.add_column("Размер, МБ", style="green")
     table.add_column("Комментарии", style="green")
 
+    tags = {}
+    if general_config['metadata_backend'] == 'sqlite':
+        table.add_column("Теги", style="yellow")
+        tags_result = get_tags_for_profiles()
+        if tags_result["success"]:
+            tags = tags_result["tags"]
+        else:
+            logger.warning(f"⚠️ Не удалось загрузить теги, причина: {tags_result["description"]}")
+
     result = get_comments_for_profiles()
     if result["success"]:
         comments = result["comments"]
@@ -24,8 +35,14 @@ def show_all_profiles():
         logger.warning(f"⚠️ Не удалось загрузить комментарии, причина: {result["description"]}")
         comments = {}
 
+    sizes = get_profiles_sizes(profiles_list_sorted)  # walks only profiles changed since the last view
+
     for profile in profiles_list_sorted:
         comment = comments.get(profile, '')
-        table.add_row(profile, comment)
+        size = f'{sizes[profile] / 1024 ** 2:.0f}' if profile in sizes else ''
+        if general_config['metadata_backend'] == 'sqlite':
+            table.add_row(profile, size, comment, ', '.join(tags.get(profile, [])))
+        else:
+            table.add_row(profile, size, comment)
 
     console.print(table)
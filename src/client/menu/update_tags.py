@@ -0,0 +1,29 @@
+import re
+
+import questionary
+from loguru import logger
+
+from src.utils.helpers import set_tags_for_profiles
+from .utils import select_profiles, custom_style
+
+
+def update_tags():
+    selected_profiles = select_profiles()
+    if not selected_profiles:
+        return
+
+    tags_raw = questionary.text(
+        "Впиши теги через запятую (пусто - удалить теги)\n",
+        style=custom_style
+    ).ask()
+
+    if tags_raw is None:
+        return
+
+    tags = sorted(set(i.strip() for i in re.split(r'[\n,]+', tags_raw) if i.strip()))
+    result = set_tags_for_profiles(selected_profiles, tags)
+
+    if result["success"]:
+        logger.info("✅  Теги обновлены")
+    else:
+        logger.warning(f"⚠️ Не удалось обновить теги, причина: {result["description"]}")
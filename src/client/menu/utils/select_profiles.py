@@ -2,7 +2,7 @@ import re
 import questionary
 from loguru import logger
 
-from src.utils.helpers import get_profiles_list, get_comments_for_profiles
+from src.utils.helpers import get_profiles_list, find_profiles_by_comment, find_profiles_by_tag, get_tags_for_profiles
 from src.client.menu.utils.helpers import custom_style
 
 
@@ -16,6 +16,7 @@ def select_profiles() -> list[str] | None:
         '📋 выбрать из списка',
         '📝 вписать названия',
         '📒 выбрать по комментарию',
+        '🏷 выбрать по тегу',
         '📦 выбрать все',
         '🏠 назад в меню'
     ]
@@ -54,17 +55,24 @@ def select_profiles() -> list[str] | None:
             style=custom_style
         ).ask()
 
-        for profile in profiles_list_sorted:
-            result = get_comments_for_profiles()
-            if result["success"]:
-                comments = result["comments"]
-            else:
-                logger.warning(f"⚠️ Не удалось загрузить комментарии, причина: {result["description"]}")
-                comments = {}
-
-            comment = comments.get(profile, '')
-            if comment_substring.lower() in comment.lower():
-                selected_profiles.append(profile)
+        selected_profiles = find_profiles_by_comment(profiles_list_sorted, comment_substring)
+
+    elif 'выбрать по тегу' in select_method:
+        result = get_tags_for_profiles()
+        if not result["success"]:
+            logger.warning(f"⚠️ Не удалось загрузить теги, причина: {result["description"]}")
+            return
+        if not result["all_tags"]:
+            logger.warning("⚠️ Теги не заданы")
+            return
+
+        tag = questionary.select(
+            "Выбери тег",
+            choices=result["all_tags"],
+            style=custom_style
+        ).ask()
+
+        selected_profiles = find_profiles_by_tag(profiles_list_sorted, tag) if tag else []
 
     elif 'выбрать все' in select_method:
         selected_profiles = profiles_list_sorted
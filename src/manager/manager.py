@@ -1,8 +1,12 @@
 import os
+from typing import Mapping
 
 from loguru import logger
 
 from src.utils.constants import *
+from src.utils.helpers import record_script_result
+from src.utils.script_configs import load_script_configs
+from src.utils.metrics import metrics
 from .scripts import *
 
 
@@ -13,21 +17,93 @@ class Manager:
             'test_script': {
                 'human_name': 'Тестовый скрипт',
                 'method': test_script,
+            },
+            'chrome_initial_setup': {
+                'human_name': 'Начальная настройка профиля (без запуска браузера)',
+                'method': chrome_initial_setup,
+                'batch_method': chrome_initial_setup_batch,
+            },
+            'migrate_to_sharded_layout': {
+                'human_name': 'Перенос профилей в отдельные папки данных',
+                'method': migrate_to_sharded_layout,
             }
         }
 
-    def run_scripts(self, profile_name: str, scripts_list: list[str]) -> None:
+    def run_scripts_on_profiles(self, profile_names: list[str], scripts_list: list[str]) -> None:
+        script_configs = self.preflight_script_configs(scripts_list)
+        if script_configs is None:
+            return
+
+        with metrics.run('manager_scripts'):
+            per_profile_scripts = []
+            for script in scripts_list + [None]:
+                if script and not self.scripts[script].get('batch_method'):
+                    per_profile_scripts.append(script)
+                    continue
+
+                if per_profile_scripts:  # keep the profile by profile order for regular scripts
+                    for profile_name in profile_names:
+                        self.run_scripts(profile_name, per_profile_scripts, script_configs)
+                    per_profile_scripts = []
+
+                if script:
+                    self.run_batch_script(profile_names, script, script_configs[script])
+
+    def preflight_script_configs(self, scripts_list: list[str]) -> dict | None:
+        script_configs, errors = load_script_configs(DATA_PATH / 'scripts' / "manager", self.scripts, scripts_list)
+        if errors:
+            for error in errors:
+                logger.error(f'⛔  Некорректный конфиг скрипта: {error}')
+            logger.error('⛔  Прогон скриптов отменен, исправь конфиги и запусти снова')
+            return None
+
+        return script_configs
+
+    def run_batch_script(self, profile_names: list[str], script: str, config: Mapping | None = None) -> None:
+        human_name = self.scripts[script]['human_name']
+        logger.info(f'ℹ️ Запускаю скрипт "{human_name}" для {len(profile_names)} профилей')
+        script_data_path = os.path.join(DATA_PATH, 'scripts', "manager", script)
+
+        try:
+            with metrics.track('batch_script_seconds', component='manager', script=script):
+                results = self.scripts[script]['batch_method'](profile_names, script_data_path, config)
+        except Exception as e:
+            results = {profile_name: False for profile_name in profile_names}
+            logger.debug(f'скрипт "{human_name}" завершен с ошибкой, причина: {e}')
+
+        for profile_name in profile_names:
+            success = results.get(profile_name, False)
+            record_script_result(profile_name, script, success)
+            metrics.inc('batch_script_results_total', component='manager', script=script,
+                        status='success' if success else 'failed')
+
+        succeeded = sum(1 for success in results.values() if success)
+        if succeeded == len(profile_names):
+            logger.info(f'✅  Скрипт "{human_name}" выполнен для всех профилей ({succeeded})')
+        else:
+            logger.error(f'⛔  Скрипт "{human_name}" выполнен для {succeeded} из {len(profile_names)} профилей')
+
+    def run_scripts(self, profile_name: str, scripts_list: list[str], script_configs: dict | None = None) -> None:
+        if script_configs is None:
+            script_configs = self.preflight_script_configs(scripts_list)
+            if script_configs is None:
+                return
+
         for script in scripts_list:
             try:
                 human_name = self.scripts[script]['human_name']
                 logger.info(f'ℹ️ {profile_name} - запускаю скрипт "{human_name}"')
                 script_data_path = os.path.join(DATA_PATH, 'scripts', "manager", script)
-                self.scripts[script]['method'](
-                    profile_name,
-                    script_data_path
-                )
+                with metrics.track('script_seconds', component='manager', script=script):
+                    self.scripts[script]['method'](
+                        profile_name,
+                        script_data_path,
+                        script_configs[script]
+                    )
                 logger.info(f'✅  {profile_name} - скрипт "{human_name}" выполнен')
+                record_script_result(profile_name, script, True)
             except Exception as e:
+                record_script_result(profile_name, script, False)
                 human_name = self.scripts[script]['human_name']
                 logger.error(f'⛔  {profile_name} - скрипт "{human_name}" завершен с ошибкой')
                 logger.debug(f'{profile_name} - скрипт "{human_name}" завершен с ошибкой, причина: {e}')
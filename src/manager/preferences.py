@@ -0,0 +1,260 @@
+import os
+import copy
+import json
+import hashlib
+import colorsys
+import threading
+from pathlib import Path
+
+from src.utils.constants import *
+from src.utils.files import write_json_atomic
+
+
+GENERAL_PREFERENCES = {
+    "cookies_control_modes": {
+        "access": ["profile", "cookie_controls_mode"],
+        "human_name": "запрет на использование cookie",
+        "default_safe_value": 1,
+        "options": {
+            "block_all": {
+                "human_name": "запретить все cookie файлы",
+                "value": 1
+            },
+            "block_in_incognito": {
+                "human_name": "запретить cookie файлы в режиме инкогнито",
+                "value": 2
+            }
+        }
+    },
+    "anon_data_collection": {
+        "access": ["url_keyed_anonymized_data_collection"],
+        "human_name": "сбор анонимных данных",
+        "default_safe_value": False,
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": False
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": True
+            }
+        }
+    },
+    "enhanced_data_protection": {
+        "access": ["safebrowsing", "enhanced"],
+        "human_name": "улучшенная защита данных используя сервера google",
+        "default_safe_value": False,
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": False
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": True
+            }
+        }
+    },
+
+    "allow_chrome_sign_in": {
+        "access": ["signin", "allowed"],
+        "human_name": "разрешить вход в google аккаунт",
+        "default_safe_value": False,
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": False
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": True
+            }
+        }
+    },
+    "allow_chrome_sign_in_on_next_startup": {
+        "access": ["signin", "allowed_on_next_startup"],
+        "human_name": "разрешить вход в google аккаунт при следующем запуске профиля",
+        "default_safe_value": False,
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": False
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": True
+            }
+        }
+    },
+    "search_suggestions": {
+        "access": ["search", "suggest_enabled"],
+        "human_name": "улучшить поисковые предложения",
+        "default_safe_value": False,
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": False
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": True
+            }
+        }
+    },
+    "enhanced_spell_check": {
+        "access": ["spellcheck", "use_spelling_service"],
+        "human_name": "расширенная проверка орфографии",
+        "default_safe_value": False,
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": False
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": True
+            }
+        }
+    },
+
+    "autofill_credentials": {
+        "access": ["password_manager"],
+        "human_name": "расширенная проверка орфографии",
+        "default_safe_value": {
+                    "autofillable_credentials_account_store_login_database": False,
+                    "autofillable_credentials_profile_store_login_database": False
+                },
+        "options": {
+            "block": {
+                "human_name": "запретить",
+                "value": {
+                    "autofillable_credentials_account_store_login_database": False,
+                    "autofillable_credentials_profile_store_login_database": False
+                }
+            },
+            "allow": {
+                "human_name": "разрешить",
+                "value": {
+                    "autofillable_credentials_account_store_login_database": True,
+                    "autofillable_credentials_profile_store_login_database": True
+                }
+            }
+        }
+    }
+}
+
+PROFILE_SPECIFIC_PREFERENCES = {
+    "name": {
+        "access": ["profile", "name"],
+        "human_name": "имя профиля",
+        "options": None
+    },
+    "theme_color": {
+        "access": ["browser", "theme", "user_color"],
+        "human_name": "цвет профиля",
+        "options": None
+    }
+}
+
+
+# Keys Chrome accepts in a freshly created profile, every generated file is checked against it
+PREFERENCES_SCHEMA = {
+    "browser.has_seen_welcome_page": bool,
+    "browser.check_default_browser": bool,
+    "browser.theme.color_variant": int,
+    "browser.theme.follows_system_colors": bool,
+    "browser.theme.user_color": int,
+    "colorpicker.SeedColorChangeCount": int,
+    "distribution.import_bookmarks": bool,
+    "distribution.import_history": bool,
+    "distribution.import_search_engine": bool,
+    "distribution.suppress_first_run_bubble": bool,
+    "extensions.settings": dict,
+    "password_manager.autofillable_credentials_account_store_login_database": bool,
+    "password_manager.autofillable_credentials_profile_store_login_database": bool,
+    "profile.cookie_controls_mode": int,
+    "profile.exit_type": str,
+    "profile.exited_cleanly": bool,
+    "profile.name": str,
+    "profile.using_default_name": bool,
+    "safebrowsing.enhanced": bool,
+    "search.suggest_enabled": bool,
+    "signin.allowed": bool,
+    "signin.allowed_on_next_startup": bool,
+    "spellcheck.use_spelling_service": bool,
+    "sync.requested": bool,
+    "url_keyed_anonymized_data_collection": bool
+}
+
+template_lock = threading.Lock()
+template_cache = {}
+
+
+def build_preferences(profile_name: str, theme_color: int | None = None) -> dict:
+    preferences = copy.deepcopy(load_preferences_template()["preferences"])
+
+    for setting, data in GENERAL_PREFERENCES.items():
+        set_preference(preferences, data["access"], copy.deepcopy(data["default_safe_value"]))
+
+    set_preference(preferences, PROFILE_SPECIFIC_PREFERENCES["name"]["access"], str(profile_name))
+    set_preference(
+        preferences,
+        PROFILE_SPECIFIC_PREFERENCES["theme_color"]["access"],
+        get_profile_theme_color(profile_name) if theme_color is None else theme_color
+    )
+
+    errors = validate_preferences(preferences)
+    if errors:
+        raise ValueError(f'настройки не прошли проверку схемы: {"; ".join(errors)}')
+
+    return preferences
+
+
+def load_preferences_template() -> dict:
+    mtime = os.stat(PREFERENCES_TEMPLATE_PATH).st_mtime_ns
+    with template_lock:
+        if template_cache.get("mtime") != mtime:
+            with open(PREFERENCES_TEMPLATE_PATH, 'r', encoding="utf-8") as f:
+                template_cache["template"] = json.load(f)
+            template_cache["mtime"] = mtime
+
+        return template_cache["template"]
+
+
+def validate_preferences(preferences: dict, prefix: str = "") -> list[str]:
+    errors = []
+    for key, value in preferences.items():
+        path = f"{prefix}{key}"
+        expected_type = PREFERENCES_SCHEMA.get(path)
+
+        if expected_type is None:
+            if isinstance(value, dict) and any(known.startswith(f"{path}.") for known in PREFERENCES_SCHEMA):
+                errors.extend(validate_preferences(value, f"{path}."))
+            else:
+                errors.append(f'неизвестный ключ {path}')
+        elif type(value) is not expected_type:  # bool is a subclass of int, compare exact types
+            errors.append(f'ключ {path} должен быть {expected_type.__name__}, получено {type(value).__name__}')
+
+    return errors
+
+
+def get_profile_theme_color(profile_name: str) -> int:
+    hue = int(hashlib.sha256(str(profile_name).encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+    red, green, blue = (round(channel * 255) for channel in colorsys.hsv_to_rgb(hue, 0.45, 0.85))
+
+    argb = 0xFF000000 | (red << 16) | (green << 8) | blue
+    return argb - (1 << 32)  # Chrome stores user_color as a signed 32-bit int
+
+
+def set_preference(preferences: dict, access: list[str], value) -> None:
+    final_update_path = preferences
+    for key in access[:-1]:
+        final_update_path = final_update_path.setdefault(key, {})
+
+    final_update_path[access[-1]] = value
+
+
+def write_preferences(profile_path: str | Path, preferences: dict) -> None:
+    # Chrome's own compact format
+    write_json_atomic(os.path.join(profile_path, "Preferences"), preferences, separators=(',', ':'))
@@ -0,0 +1,95 @@
+import os
+import json
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
+from loguru import logger
+
+from config import general_config
+from src.utils.helpers import get_profile_path, get_profile_user_data_dir, is_user_data_dir_in_use
+from src.utils.files import write_json_atomic
+
+
+PATCH_STATUSES = {
+    "patched": "✅  настройки обновлены",
+    "unchanged": "ℹ️ настройки уже актуальны",
+    "running": "⚠️ профиль запущен, настройки не изменены",
+    "missing": "⚠️ файл настроек не найден",
+    "failed": "⛔  не удалось обновить настройки"
+}
+
+
+def patch_profiles_preferences(profile_names: list[str],
+                               patches: list[tuple[list[str], object]]) -> dict[str, dict]:
+    jobs = {}
+    results = {}
+    for profile_name in profile_names:
+        if is_user_data_dir_in_use(get_profile_user_data_dir(profile_name)):
+            results[profile_name] = {"status": "running", "description": ""}
+            continue
+
+        jobs[profile_name] = str(get_profile_path(profile_name) / "Preferences")
+
+    if len(jobs) == 1:  # single profile runs, starting worker processes costs more than the patch itself
+        profile_name, preferences_path = next(iter(jobs.items()))
+        results[profile_name] = patch_preferences_file(preferences_path, patches)
+    elif jobs:
+        # json parsing is cpu bound, threads would be serialized by the GIL
+        workers = max(1, min(general_config['max_workers'], len(jobs), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            for profile_name, result in zip(jobs, executor.map(patch_preferences_file, jobs.values(), [patches] * len(jobs), chunksize=chunksize)):
+                results[profile_name] = result
+
+    for profile_name in profile_names:
+        result = results[profile_name]
+        message = f'{profile_name} - {PATCH_STATUSES[result["status"]]}'
+        if result["status"] == "failed":
+            logger.error(message)
+            logger.debug(f'{profile_name} - не удалось обновить настройки, причина: {result["description"]}')
+        elif result["status"] in ("running", "missing"):
+            logger.warning(message)
+        else:
+            logger.debug(message)
+
+    return results
+
+
+def patch_preferences_file(preferences_path: str, patches: list[tuple[list[str], object]]) -> dict:
+    try:
+        with open(preferences_path, 'r', encoding="utf-8") as f:
+            preferences = json.load(f)
+    except FileNotFoundError:
+        return {"status": "missing", "description": ""}
+    except (OSError, json.JSONDecodeError) as e:
+        return {"status": "failed", "description": str(e)}
+
+    changed = False
+    for access, value in patches:
+        if apply_patch(preferences, access, value):
+            changed = True
+
+    if not changed:
+        return {"status": "unchanged", "description": ""}
+
+    try:
+        write_json_atomic(preferences_path, preferences, separators=(',', ':'))  # Chrome's own compact format
+    except OSError as e:
+        return {"status": "failed", "description": str(e)}
+
+    return {"status": "patched", "description": ""}
+
+
+def apply_patch(preferences: dict, access: list[str], value) -> bool:
+    final_update_path = preferences
+    for key in access[:-1]:
+        if not isinstance(final_update_path.get(key), dict):
+            final_update_path[key] = {}
+        final_update_path = final_update_path[key]
+
+    current_value = final_update_path.get(access[-1])
+    if access[-1] in final_update_path and current_value == value and type(current_value) is type(value):
+        return False
+
+    final_update_path[access[-1]] = copy.deepcopy(value)
+    return True
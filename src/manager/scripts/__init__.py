@@ -1,2 +1,3 @@
-from .chrome_initial_setup import chrome_initial_setup
+from .chrome_initial_setup import chrome_initial_setup, chrome_initial_setup_batch
 from .test_script import test_script
+from .migrate_to_sharded_layout import migrate_to_sharded_layout
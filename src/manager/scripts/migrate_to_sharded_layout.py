@@ -0,0 +1,72 @@
+import os
+import copy
+import json
+
+from loguru import logger
+
+from src.utils.constants import *
+from src.utils.helpers import get_profile_root_path, is_profile_sharded, is_user_data_dir_in_use
+from src.utils.files import write_json_atomic
+
+
+def migrate_to_sharded_layout(profile_name: str, _, __) -> None:
+    if is_profile_sharded(profile_name):
+        logger.info(f'ℹ️ {profile_name} - профиль уже использует отдельную папку данных')
+        return
+
+    if is_shared_chrome_running():
+        raise Exception('Chrome с общей папкой данных запущен, закрой все профили перед переносом')
+
+    profile_root_path = get_profile_root_path(profile_name)
+    migration_path = CHROME_DATA_PATH / f".Profile {profile_name}.migrating"  # hidden from get_profiles_list
+
+    if os.path.isdir(migration_path):  # previous migration was interrupted
+        os.makedirs(profile_root_path, exist_ok=True)
+    elif os.path.isdir(profile_root_path):
+        os.rename(profile_root_path, migration_path)
+        os.makedirs(profile_root_path)
+    else:
+        raise Exception('профиль не найден')
+
+    os.rename(migration_path, profile_root_path / SHARDED_PROFILE_DIRECTORY)
+    split_local_state(profile_name)
+
+    logger.info(f'✅  {profile_name} - профиль перенесен в отдельную папку данных')
+
+
+def split_local_state(profile_name: str) -> None:
+    shared_local_state_path = CHROME_DATA_PATH / "Local State"
+    if not shared_local_state_path.exists():
+        return
+
+    with open(shared_local_state_path, 'r', encoding="utf-8") as f:
+        shared_local_state = json.load(f)
+
+    shared_profile_state = shared_local_state.setdefault("profile", {})
+    info_cache = shared_profile_state.setdefault("info_cache", {})
+    profile_info = info_cache.pop(f"Profile {profile_name}", {})
+
+    # os_crypt and other browser-wide keys are kept, otherwise saved passwords and cookies can't be decrypted
+    local_state = copy.deepcopy(shared_local_state)
+    profile_state = local_state["profile"]
+    profile_state["info_cache"] = {SHARDED_PROFILE_DIRECTORY: profile_info}
+    profile_state["last_used"] = SHARDED_PROFILE_DIRECTORY
+    profile_state["last_active_profiles"] = [SHARDED_PROFILE_DIRECTORY]
+    if "profiles_order" in profile_state:
+        profile_state["profiles_order"] = [SHARDED_PROFILE_DIRECTORY]
+
+    write_json_atomic(get_profile_root_path(profile_name) / "Local State", local_state)
+
+    for key in ("last_active_profiles", "profiles_order"):
+        if key in shared_profile_state:
+            shared_profile_state[key] = [i for i in shared_profile_state[key] if i != f"Profile {profile_name}"]
+    if shared_profile_state.get("last_used") == f"Profile {profile_name}":
+        shared_profile_state.pop("last_used")
+
+    write_json_atomic(shared_local_state_path, shared_local_state)
+
+
+def is_shared_chrome_running() -> bool:
+    return is_user_data_dir_in_use(CHROME_DATA_PATH)
+
+
@@ -1,5 +1,5 @@
 from loguru import logger
 
 
-def test_script(profile_name: str, _):
+def test_script(profile_name: str, _, __):
     logger.info(f"💩 {profile_name} - manager test script for profile  done")
@@ -0,0 +1,40 @@
+import os
+import json
+import threading
+from pathlib import Path
+
+from src.utils.constants import *
+from src.utils.files import write_json_atomic
+
+
+class CommentsStore:
+    def __init__(self, file_path: str | Path):
+        self.file_path = Path(file_path)
+        self.lock = threading.RLock()
+        self.cache = None
+        self.cache_mtime = None
+
+    def load(self) -> dict:
+        with self.lock:
+            mtime = os.stat(self.file_path).st_mtime_ns  # can trigger FileNotFoundError
+            if self.cache is None or mtime != self.cache_mtime:
+                with open(self.file_path, 'r', encoding="utf-8") as f:
+                    self.cache = json.load(f)  # can trigger JSONDecodeError
+                self.cache_mtime = mtime
+
+            return dict(self.cache)
+
+    def update(self, changes: dict) -> None:
+        with self.lock:
+            comments = self.load()
+            comments.update(changes)
+            self.__write(comments)
+
+    def __write(self, comments: dict) -> None:
+        write_json_atomic(self.file_path, comments, indent=4)
+
+        self.cache = comments
+        self.cache_mtime = os.stat(self.file_path).st_mtime_ns
+
+
+comments_store = CommentsStore(DATA_PATH / "comments_for_profiles.json")
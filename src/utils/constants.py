@@ -9,8 +9,12 @@ chrome_driver_name = "chromedriver.exe" if platform == "win32" else "chromedrive
 PROJECT_PATH = current_dir.parents[1]
 DATA_PATH = PROJECT_PATH / "data"
 CHROME_DATA_PATH = DATA_PATH / "profiles"
+SHARDED_PROFILE_DIRECTORY = "Default"
 DEFAULT_EXTENSIONS_PATH = DATA_PATH / "default_extensions"
+TRASH_PATH = DATA_PATH / "trash"
 CHROME_PATH = r"C:\Program Files\Google\Chrome\Application\chrome.exe" if platform == "win32" else "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
 CHROME_DRIVER_PATH = PROJECT_PATH / "src" / "chrome" / "scripts" / chrome_driver_name
 PROFILE_WELCOME_PAGE_TEMPLATE_PATH = PROJECT_PATH / "src" / "client" / "template.html"
 PROFILE_WELCOME_PAGES_OUTPUT_PATH = CHROME_DATA_PATH / "WelcomePages"
+METRICS_PATH = DATA_PATH / "metrics"
+PREFERENCES_TEMPLATE_PATH = PROJECT_PATH / "src" / "manager" / "preferences_template.json"
@@ -0,0 +1,184 @@
+import os
+import sys
+import json
+import ctypes
+import shutil
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+
+from src.utils.constants import *
+from src.utils.files import write_json_atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+FICLONE = 0x40049409  # linux ioctl for copy-on-write clones (btrfs, xfs)
+
+# macOS clonefile(2) for copy-on-write clones on APFS, Windows has no reflinks here and uses hardlinks
+clonefile = getattr(ctypes.CDLL(None, use_errno=True), 'clonefile', None) if sys.platform == 'darwin' else None
+
+
+class ExtensionStore:
+    def __init__(self, store_path: str | Path):
+        self.store_path = Path(store_path)
+        self.blobs_path = self.store_path / "blobs"
+        self.trees_path = self.store_path / "trees"
+        self.hash_cache_path = self.store_path / "hash_cache.json"
+        self.lock = threading.Lock()
+        self.hash_cache = None
+        self.trees = {}
+        self.reflinks_supported = (sys.platform == 'linux' and fcntl is not None) or clonefile is not None
+
+    def install(self, ext_id: str, src_path: str | Path, dest_path: str | Path) -> int:
+        tree, new_digests = self.ingest(ext_id, src_path)
+
+        saved_bytes = 0
+        for rel_path, (digest, size) in tree.items():
+            file_path = os.path.join(dest_path, rel_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            linked = self.__link(self.__get_blob_path(digest), file_path)
+            if digest in new_digests:
+                new_digests.discard(digest)  # the blob created by this call is the one copy on disk
+            elif linked:
+                saved_bytes += size
+
+        return saved_bytes
+
+    def ingest(self, ext_id: str, src_path: str | Path) -> tuple[dict[str, list], set[str]]:
+        with self.lock:
+            signature = get_tree_signature(src_path)
+            cached = self.trees.get(ext_id)
+            if cached and cached[0] == signature:
+                return cached[1], set()
+
+            self.__load_hash_cache()
+            tree = {}
+            new_digests = set()
+            for rel_path, (size, mtime) in signature.items():
+                file_path = os.path.join(src_path, rel_path)
+                cache_key = os.path.abspath(file_path)
+                cached_hash = self.hash_cache.get(cache_key)
+                if cached_hash and cached_hash[0] == size and cached_hash[1] == mtime:
+                    digest = cached_hash[2]
+                else:
+                    digest = get_file_hash(file_path)
+                    self.hash_cache[cache_key] = [size, mtime, digest]
+
+                if not os.path.exists(self.__get_blob_path(digest)):
+                    self.__add_blob(file_path, digest)
+                    new_digests.add(digest)
+
+                tree[rel_path] = [digest, size]
+
+            os.makedirs(self.trees_path, exist_ok=True)
+            write_json_atomic(self.trees_path / f"{ext_id}.json", tree)
+            write_json_atomic(self.hash_cache_path, self.hash_cache)
+            self.trees[ext_id] = (signature, tree)
+
+            return tree, new_digests
+
+    def gc(self, ext_ids_in_use: list[str]) -> tuple[int, int]:
+        with self.lock:
+            referenced = set()
+            for tree_file in list(self.trees_path.glob("*.json")) if self.trees_path.exists() else []:
+                if tree_file.stem not in ext_ids_in_use:
+                    tree_file.unlink()
+                    self.trees.pop(tree_file.stem, None)
+                    continue
+
+                with open(tree_file, 'r', encoding="utf-8") as f:
+                    referenced.update(digest for digest, _ in json.load(f).values())
+
+            removed_files, freed_bytes = 0, 0
+            for blob_path in list(self.blobs_path.glob("*/*")) if self.blobs_path.exists() else []:
+                if blob_path.name in referenced:
+                    continue
+
+                stat = blob_path.stat()
+                blob_path.unlink()
+                removed_files += 1
+                if stat.st_nlink == 1:  # hardlinked copies in profiles keep the data alive
+                    freed_bytes += stat.st_size
+
+            return removed_files, freed_bytes
+
+    def __link(self, blob_path: Path, file_path: str) -> bool:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+        if self.reflinks_supported:
+            try:
+                reflink(blob_path, file_path)
+                return True
+            except OSError:
+                self.reflinks_supported = False  # filesystem can't clone, don't retry for every file
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
+        try:
+            os.link(blob_path, file_path)
+            return True
+        except OSError:
+            shutil.copy2(blob_path, file_path)
+            return False
+
+    def __add_blob(self, file_path: str, digest: str) -> None:
+        blob_path = self.__get_blob_path(digest)
+        os.makedirs(blob_path.parent, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=blob_path.parent, suffix=".tmp")
+        os.close(fd)
+        shutil.copy2(file_path, temp_path)
+        os.replace(temp_path, blob_path)
+
+    def __get_blob_path(self, digest: str) -> Path:
+        return self.blobs_path / digest[:2] / digest
+
+    def __load_hash_cache(self) -> None:
+        if self.hash_cache is not None:
+            return
+
+        try:
+            with open(self.hash_cache_path, 'r', encoding="utf-8") as f:
+                self.hash_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.hash_cache = {}
+
+
+def reflink(src_path: str | Path, dest_path: str | Path) -> None:
+    if clonefile is not None:
+        if clonefile(os.fsencode(src_path), os.fsencode(dest_path), 0) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(dest_path))
+        return
+
+    with open(src_path, 'rb') as src, open(dest_path, 'wb') as dest:
+        fcntl.ioctl(dest.fileno(), FICLONE, src.fileno())
+    shutil.copystat(src_path, dest_path)
+
+
+def get_tree_signature(path: str | Path) -> dict[str, tuple[int, int]]:
+    signature = {}
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            file_path = os.path.join(root, file_name)
+            stat = os.stat(file_path)
+            signature[os.path.relpath(file_path, path)] = (stat.st_size, stat.st_mtime_ns)
+
+    return signature
+
+
+def get_file_hash(file_path: str | Path) -> str:
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+extension_store = ExtensionStore(DATA_PATH / "extension_store")
@@ -0,0 +1,39 @@
+import os
+import json
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(file_path: str | Path, content: str) -> None:
+    file_path = Path(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_path, file_path)  # readers see either the old or the new file, never a partial one
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_json_atomic(file_path: str | Path, data, **json_kwargs) -> None:
+    write_atomic(file_path, json.dumps(data, ensure_ascii=False, **json_kwargs))
+
+
+def get_dir_size(path: str | Path) -> int:
+    size = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    size += get_dir_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    size += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+
+    return size
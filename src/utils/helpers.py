@@ -1,36 +1,98 @@
 import os
 import json
 import shutil
+import sqlite3
 import sys
+import time
+import threading
+import uuid
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
+from pathlib import Path
+
+import psutil
 from loguru import logger
 
 from src.utils.constants import *
+from src.utils.comments_store import comments_store
+from src.utils.metadata_store import metadata_store
+from src.utils.profile_catalog import profile_catalog
+from src.utils.extension_store import extension_store
+from src.utils.manifest_index import manifest_index
+from src.utils.metrics import metrics
+from config import general_config
+
+
+def get_profile_root_path(profile_name: str | int) -> Path:
+    return CHROME_DATA_PATH / f"Profile {profile_name}"
+
+
+def is_profile_sharded(profile_name: str | int) -> bool:
+    return os.path.isdir(get_profile_root_path(profile_name) / SHARDED_PROFILE_DIRECTORY)
+
+
+def get_profile_path(profile_name: str | int) -> Path:
+    profile_root_path = get_profile_root_path(profile_name)
+    if is_profile_sharded(profile_name):
+        return profile_root_path / SHARDED_PROFILE_DIRECTORY
+
+    return profile_root_path
+
+
+def get_profile_user_data_dir(profile_name: str | int) -> Path:
+    if is_profile_sharded(profile_name):
+        return get_profile_root_path(profile_name)
+
+    return CHROME_DATA_PATH
+
+
+def is_user_data_dir_in_use(user_data_dir: str | Path) -> bool:
+    for lock_name in ("SingletonLock", "lockfile"):  # posix / windows
+        lock_path = os.path.join(user_data_dir, lock_name)
+        if not os.path.lexists(lock_path):
+            continue
+
+        try:
+            pid = int(os.readlink(lock_path).rsplit('-', 1)[-1])  # SingletonLock -> "<hostname>-<pid>"
+            os.kill(pid, 0)
+        except (OSError, ValueError) as e:
+            if isinstance(e, ProcessLookupError):  # stale lock left by a crashed browser
+                continue
+
+        return True
+
+    return False
+
+
+def get_profile_directory_name(profile_name: str | int) -> str:
+    if is_profile_sharded(profile_name):
+        return SHARDED_PROFILE_DIRECTORY
+
+    return f"Profile {profile_name}"
 
 
 def get_profiles_list() -> list[str]:
-    profiles = []
-    for item in os.listdir(CHROME_DATA_PATH):
-        item_path = os.path.join(CHROME_DATA_PATH, item)
+    return profile_catalog.get_profile_names()
 
-        if os.path.isdir(item_path) and item.startswith("Profile"):
-            profiles.append(item.replace('Profile ', ''))
 
-    return profiles
+def get_profiles_sizes(profiles_list: list[str]) -> dict[str, int]:
+    return profile_catalog.get_profile_sizes(profiles_list)
 
 
 def get_comments_for_profiles() -> dict:
     try:
-        comments_file_path = DATA_PATH / "comments_for_profiles.json"
-        with open(comments_file_path, 'r', encoding="utf-8") as f:
-            comments = json.load(f)
+        if general_config['metadata_backend'] == 'sqlite':
+            comments = metadata_store.get_comments()
+        else:
+            comments = comments_store.load()
     except FileNotFoundError:
         return {
             "success": False,
             "description": "файл с комментариями не найден"
         }
 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, sqlite3.Error):
         return {
             "success": False,
             "description": "не удалось прочитать файл с комментариями"
@@ -43,55 +105,169 @@ def get_comments_for_profiles() -> dict:
 
 
 def set_comments_for_profiles(profile_names: list[str | int], comment: str | int | float) -> dict:
-    result = get_comments_for_profiles()
-    if result["success"]:
-        comments = result["comments"]
+    changes = {profile_name: comment for profile_name in profile_names}
+    try:
+        if general_config['metadata_backend'] == 'sqlite':
+            metadata_store.set_comments(changes)  # upsert, no full read of the comments
+        else:
+            comments_store.update(changes)
+
+    except FileNotFoundError:
+        description = "файл с комментариями не найден"
+    except (json.JSONDecodeError, sqlite3.Error):
+        description = "не удалось прочитать файл с комментариями"
     else:
-        logger.warning(f"⚠️ Не удалось загрузить комментарии, причина: {result["description"]}")
-        return result
+        return {
+            "success": True
+        }
 
-    for profile_name in profile_names:
-        comments[profile_name] = comment
+    logger.warning(f"⚠️ Не удалось сохранить комментарии, причина: {description}")
+    return {
+        "success": False,
+        "description": description
+    }
+
+
+def get_tags_for_profiles() -> dict:
+    if general_config['metadata_backend'] != 'sqlite':
+        return {
+            "success": False,
+            "description": "теги доступны только при 'metadata_backend': 'sqlite'"
+        }
+
+    try:
+        return {
+            "success": True,
+            "tags": metadata_store.get_tags(),
+            "all_tags": metadata_store.get_all_tags()
+        }
+    except sqlite3.Error:
+        return {
+            "success": False,
+            "description": "не удалось прочитать базу данных профилей"
+        }
+
+
+def set_tags_for_profiles(profile_names: list[str | int], tags: list[str]) -> dict:
+    if general_config['metadata_backend'] != 'sqlite':
+        return {
+            "success": False,
+            "description": "теги доступны только при 'metadata_backend': 'sqlite'"
+        }
 
-    comments_file_path = DATA_PATH / "comments_for_profiles.json"
-    with open(comments_file_path, 'w', encoding="utf-8") as f:
-        json.dump(comments, f, indent=4, ensure_ascii=False)
+    try:
+        metadata_store.set_tags([str(name) for name in profile_names], tags)
+    except sqlite3.Error:
+        return {
+            "success": False,
+            "description": "не удалось сохранить теги в базу данных профилей"
+        }
 
     return {
         "success": True
     }
 
 
-def copy_extension(src_path: str, dest_path: str, profile: str | int, ext_id: str, replace: bool = False):
-    if replace:
-        if os.path.exists(dest_path):
-            shutil.rmtree(dest_path)
-        try:
-            shutil.copytree(src_path, dest_path)
-            logger.info(f'✅  {profile} - добавлено/заменено расширение {ext_id}')
-            return True
-        except Exception as e:
-            logger.error(f'⛔  {profile} - не удалось добавить расширение {ext_id}')
-            logger.debug(f'{profile} - не удалось добавить расширение {ext_id}, причина: {e}')
-            return False
+def find_profiles_by_tag(profiles_list: list[str], tag: str) -> list[str]:
+    matched_profiles = metadata_store.find_profiles_by_tag(tag)
+    return [profile for profile in profiles_list if profile in matched_profiles]
+
+
+def find_profiles_by_comment(profiles_list: list[str], comment_substring: str) -> list[str]:
+    if general_config['metadata_backend'] == 'sqlite' and comment_substring:
+        matched_profiles = metadata_store.find_profiles_by_comment(comment_substring)
+        return [profile for profile in profiles_list if profile in matched_profiles]
+
+    result = get_comments_for_profiles()
+    if result["success"]:
+        comments = result["comments"]
     else:
-        if os.path.exists(dest_path):
+        logger.warning(f"⚠️ Не удалось загрузить комментарии, причина: {result["description"]}")
+        comments = {}
+
+    return [
+        profile for profile in profiles_list
+        if comment_substring.lower() in comments.get(profile, '').lower()
+    ]
+
+
+def record_profile_launch(profile_name: str) -> None:
+    if general_config['metadata_backend'] != 'sqlite':
+        return
+
+    try:
+        metadata_store.record_launch(profile_name)
+    except sqlite3.Error as e:
+        logger.debug(f'{profile_name} - не удалось сохранить время запуска, причина: {e}')
+
+
+def record_script_result(profile_name: str, script: str, success: bool) -> None:
+    if general_config['metadata_backend'] != 'sqlite':
+        return
+
+    try:
+        metadata_store.record_script_result(profile_name, script, success)
+    except sqlite3.Error as e:
+        logger.debug(f'{profile_name} - не удалось сохранить результат скрипта {script}, причина: {e}')
+
+
+def copy_extension(src_path: str, dest_path: str, profile: str | int, ext_id: str, replace: bool = False) -> dict:
+    if os.path.exists(dest_path):
+        if not replace:
             logger.debug(f'{profile} - расширение {ext_id} уже существует, пропущено')
-            return False
-        else:
-            try:
-                shutil.copytree(src_path, dest_path)
-                logger.info(f'✅  {profile} - добавлено расширение {ext_id}')
-                return True
-            except Exception as e:
-                logger.error(f'⛔  {profile} - не удалось добавить расширение {ext_id}')
-                logger.debug(f'{profile} - не удалось добавить расширение {ext_id}, причина: {e}')
-                return False
+            return {
+                "success": False,
+                "saved_bytes": 0
+            }
 
+        shutil.rmtree(dest_path)
 
-def remove_extensions(profile: str | int, ext_ids: list[str]) -> None:
-    extensions_path = os.path.join(CHROME_DATA_PATH, f"Profile {profile}", "Extensions")
-    extensions_settings_path = os.path.join(CHROME_DATA_PATH, f"Profile {profile}", "Local Extension Settings")
+    try:
+        saved_bytes = extension_store.install(ext_id, src_path, dest_path)
+        logger.info(f'✅  {profile} - добавлено{"/заменено" if replace else ""} расширение {ext_id}')
+        return {
+            "success": True,
+            "saved_bytes": saved_bytes
+        }
+    except Exception as e:
+        logger.error(f'⛔  {profile} - не удалось добавить расширение {ext_id}')
+        logger.debug(f'{profile} - не удалось добавить расширение {ext_id}, причина: {e}')
+        return {
+            "success": False,
+            "saved_bytes": 0
+        }
+
+
+def cleanup_extension_store() -> None:
+    try:
+        ext_ids_in_use = [i.name for i in os.scandir(DEFAULT_EXTENSIONS_PATH) if i.is_dir()]
+        removed_files, freed_bytes = extension_store.gc(ext_ids_in_use)
+        if removed_files:
+            logger.info(f'ℹ️ Хранилище расширений очищено, удалено файлов: {removed_files}, освобождено {format_size(freed_bytes)}')
+    except Exception as e:
+        logger.debug(f'не удалось очистить хранилище расширений, причина: {e}')
+
+
+def format_size(size: int | float) -> str:
+    for unit in ('Б', 'КБ', 'МБ'):
+        if size < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+
+    return f'{size:.1f} ГБ'
+
+
+def remove_extensions(profile: str | int, ext_ids: list[str]) -> dict:
+    profile_path = get_profile_path(profile)
+    extensions_path = os.path.join(profile_path, "Extensions")
+    extensions_settings_path = os.path.join(profile_path, "Local Extension Settings")
+    os.makedirs(TRASH_PATH, exist_ok=True)
+
+    result = {
+        "profile": profile,
+        "trashed_paths": [],
+        "failed": 0
+    }
 
     for ext_id in ext_ids:
         ext_path = os.path.join(extensions_path, ext_id)
@@ -99,20 +275,77 @@ def remove_extensions(profile: str | int, ext_ids: list[str]) -> None:
 
         try:
             if os.path.isdir(ext_path):
-                shutil.rmtree(ext_path)
+                result["trashed_paths"].append(move_to_trash(ext_path))
                 logger.info(f'{profile} - расширение {ext_id} удалено')
         except Exception as e:
+            result["failed"] += 1
             logger.error(f'⛔  {profile} - не удалоcь удалить расширение {ext_id}')
             logger.debug(f'{profile} - не удалоcь удалить  расширение {ext_id}, причина: {e}')
 
         try:
             if os.path.isdir(ext_settings_path):
-                shutil.rmtree(ext_settings_path)
+                result["trashed_paths"].append(move_to_trash(ext_settings_path))
                 logger.info(f'{profile} - локальные настройки расширения {ext_id} удалены')
         except Exception as e:
+            result["failed"] += 1
             logger.error(f'⛔  {profile} - не удалоcь удалить локальные настройки расширения {ext_id}')
             logger.debug(f'{profile} - не удалоcь удалить локальные настройки расширения {ext_id}, причина: {e}')
 
+    return result
+
+
+def move_to_trash(path: str | Path) -> str:
+    trash_path = os.path.join(TRASH_PATH, uuid.uuid4().hex)
+    os.rename(path, trash_path)  # same filesystem, so it is instant and atomic
+
+    return trash_path
+
+
+def empty_trash(trashed_paths: list[str] | None = None) -> int:
+    if trashed_paths is None:  # everything left over, e.g. after a crash
+        trashed_paths = [i.path for i in os.scandir(TRASH_PATH)] if os.path.isdir(TRASH_PATH) else []
+
+    freed_bytes = 0
+    for trashed_path in trashed_paths:
+        size = get_freeable_size(trashed_path)
+        try:
+            shutil.rmtree(trashed_path)
+            freed_bytes += size
+        except Exception as e:
+            logger.debug(f'не удалоcь очистить {trashed_path}, причина: {e}')
+
+    return freed_bytes
+
+
+def empty_trash_in_background(trashed_paths_by_profile: dict[str, list[str]]) -> threading.Thread:
+    def empty_profiles_trash():
+        with ThreadPoolExecutor(max_workers=general_config['max_workers']) as executor:
+            freed_bytes = dict(zip(trashed_paths_by_profile, executor.map(empty_trash, trashed_paths_by_profile.values())))
+
+        for profile, profile_freed_bytes in freed_bytes.items():
+            logger.debug(f'{profile} - освобождено {format_size(profile_freed_bytes)}')
+        logger.info(f'ℹ️ Корзина очищена, освобождено {format_size(sum(freed_bytes.values()))}')
+
+    # not a daemon, so the interpreter finishes the deletion before exit; leftovers of a crash are emptied on the next run
+    thread = threading.Thread(target=empty_profiles_trash, name='empty-trash')
+    thread.start()
+    return thread
+
+
+def get_freeable_size(path: str | Path) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            try:
+                stat = os.lstat(os.path.join(root, file_name))
+            except OSError:
+                continue
+
+            if stat.st_nlink == 1:  # hardlinks into the extension store or other profiles keep the data on disk
+                size += stat.st_size
+
+    return size
+
 
 def get_all_default_extensions_info() -> dict:
     extensions_info = {}
@@ -123,32 +356,30 @@ def get_all_default_extensions_info() -> dict:
             name = get_extension_name(extension_path)
             extensions_info[extension_id] = name
 
+    manifest_index.save()
     return extensions_info
 
 
 def get_profiles_extensions_info(profiles_list) -> dict[str, str]:
     extensions_info = {}
-    for profile in profiles_list:
-        profile_path = os.path.join(PROJECT_PATH, "data", "profiles", f"Profile {profile}")
-        extensions_path = os.path.join(profile_path, "Extensions")
-        extensions_settings_path = os.path.join(profile_path, "Local Extension Settings")
-        if not os.path.isdir(extensions_path) and not os.path.isdir(extensions_settings_path):
-            continue
-
-        if os.path.exists(extensions_path):
-            for extension_id in os.listdir(extensions_path):
-                extension_path = os.path.join(extensions_path, extension_id)
-                if os.path.isdir(extension_path):
-                    name = get_extension_name(extension_path)
-                    extensions_info[extension_id] = name
+    for profile, entry in profile_catalog.get_profiles(profiles_list).items():
+        extensions_path = os.path.join(entry["path"], "Extensions")
+        for extension_id, extension_info in entry["extensions"].items():
+            if extensions_info.get(extension_id):
+                continue
+
+            name = ''
+            if extension_info["versions"]:
+                version = extension_info["versions"][0]
+                name = read_manifest_name(os.path.join(extensions_path, extension_id, version, "manifest.json"))
+            extensions_info[extension_id] = name
 
-        if os.path.exists(extensions_settings_path):
-            for extension_id in os.listdir(extensions_settings_path):
-                extension_settings_path = os.path.join(extensions_settings_path, extension_id)
-                if os.path.isdir(extension_settings_path):
-                    if extensions_info.get(extension_id) is None:
-                        extensions_info[extension_id] = ''
+        for extension_id in entry["extension_settings"]:
+            if extensions_info.get(extension_id) is None:
+                extensions_info[extension_id] = ''
 
+    manifest_index.save()
+    profile_catalog.save()
     return extensions_info
 
 
@@ -168,22 +399,108 @@ def get_extension_name(extension_path: str) -> str:
 
 
 def read_manifest_name(manifest_path: str) -> str:
-    try:
-        with open(manifest_path, 'r', encoding='utf-8') as file:
-            manifest = json.load(file)
+    manifest_info = manifest_index.get_info(manifest_path)
+    return manifest_info["name"] if manifest_info else ''
+
+
+def get_cmdline_profile_name(cmdline: list[str]) -> str | None:
+    args = dict(arg[2:].split('=', 1) for arg in cmdline[1:] if arg.startswith('--') and '=' in arg)
+    if "user-data-dir" not in args:
+        return None
+
+    chrome_data_path = os.path.normcase(os.path.abspath(CHROME_DATA_PATH))
+    user_data_dir = os.path.normcase(os.path.abspath(args["user-data-dir"].strip('"')))
+
+    if user_data_dir == chrome_data_path:
+        profile_directory = args.get("profile-directory", "").strip('"')
+        return profile_directory.removeprefix("Profile ") if profile_directory.startswith("Profile ") else None
+    if os.path.dirname(user_data_dir) == chrome_data_path:  # sharded layout, one user-data-dir per profile
+        directory_name = os.path.basename(user_data_dir)
+        return directory_name[len("Profile "):] if directory_name.startswith(os.path.normcase("Profile ")) else None
 
-        return manifest.get("action", {}).get("default_title", "")
-    except (json.JSONDecodeError, OSError):
-        return ''
+    return None
 
 
-def kill_chrome_processes() -> None:
+def find_chrome_processes() -> dict[str, list[psutil.Process]]:
+    chrome_processes = {}
+    for process in psutil.process_iter(['cmdline']):
+        try:
+            profile_name = get_cmdline_profile_name(process.info['cmdline'] or [])
+        except Exception:  # malformed command lines of unrelated processes
+            continue
+
+        if profile_name is not None:
+            chrome_processes.setdefault(profile_name, []).append(process)
+
+    return chrome_processes
+
+
+def terminate_process_gracefully(process: psutil.Process) -> None:
     try:
-        if sys.platform == 'win32':
-            os.system('taskkill /F /IM chrome.exe')
+        if sys.platform == 'win32':  # TerminateProcess skips the profile flush, WM_CLOSE does not
+            subprocess.run(['taskkill', '/PID', str(process.pid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         else:
-            os.system('pkill chrome')
-        logger.info(f'✅  Все процессы Chrome завершены')
-    except Exception as e:
-        logger.error(f'⛔  Не удалоcь завершить процессы Chrome')
-        logger.error(f'⛔  Не удалоcь завершить процессы Chrome, причина: {e}')
+            process.terminate()
+    except psutil.Error:
+        pass
+
+
+def kill_chrome_processes(timeout: int | float | None = None) -> dict[str, float]:
+    timeout = general_config['shutdown_timeout_sec'] if timeout is None else timeout
+    started_at = time.monotonic()
+
+    chrome_processes = find_chrome_processes()
+    if not chrome_processes:
+        logger.info('ℹ️ Запущенные профили Chrome не найдены')
+        return {}
+
+    # Only browser processes get the terminate, renderers and helpers exit together with them
+    browser_processes = {}
+    for profile_name, processes in chrome_processes.items():
+        roots = [process for process in processes
+                 if not any(arg.startswith('--type=') for arg in process.info['cmdline'] or [])]
+        browser_processes[profile_name] = roots or processes
+
+    process_profiles = {process.pid: profile_name
+                        for profile_name, processes in chrome_processes.items() for process in processes}
+    remaining = {profile_name: {process.pid for process in processes}
+                 for profile_name, processes in chrome_processes.items()}
+    durations = {}
+
+    def on_exit(process: psutil.Process) -> None:
+        profile_name = process_profiles[process.pid]
+        remaining[profile_name].discard(process.pid)
+        if not remaining[profile_name]:
+            durations[profile_name] = time.monotonic() - started_at
+
+    with ThreadPoolExecutor(max_workers=general_config['max_workers']) as executor:
+        executor.map(terminate_process_gracefully, [process for roots in browser_processes.values() for process in roots])
+
+    all_processes = [process for processes in chrome_processes.values() for process in processes]
+    _, alive = psutil.wait_procs(all_processes, timeout=max(timeout - (time.monotonic() - started_at), 0), callback=on_exit)
+
+    killed_profiles = sorted({process_profiles[process.pid] for process in alive})
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    _, alive = psutil.wait_procs(alive, timeout=5, callback=on_exit)
+
+    with metrics.run('shutdown'):
+        for profile_name, duration in durations.items():
+            metrics.observe('shutdown_seconds', duration, status='forced' if profile_name in killed_profiles else 'graceful')
+        metrics.inc('shutdown_failed_processes_total', len(alive))
+
+    for profile_name in sorted(durations, key=durations.get):
+        logger.debug(f'{profile_name} - профиль завершен за {durations[profile_name]:.2f} сек'
+                     + (' (принудительно)' if profile_name in killed_profiles else ''))
+
+    elapsed = time.monotonic() - started_at
+    if killed_profiles:
+        logger.warning(f'⚠️ Не закрылись за {timeout} сек и завершены принудительно: {", ".join(killed_profiles)}')
+    if alive:
+        logger.error(f'⛔  Не удалось завершить процессы Chrome: {", ".join(str(process.pid) for process in alive)}')
+    logger.info(f'✅  Завершено профилей Chrome: {len(durations)} из {len(chrome_processes)} за {elapsed:.1f} сек')
+
+    return durations
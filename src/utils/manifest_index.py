@@ -0,0 +1,115 @@
+import os
+import re
+import json
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+from src.utils.constants import *
+from src.utils.files import write_json_atomic, get_dir_size
+
+
+LOCALIZED_NAME_PATTERN = re.compile(r'^__MSG_(\w+)__$')
+
+
+class ManifestIndex:
+    def __init__(self, index_path: str | Path):
+        self.index_path = Path(index_path)
+        self.lock = threading.Lock()
+        self.entries = None
+        self.dirty = False
+
+    def get_info(self, manifest_path: str | Path) -> dict | None:
+        version_path = os.path.dirname(manifest_path)
+        ext_id = os.path.basename(os.path.dirname(version_path))
+        key = f"{ext_id}/{os.path.basename(version_path)}"
+
+        try:
+            mtime = os.stat(manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with self.lock:
+            self.__load()
+            entry = self.entries.get(key)
+            if entry and entry["mtime"] == mtime:
+                return entry
+
+        entry = read_manifest_info(manifest_path)
+        if not entry:
+            return None
+        entry["mtime"] = mtime
+
+        with self.lock:
+            self.entries[key] = entry
+            self.dirty = True
+
+        return entry
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.dirty:
+                return
+
+            try:
+                write_json_atomic(self.index_path, self.entries)
+                self.dirty = False
+            except OSError as e:
+                logger.debug(f'не удалось сохранить индекс манифестов, причина: {e}')
+
+    def __load(self) -> None:
+        if self.entries is not None:
+            return
+
+        try:
+            with open(self.index_path, 'r', encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+
+def read_manifest_info(manifest_path: str | Path) -> dict | None:
+    try:
+        with open(manifest_path, 'r', encoding='utf-8-sig') as file:
+            manifest = json.load(file)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    version_path = os.path.dirname(manifest_path)
+    name = resolve_localized_string(version_path, manifest, manifest.get("name", ""))
+    if not name:
+        action = manifest.get("action") or manifest.get("browser_action") or {}
+        name = resolve_localized_string(version_path, manifest, action.get("default_title", ""))
+
+    return {
+        "name": name,
+        "version": manifest.get("version", ""),
+        "permissions": manifest.get("permissions", []),
+        "size": get_dir_size(version_path)
+    }
+
+
+def resolve_localized_string(version_path: str, manifest: dict, value: str) -> str:
+    match = LOCALIZED_NAME_PATTERN.match(value or '')
+    if not match:
+        return value or ''
+
+    message_key = match.group(1).lower()
+    for locale in (manifest.get("default_locale"), "en", "en_US"):
+        if not locale:
+            continue
+
+        try:
+            with open(os.path.join(version_path, "_locales", locale, "messages.json"), 'r', encoding='utf-8-sig') as f:
+                messages = {key.lower(): data for key, data in json.load(f).items()}
+        except (json.JSONDecodeError, OSError):
+            continue
+
+        if message_key in messages:
+            return messages[message_key].get("message", "")
+
+    return ''
+
+
+manifest_index = ManifestIndex(DATA_PATH / "manifest_index.json")
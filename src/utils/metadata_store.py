@@ -0,0 +1,167 @@
+import json
+import time
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+from src.utils.constants import *
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    comment TEXT NOT NULL DEFAULT '',
+    last_launch_at REAL
+);
+CREATE INDEX IF NOT EXISTS profiles_last_launch_at ON profiles(last_launch_at);
+
+CREATE TABLE IF NOT EXISTS profile_tags (
+    profile_name TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (profile_name, tag)
+);
+CREATE INDEX IF NOT EXISTS profile_tags_tag ON profile_tags(tag);
+
+CREATE TABLE IF NOT EXISTS script_results (
+    profile_name TEXT NOT NULL,
+    script TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    finished_at REAL NOT NULL,
+    PRIMARY KEY (profile_name, script)
+);
+CREATE INDEX IF NOT EXISTS script_results_script ON script_results(script, success);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+    comment, content='profiles', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS profiles_ai AFTER INSERT ON profiles BEGIN
+    INSERT INTO comments_fts(rowid, comment) VALUES (new.rowid, new.comment);
+END;
+CREATE TRIGGER IF NOT EXISTS profiles_ad AFTER DELETE ON profiles BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, comment) VALUES ('delete', old.rowid, old.comment);
+END;
+CREATE TRIGGER IF NOT EXISTS profiles_au AFTER UPDATE OF comment ON profiles BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, comment) VALUES ('delete', old.rowid, old.comment);
+    INSERT INTO comments_fts(rowid, comment) VALUES (new.rowid, new.comment);
+END;
+"""
+
+
+class SqliteMetadataStore:
+    def __init__(self, db_path: str | Path, comments_json_path: str | Path):
+        self.db_path = Path(db_path)
+        self.comments_json_path = Path(comments_json_path)
+        self.lock = threading.Lock()
+        self.initialized = False
+
+    def get_comments(self) -> dict[str, str]:
+        with self.__connect() as conn:
+            return dict(conn.execute("SELECT name, comment FROM profiles"))
+
+    def set_comments(self, comments: dict[str, str]) -> None:
+        with self.__connect() as conn:
+            conn.executemany(
+                "INSERT INTO profiles(name, comment) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET comment = excluded.comment",
+                [(str(name), str(comment)) for name, comment in comments.items()]
+            )
+
+    def find_profiles_by_comment(self, substring: str) -> set[str]:
+        with self.__connect() as conn:
+            if len(substring) >= 3:  # trigram index can only serve substrings of 3+ chars
+                phrase = '"' + substring.replace('"', '""') + '"'
+                rows = conn.execute(
+                    "SELECT p.name FROM comments_fts f JOIN profiles p ON p.rowid = f.rowid "
+                    "WHERE comments_fts MATCH ?",
+                    (phrase,)
+                )
+            else:
+                rows = conn.execute(
+                    "SELECT name FROM profiles WHERE instr(casefold(comment), ?) > 0",
+                    (substring.casefold(),)
+                )
+
+            return {row[0] for row in rows}
+
+    def get_tags(self) -> dict[str, list[str]]:
+        tags = {}
+        with self.__connect() as conn:
+            for profile_name, tag in conn.execute("SELECT profile_name, tag FROM profile_tags ORDER BY tag"):
+                tags.setdefault(profile_name, []).append(tag)
+
+        return tags
+
+    def get_all_tags(self) -> list[str]:
+        with self.__connect() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT tag FROM profile_tags ORDER BY tag")]
+
+    def set_tags(self, profile_names: list[str], tags: list[str]) -> None:
+        with self.__connect() as conn:
+            conn.executemany("DELETE FROM profile_tags WHERE profile_name = ?", [(name,) for name in profile_names])
+            conn.executemany(
+                "INSERT OR IGNORE INTO profile_tags(profile_name, tag) VALUES (?, ?)",
+                [(name, tag) for name in profile_names for tag in tags]
+            )
+
+    def find_profiles_by_tag(self, tag: str) -> set[str]:
+        with self.__connect() as conn:
+            return {row[0] for row in conn.execute("SELECT profile_name FROM profile_tags WHERE tag = ?", (tag,))}
+
+    def record_launch(self, profile_name: str) -> None:
+        with self.__connect() as conn:
+            conn.execute(
+                "INSERT INTO profiles(name, last_launch_at) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET last_launch_at = excluded.last_launch_at",
+                (profile_name, time.time())
+            )
+
+    def record_script_result(self, profile_name: str, script: str, success: bool) -> None:
+        with self.__connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO script_results(profile_name, script, success, finished_at) VALUES (?, ?, ?, ?)",
+                (profile_name, script, int(success), time.time())
+            )
+
+    def import_comments_from_json(self, conn: sqlite3.Connection) -> int:
+        if not self.comments_json_path.exists():
+            return 0
+
+        with open(self.comments_json_path, 'r', encoding="utf-8") as f:
+            comments = json.load(f)
+
+        conn.executemany(
+            "INSERT INTO profiles(name, comment) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET comment = excluded.comment",
+            [(str(name), str(comment)) for name, comment in comments.items()]
+        )
+
+        return len(comments)
+
+    @contextmanager
+    def __connect(self):
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+            conn.create_function("casefold", 1, lambda value: (value or '').casefold(), deterministic=True)
+            self.__initialize(conn)
+
+            with conn:  # commits or rolls back the transaction
+                yield conn
+
+    def __initialize(self, conn: sqlite3.Connection) -> None:
+        with self.lock:
+            if self.initialized:
+                return
+
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.executescript(SCHEMA)
+                if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                    self.import_comments_from_json(conn)  # one-shot, on the first run only
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self.initialized = True
+
+
+metadata_store = SqliteMetadataStore(DATA_PATH / "metadata.db", DATA_PATH / "comments_for_profiles.json")
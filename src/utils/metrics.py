@@ -0,0 +1,163 @@
+import os
+import math
+import time
+import threading
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+
+from loguru import logger
+
+from src.utils.constants import *
+from src.utils.files import write_atomic, write_json_atomic
+from config import general_config
+
+
+HISTOGRAM_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+PROMETHEUS_PREFIX = "chrome_profiles_"
+
+
+class Metrics:
+    def __init__(self, metrics_path: str | Path):
+        self.metrics_path = Path(metrics_path)
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.run_name = None
+        self.run_started_at = None
+        self.run_depth = 0
+
+    def inc(self, name: str, value: int | float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: int | float, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.histograms.setdefault(key, []).append(value)
+
+    @contextmanager
+    def track(self, name: str, **labels):
+        started_at = time.perf_counter()
+        status = 'success'
+        try:
+            yield
+        except BaseException:
+            status = 'failed'
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started_at, **labels, status=status)
+
+    @contextmanager
+    def run(self, run_name: str):
+        with self.lock:
+            self.run_depth += 1
+            outermost = self.run_depth == 1
+            if outermost:  # nested runs (e.g. launch inside a script run) report into the outer one
+                self.counters, self.histograms = {}, {}
+                self.run_name, self.run_started_at = run_name, time.time()
+
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.run_depth -= 1
+
+            if outermost:
+                self.dump()
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {key: sorted(values) for key, values in self.histograms.items()}
+            run_name, run_started_at = self.run_name, self.run_started_at
+
+        finished_at = time.time()
+        return {
+            "run": run_name,
+            "started_at": datetime.fromtimestamp(run_started_at or finished_at).isoformat(timespec='seconds'),
+            "finished_at": datetime.fromtimestamp(finished_at).isoformat(timespec='seconds'),
+            "duration_sec": round(finished_at - (run_started_at or finished_at), 3),
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(counters.items())
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": len(values),
+                    "sum": round(sum(values), 3),
+                    "min": round(values[0], 3),
+                    "p50": round(get_percentile(values, 0.5), 3),
+                    "p95": round(get_percentile(values, 0.95), 3),
+                    "max": round(values[-1], 3)
+                }
+                for (name, labels), values in sorted(histograms.items())
+            ]
+        }
+
+    def dump(self) -> Path | None:
+        if not general_config['metrics_enabled']:
+            return None
+
+        snapshot = self.snapshot()
+        started_at = snapshot["started_at"].replace(':', '-')
+        run_path = self.metrics_path / f'{snapshot["run"]}_{started_at}.json'
+
+        try:
+            os.makedirs(self.metrics_path, exist_ok=True)
+            write_json_atomic(run_path, snapshot, indent=2)
+            if general_config['metrics_prometheus_file']:
+                write_atomic(self.metrics_path / "metrics.prom", self.to_prometheus())
+        except OSError as e:
+            logger.warning('⚠️ Не удалось сохранить метрики прогона')
+            logger.debug(f'не удалось сохранить метрики прогона, причина: {e}')
+            return None
+
+        logger.info(f'ℹ️ Метрики прогона сохранены в {run_path}')
+        return run_path
+
+    def to_prometheus(self) -> str:
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {key: list(values) for key, values in self.histograms.items()}
+
+        lines = []
+        for metric_name in sorted({name for name, _ in counters}):
+            lines.append(f'# TYPE {PROMETHEUS_PREFIX}{metric_name} counter')
+            for (name, labels), value in sorted(counters.items()):
+                if name == metric_name:
+                    lines.append(f'{PROMETHEUS_PREFIX}{name}{format_labels(labels)} {value}')
+
+        for metric_name in sorted({name for name, _ in histograms}):
+            lines.append(f'# TYPE {PROMETHEUS_PREFIX}{metric_name} histogram')
+            for (name, labels), values in sorted(histograms.items()):
+                if name != metric_name:
+                    continue
+
+                for bucket in HISTOGRAM_BUCKETS:
+                    bucket_count = sum(1 for value in values if value <= bucket)
+                    lines.append(f'{PROMETHEUS_PREFIX}{name}_bucket{format_labels(labels + (("le", str(bucket)),))} {bucket_count}')
+                lines.append(f'{PROMETHEUS_PREFIX}{name}_bucket{format_labels(labels + (("le", "+Inf"),))} {len(values)}')
+                lines.append(f'{PROMETHEUS_PREFIX}{name}_sum{format_labels(labels)} {sum(values)}')
+                lines.append(f'{PROMETHEUS_PREFIX}{name}_count{format_labels(labels)} {len(values)}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def get_percentile(sorted_values: list[float], quantile: float) -> float:
+    rank = max(math.ceil(quantile * len(sorted_values)), 1)  # nearest-rank
+    return sorted_values[rank - 1]
+
+
+def format_labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + '}'
+
+
+metrics = Metrics(METRICS_PATH)
@@ -0,0 +1,225 @@
+import os
+import json
+import atexit
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from src.utils.constants import *
+from src.utils.files import write_json_atomic, get_dir_size
+from config import general_config
+
+
+class ProfileCatalog:
+    def __init__(self, catalog_path: str | Path):
+        self.catalog_path = Path(catalog_path)
+        self.lock = threading.RLock()
+        self.loaded = False
+        self.dirty = False
+        self.profiles_root_mtime = None
+        self.profile_names = []
+        self.profiles = {}
+
+    def get_profile_names(self) -> list[str]:
+        with self.lock:
+            self.__load()
+
+            root_mtime = os.stat(CHROME_DATA_PATH).st_mtime_ns
+            if root_mtime != self.profiles_root_mtime:
+                with os.scandir(CHROME_DATA_PATH) as entries:
+                    self.profile_names = [
+                        entry.name.replace('Profile ', '', 1)
+                        for entry in entries
+                        if entry.name.startswith("Profile") and entry.is_dir()
+                    ]
+
+                for name in set(self.profiles) - set(self.profile_names):
+                    del self.profiles[name]
+
+                self.profiles_root_mtime = root_mtime
+                self.dirty = True
+
+            self.__save()
+            return list(self.profile_names)
+
+    def get_profiles(self, profile_names: list[str | int]) -> dict[str, dict]:
+        with self.lock:  # refreshed entries are written by save() at the end of a batch or on exit
+            self.__load()
+            entries = {str(name): self.__refresh_profile(str(name)) for name in profile_names}
+            return {name: entry for name, entry in entries.items() if entry}
+
+    def get_profile_sizes(self, profile_names: list[str | int]) -> dict[str, int]:
+        with self.lock:
+            sizes = {name: entry["size"] for name, entry in self.get_profiles(profile_names).items()}
+
+        stale_names = [name for name, size in sizes.items() if size is None]
+        if stale_names:
+            with ThreadPoolExecutor(max_workers=general_config['max_workers']) as executor:
+                computed = dict(zip(stale_names, executor.map(
+                    lambda name: get_dir_size(CHROME_DATA_PATH / f"Profile {name}"), stale_names
+                )))
+
+            with self.lock:
+                for name, size in computed.items():
+                    if name in self.profiles:
+                        self.profiles[name]["size"] = size
+                        self.dirty = True
+                self.__save()
+
+            sizes.update(computed)
+
+        return sizes
+
+    def save(self) -> None:
+        with self.lock:
+            self.__save()
+
+    def __refresh_profile(self, profile_name: str) -> dict | None:
+        root_path = CHROME_DATA_PATH / f"Profile {profile_name}"
+        try:
+            root_mtime = os.stat(root_path).st_mtime_ns
+        except FileNotFoundError:
+            if self.profiles.pop(profile_name, None):
+                self.dirty = True
+            return None
+
+        entry = self.profiles.get(profile_name)
+        if entry and entry["root_mtime"] != root_mtime:
+            sharded = os.path.isdir(root_path / SHARDED_PROFILE_DIRECTORY)
+            if sharded == entry["sharded"]:  # only top level files changed, e.g. Local State
+                entry["root_mtime"] = root_mtime
+                entry["size"] = None
+                self.dirty = True
+            else:
+                entry = None
+
+        if not entry:
+            sharded = os.path.isdir(root_path / SHARDED_PROFILE_DIRECTORY)
+            profile_path = root_path / SHARDED_PROFILE_DIRECTORY if sharded else root_path
+            entry = {
+                "root_mtime": root_mtime,
+                "sharded": sharded,
+                "path": str(profile_path),
+                "profile_mtime": None,
+                "has_preferences": False,
+                "extensions_mtime": None,
+                "extensions": {},
+                "extension_settings_mtime": None,
+                "extension_settings": [],
+                "size": None
+            }
+            self.profiles[profile_name] = entry
+            self.dirty = True
+
+        profile_path = entry["path"]
+        profile_mtime = get_mtime(profile_path)
+        if profile_mtime != entry["profile_mtime"]:
+            entry["profile_mtime"] = profile_mtime
+            entry["has_preferences"] = os.path.isfile(os.path.join(profile_path, "Preferences"))
+            entry["size"] = None
+            self.dirty = True
+
+        self.__refresh_extensions(entry)
+        self.__refresh_extension_settings(entry)
+
+        return entry
+
+    def __refresh_extensions(self, entry: dict) -> None:
+        extensions_path = os.path.join(entry["path"], "Extensions")
+        extensions_mtime = get_mtime(extensions_path)
+
+        if extensions_mtime != entry["extensions_mtime"]:
+            ext_ids = list_subdirs(extensions_path)
+            entry["extensions"] = {ext_id: entry["extensions"].get(ext_id, {"mtime": None, "versions": []}) for ext_id in ext_ids}
+            entry["extensions_mtime"] = extensions_mtime
+            entry["size"] = None
+            self.dirty = True
+
+        for ext_id, ext_info in entry["extensions"].items():
+            ext_path = os.path.join(extensions_path, ext_id)
+            ext_mtime = get_mtime(ext_path)
+            if ext_mtime == ext_info["mtime"]:
+                continue
+
+            ext_info["mtime"] = ext_mtime
+            ext_info["versions"] = [
+                version for version in list_subdirs(ext_path)
+                if os.path.isfile(os.path.join(ext_path, version, "manifest.json"))
+            ]
+            entry["size"] = None
+            self.dirty = True
+
+    def __refresh_extension_settings(self, entry: dict) -> None:
+        settings_path = os.path.join(entry["path"], "Local Extension Settings")
+        settings_mtime = get_mtime(settings_path)
+
+        if settings_mtime != entry["extension_settings_mtime"]:
+            entry["extension_settings"] = list_subdirs(settings_path)
+            entry["extension_settings_mtime"] = settings_mtime
+            self.dirty = True
+
+    def __load(self) -> None:
+        if self.loaded:
+            return
+
+        self.loaded = True
+        try:
+            with open(self.catalog_path, 'r', encoding="utf-8") as f:
+                data = json.load(f)
+
+            self.profiles_root_mtime = data["profiles_root_mtime"]
+            self.profile_names = data["profile_names"]
+            self.profiles = data["profiles"]
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.debug(f'каталог профилей поврежден и будет пересобран, причина: {e}')
+
+    def __save(self) -> None:
+        if not self.dirty:
+            return
+
+        data = {
+            "profiles_root_mtime": self.profiles_root_mtime,
+            "profile_names": self.profile_names,
+            "profiles": self.profiles
+        }
+
+        try:
+            write_json_atomic(self.catalog_path, data)
+            self.dirty = False
+        except OSError as e:
+            logger.debug(f'не удалось сохранить каталог профилей, причина: {e}')
+
+
+def get_extension_paths(entry: dict) -> list[str]:
+    if not entry:
+        return []
+
+    extensions_path = os.path.join(entry["path"], "Extensions")
+    return [
+        os.path.join(extensions_path, ext_id, version)
+        for ext_id, ext_info in entry["extensions"].items()
+        for version in ext_info["versions"]
+    ]
+
+
+def get_mtime(path: str | Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def list_subdirs(path: str | Path) -> list[str]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+profile_catalog = ProfileCatalog(DATA_PATH / "profile_catalog.json")
+atexit.register(profile_catalog.save)
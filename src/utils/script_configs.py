@@ -0,0 +1,105 @@
+import os
+import json
+from pathlib import Path
+from types import MappingProxyType
+
+
+RUN_DELAY_SCHEMA = {
+    "run_delay_sec": (int, float)
+}
+
+PACING_SCHEMA = {  # optional per-script override of the script_* pacing settings in config.py
+    "click_delay_sec": (int, float),
+    "wait_timeout_sec": (int, float),
+    "poll_interval_sec": (int, float)
+}
+
+
+def load_script_configs(scripts_data_path: str | Path,
+                        scripts: dict[str, dict],
+                        scripts_list: list[str]) -> tuple[dict[str, MappingProxyType | None], list[str]]:
+    configs, errors = {}, []
+    for script in scripts_list:
+        schema = scripts[script].get('config_schema')
+        if schema is None:
+            configs[script] = None
+            continue
+
+        config_path = os.path.join(scripts_data_path, script, 'config.json')
+        try:
+            with open(config_path, 'r', encoding="utf-8") as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            errors.append(f'{script} - не найден файл {config_path}')
+            continue
+        except (OSError, json.JSONDecodeError) as e:
+            errors.append(f'{script} - не удалось прочитать config.json ({e})')
+            continue
+
+        config_errors = validate_config(config, schema)
+        if isinstance(config, dict) and "pacing" in config:
+            config_errors.extend(validate_pacing(config["pacing"]))
+        if config_errors:
+            errors.extend(f'{script} - config.json: {error}' for error in config_errors)
+            continue
+
+        configs[script] = freeze(config)
+
+    return configs, errors
+
+
+def validate_config(value, schema, path: str = "") -> list[str]:
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            return [f'{path or "config"} должен быть объектом']
+
+        errors = []
+        for key, key_schema in schema.items():
+            if key not in value:
+                errors.append(f'отсутствует ключ {path}{key}')
+            else:
+                errors.extend(validate_config(value[key], key_schema, f'{path}{key}.'))
+        return errors
+
+    if isinstance(schema, list):
+        if not isinstance(value, list):
+            return [f'{path.rstrip(".")} должен быть списком']
+
+        errors = []
+        for index, item in enumerate(value):
+            errors.extend(validate_config(item, schema[0], f'{path.rstrip(".")}[{index}].'))
+        return errors
+
+    expected_types = schema if isinstance(schema, tuple) else (schema,)
+    if type(value) not in expected_types:  # bool is a subclass of int, compare exact types
+        expected = ' или '.join(expected_type.__name__ for expected_type in expected_types)
+        return [f'{path.rstrip(".")} должен быть {expected}, получено {type(value).__name__}']
+
+    return []
+
+
+def validate_pacing(pacing) -> list[str]:
+    if not isinstance(pacing, dict):
+        return ['pacing должен быть объектом']
+
+    errors = []
+    for key, value in pacing.items():
+        if key not in PACING_SCHEMA:
+            errors.append(f'неизвестный ключ pacing.{key}, допустимы: {", ".join(PACING_SCHEMA)}')
+            continue
+
+        value_errors = validate_config(value, PACING_SCHEMA[key], f'pacing.{key}.')
+        if not value_errors and value < 0:
+            value_errors = [f'pacing.{key} не может быть отрицательным']
+        errors.extend(value_errors)
+
+    return errors  # keys may be omitted, use_pacing() fills them from config.py
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+
+    return value
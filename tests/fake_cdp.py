@@ -0,0 +1,117 @@
+import json
+import base64
+import struct
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+# Minimal DevTools endpoint: /json/* over HTTP and one page websocket. Every CDP method
+# is answered by a handler from `handlers` (params -> result), received commands are kept in `calls`
+class FakeCdpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, handlers: dict | None = None):
+        super().__init__(('127.0.0.1', 0), FakeCdpHandler)
+        self.handlers = handlers or {}
+        self.calls = []
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        return f'127.0.0.1:{self.server_address[1]}'
+
+    def methods(self) -> list[str]:
+        return [method for method, _ in self.calls]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+    def dispatch(self, message: dict) -> dict:
+        self.calls.append((message['method'], message['params']))
+        handler = self.handlers.get(message['method'], lambda params: {})
+        result = handler(message['params'])
+        if 'error' in result:
+            return {'id': message['id'], 'error': result['error']}
+
+        return {'id': message['id'], 'result': result}
+
+
+class FakeCdpHandler(BaseHTTPRequestHandler):
+    server: FakeCdpServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.headers.get('Upgrade', '').lower() == 'websocket':
+            return self.serve_websocket()
+
+        if self.path == '/json/list':
+            body = json.dumps([{
+                'id': 'page-1',
+                'type': 'page',
+                'url': 'about:blank',
+                'webSocketDebuggerUrl': f'ws://{self.server.address}/devtools/page/page-1'
+            }])
+        elif self.path == '/json/version':
+            body = json.dumps({'webSocketDebuggerUrl': f'ws://{self.server.address}/devtools/browser/1'})
+        else:
+            body = 'ok'
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    def serve_websocket(self):
+        accept = base64.b64encode(
+            hashlib.sha1((self.headers['Sec-WebSocket-Key'] + WEBSOCKET_GUID).encode()).digest()
+        ).decode()
+        self.send_response(101)
+        self.send_header('Upgrade', 'websocket')
+        self.send_header('Connection', 'Upgrade')
+        self.send_header('Sec-WebSocket-Accept', accept)
+        self.end_headers()
+
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return
+
+            reply = self.server.dispatch(json.loads(frame))
+            self.write_frame(json.dumps(reply).encode('utf-8'))
+
+    def read_frame(self) -> str | None:
+        header = self.rfile.read(2)
+        if len(header) < 2 or header[0] & 0x0f == 0x8:  # closed or close frame
+            return None
+
+        length = header[1] & 0x7f
+        if length == 126:
+            length = struct.unpack('>H', self.rfile.read(2))[0]
+        elif length == 127:
+            length = struct.unpack('>Q', self.rfile.read(8))[0]
+
+        mask = self.rfile.read(4)
+        payload = self.rfile.read(length)
+        return bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload)).decode('utf-8')
+
+    def write_frame(self, payload: bytes) -> None:
+        if len(payload) < 126:
+            header = struct.pack('>BB', 0x81, len(payload))
+        elif len(payload) < 2 ** 16:
+            header = struct.pack('>BBH', 0x81, 126, len(payload))
+        else:
+            header = struct.pack('>BBQ', 0x81, 127, len(payload))
+
+        self.wfile.write(header + payload)
+        self.wfile.flush()
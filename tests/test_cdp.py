@@ -0,0 +1,92 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from src.chrome.cdp import CdpDriver, CdpElement
+from tests.fake_cdp import FakeCdpServer
+
+
+def value(result):
+    return {'result': {'type': type(result).__name__, 'value': result}}
+
+
+def test_get_waits_for_the_new_document_to_commit():
+    frame_tree_calls = []
+
+    def get_frame_tree(params):
+        frame_tree_calls.append(params)
+        loader_id = 'new-loader' if len(frame_tree_calls) > 3 else 'old-loader'
+        return {'frameTree': {'frame': {'id': 'frame', 'loaderId': loader_id}}}
+
+    handlers = {
+        'Page.navigate': lambda params: {'frameId': 'frame', 'loaderId': 'new-loader'},
+        'Page.getFrameTree': get_frame_tree,
+        'Runtime.evaluate': lambda params: value('complete')  # the old page is already 'complete'
+    }
+
+    with FakeCdpServer(handlers) as server:
+        CdpDriver(server.address).get('https://example.com')
+
+    assert len(frame_tree_calls) == 4
+    assert server.methods()[-1] == 'Runtime.evaluate'
+
+
+def test_document_level_calls_take_one_round_trip():
+    handlers = {'Runtime.evaluate': lambda params: value('https://example.com/')}
+
+    with FakeCdpServer(handlers) as server:
+        driver = CdpDriver(server.address)
+        assert driver.current_url == 'https://example.com/'
+        assert driver.execute_script('return arguments[0] + 1;', 41) == 'https://example.com/'
+
+    assert server.methods() == ['Runtime.evaluate', 'Runtime.evaluate']
+    assert server.calls[1][1]['expression'].endswith('.apply(window, [41])')
+
+
+def test_find_element_resolves_nodes_from_the_document():
+    handlers = {
+        'Runtime.evaluate': lambda params: {'result': {'type': 'object', 'subtype': 'array', 'objectId': 'array-1'}},
+        'Runtime.getProperties': lambda params: {'result': [
+            {'name': 'length', 'value': {'type': 'number', 'value': 1}},
+            {'name': '0', 'value': {'type': 'object', 'subtype': 'node', 'objectId': 'node-1'}}
+        ]}
+    }
+
+    with FakeCdpServer(handlers) as server:
+        element = CdpDriver(server.address).find_element(By.CSS_SELECTOR, 'select')
+
+    assert isinstance(element, CdpElement)
+    assert element.id == 'node-1'
+    assert server.methods() == ['Runtime.evaluate', 'Runtime.getProperties']
+
+
+def test_click_on_option_is_done_in_js_without_mouse_events():
+    handlers = {'Runtime.callFunctionOn': lambda params: {'result': {'type': 'object', 'subtype': 'null', 'value': None}}}
+
+    with FakeCdpServer(handlers) as server:
+        CdpElement(CdpDriver(server.address), 'option-1').click()
+
+    assert 'Input.dispatchMouseEvent' not in server.methods()
+    assert 'HTMLOptionElement' in server.calls[0][1]['functionDeclaration']
+
+
+def test_click_on_visible_element_dispatches_mouse_press_and_release():
+    def call_function_on(params):
+        if params.get('returnByValue'):
+            return value({'x': 10, 'y': 20})
+        return {'result': {'type': 'object', 'objectId': 'point-1'}}
+
+    with FakeCdpServer({'Runtime.callFunctionOn': call_function_on}) as server:
+        CdpElement(CdpDriver(server.address), 'button-1').click()
+
+    mouse_events = [params for method, params in server.calls if method == 'Input.dispatchMouseEvent']
+    assert [(i['type'], i['x'], i['y']) for i in mouse_events] == [('mousePressed', 10, 20), ('mouseReleased', 10, 20)]
+
+
+def test_detached_objects_raise_stale_element_reference():
+    handlers = {'Runtime.callFunctionOn': lambda params: {'error': {'message': 'Could not find object with given id'}}}
+
+    with FakeCdpServer(handlers) as server:
+        element = CdpElement(CdpDriver(server.address), 'node-1')
+        with pytest.raises(StaleElementReferenceException):
+            element.is_selected()
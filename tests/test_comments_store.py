@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from src.utils.comments_store import CommentsStore
+
+
+def test_update_merges_changes_and_keeps_the_cache_fresh(tmp_path):
+    file_path = tmp_path / "comments.json"
+    file_path.write_text(json.dumps({"1": "farm"}), encoding="utf-8")
+    store = CommentsStore(file_path)
+
+    store.update({"2": "основной"})
+
+    assert store.load() == {"1": "farm", "2": "основной"}
+    assert json.loads(file_path.read_text(encoding="utf-8")) == {"1": "farm", "2": "основной"}
+
+
+def test_external_edits_are_picked_up(tmp_path):
+    file_path = tmp_path / "comments.json"
+    file_path.write_text(json.dumps({"1": "farm"}), encoding="utf-8")
+    store = CommentsStore(file_path)
+    assert store.load() == {"1": "farm"}
+
+    file_path.write_text(json.dumps({"1": "edited by hand"}), encoding="utf-8")
+    os.utime(file_path, ns=(0, 1))  # make sure the mtime differs on coarse clocks
+
+    assert store.load() == {"1": "edited by hand"}
+
+
+def test_load_returns_a_copy(tmp_path):
+    file_path = tmp_path / "comments.json"
+    file_path.write_text("{}", encoding="utf-8")
+    store = CommentsStore(file_path)
+
+    store.load()["1"] = "not saved"
+
+    assert store.load() == {}
+
+
+def test_missing_file_is_reported(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CommentsStore(tmp_path / "comments.json").load()
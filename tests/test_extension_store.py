@@ -0,0 +1,43 @@
+import os
+
+from src.utils.extension_store import ExtensionStore
+
+
+def make_extension(path, files: dict[str, bytes]) -> None:
+    for rel_path, content in files.items():
+        file_path = path / rel_path
+        os.makedirs(file_path.parent, exist_ok=True)
+        file_path.write_bytes(content)
+
+
+def test_only_repeated_installs_count_as_saved(tmp_path):
+    make_extension(tmp_path / "src", {"manifest.json": b"{}" * 50, "js/app.js": b"x" * 1000})
+    store = ExtensionStore(tmp_path / "store")
+
+    assert store.install("abc", tmp_path / "src", tmp_path / "profile_1") == 0
+    assert store.install("abc", tmp_path / "src", tmp_path / "profile_2") == 1100
+
+    assert (tmp_path / "profile_2" / "js" / "app.js").read_bytes() == b"x" * 1000
+    assert len(list((tmp_path / "store" / "blobs").glob("*/*"))) == 2
+
+
+def test_duplicate_files_in_one_extension_are_stored_once(tmp_path):
+    make_extension(tmp_path / "src", {"a/icon.png": b"i" * 300, "b/icon.png": b"i" * 300})
+    store = ExtensionStore(tmp_path / "store")
+
+    assert store.install("abc", tmp_path / "src", tmp_path / "profile_1") == 300
+    assert len(list((tmp_path / "store" / "blobs").glob("*/*"))) == 1
+
+
+def test_gc_removes_blobs_of_unused_extensions(tmp_path):
+    make_extension(tmp_path / "src_a", {"manifest.json": b"a" * 10})
+    make_extension(tmp_path / "src_b", {"manifest.json": b"b" * 20})
+    store = ExtensionStore(tmp_path / "store")
+    store.install("a", tmp_path / "src_a", tmp_path / "profile_1" / "a")
+    store.install("b", tmp_path / "src_b", tmp_path / "profile_1" / "b")
+
+    removed_files, _ = store.gc(["a"])
+
+    assert removed_files == 1
+    assert (tmp_path / "profile_1" / "b" / "manifest.json").read_bytes() == b"b" * 20
+    assert len(list((tmp_path / "store" / "blobs").glob("*/*"))) == 1
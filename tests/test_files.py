@@ -0,0 +1,27 @@
+import json
+import os
+
+import pytest
+
+from src.utils.files import write_json_atomic, get_dir_size
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    file_path = tmp_path / "data.json"
+    write_json_atomic(file_path, {"a": "б"})
+
+    with pytest.raises(TypeError):
+        write_json_atomic(file_path, {"a": object()})
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == {"a": "б"}
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_dir_size_skips_symlinks(tmp_path):
+    os.makedirs(tmp_path / "a" / "b")
+    (tmp_path / "a" / "one").write_bytes(b"x" * 10)
+    (tmp_path / "a" / "b" / "two").write_bytes(b"x" * 5)
+    os.symlink(tmp_path / "a" / "one", tmp_path / "a" / "link")
+
+    assert get_dir_size(tmp_path / "a") == 15
+    assert get_dir_size(tmp_path / "missing") == 0
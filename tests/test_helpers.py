@@ -0,0 +1,30 @@
+import os
+
+from src.utils.helpers import empty_trash, empty_trash_in_background
+
+
+def test_empty_trash_reports_only_bytes_actually_freed(tmp_path):
+    store_blob = tmp_path / "store_blob"
+    store_blob.write_bytes(b"s" * 500)
+
+    trashed_path = tmp_path / "trash" / "1"
+    os.makedirs(trashed_path / "nested")
+    (trashed_path / "nested" / "own.js").write_bytes(b"o" * 200)
+    os.link(store_blob, trashed_path / "linked.js")  # still referenced by the store after deletion
+
+    assert empty_trash([str(trashed_path)]) == 200
+    assert not trashed_path.exists()
+    assert store_blob.exists()
+
+
+def test_background_trash_deletion(tmp_path):
+    trashed_paths = {}
+    for profile in ("1", "2"):
+        trashed_path = tmp_path / "trash" / profile
+        os.makedirs(trashed_path)
+        (trashed_path / "file").write_bytes(b"x" * 10)
+        trashed_paths[profile] = [str(trashed_path)]
+
+    empty_trash_in_background(trashed_paths).join(10)
+
+    assert not any((tmp_path / "trash").iterdir())
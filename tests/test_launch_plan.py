@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+import src.chrome.launch_plan as launch_plan_module
+import src.utils.profile_catalog as profile_catalog_module
+from src.chrome.launch_plan import LaunchPlanCache
+from src.utils.profile_catalog import ProfileCatalog
+
+
+def add_extension(profile_path, ext_id: str, version: str) -> None:
+    os.makedirs(profile_path / "Extensions" / ext_id / version)
+    (profile_path / "Extensions" / ext_id / version / "manifest.json").write_text("{}")
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    root = tmp_path / "profiles"
+    for name in ("1", "2", "3"):
+        add_extension(root / f"Profile {name}", "abc", "1.0")
+
+    template_path = tmp_path / "template.html"
+    template_path.write_text("<title>{{ profile_name }}</title>")
+
+    catalog = ProfileCatalog(tmp_path / "catalog.json")
+    monkeypatch.setattr(profile_catalog_module, "CHROME_DATA_PATH", root)
+    monkeypatch.setattr(launch_plan_module, "profile_catalog", catalog)
+    monkeypatch.setattr(launch_plan_module, "PROFILE_WELCOME_PAGE_TEMPLATE_PATH", template_path)
+    monkeypatch.setattr(launch_plan_module, "PROFILE_WELCOME_PAGES_OUTPUT_PATH", tmp_path / "pages")
+    return catalog
+
+
+def test_prebuild_reads_the_catalog_and_writes_plans_once(tmp_path, catalog, monkeypatch):
+    catalog_calls, plan_saves = [], []
+    get_profiles = catalog.get_profiles
+    monkeypatch.setattr(catalog, "get_profiles", lambda names: catalog_calls.append(names) or get_profiles(names))
+    plans = LaunchPlanCache(tmp_path / "plans.json")
+    save = plans.save
+    monkeypatch.setattr(plans, "save", lambda: plan_saves.append(1) or save())
+
+    plans.prebuild(["1", "2", "3"])
+
+    assert len(catalog_calls) == 1
+    assert len(plan_saves) == 1
+    assert (tmp_path / "pages" / "2.html").read_text() == "<title>2</title>"
+
+    plan = LaunchPlanCache(tmp_path / "plans.json").get_plan("1")
+    assert plan["extension_paths"] == [os.path.join(catalog.get_profiles(["1"])["1"]["path"], "Extensions", "abc", "1.0")]
+    assert len(plan_saves) == 1
+
+
+def test_plan_is_rebuilt_when_extensions_change(tmp_path, catalog):
+    plans = LaunchPlanCache(tmp_path / "plans.json")
+    signature = plans.get_plan("1")["extensions_signature"]
+
+    add_extension(tmp_path / "profiles" / "Profile 1", "def", "2.0")
+
+    plan = plans.get_plan("1")
+    assert plan["extensions_signature"] != signature
+    assert len(plan["extension_paths"]) == 2
+
+
+def test_single_plan_lookups_do_not_rewrite_the_catalog(tmp_path, catalog, monkeypatch):
+    plans = LaunchPlanCache(tmp_path / "plans.json")
+    plans.prebuild(["1", "2", "3"])
+
+    writes = []
+    monkeypatch.setattr(profile_catalog_module, "write_json_atomic", lambda *args: writes.append(args))
+    for i in range(50):
+        os.utime(tmp_path / "profiles" / "Profile 1", ns=(i, i))  # every Chrome session touches the profile dir
+        plans.get_plan("1")
+
+    assert writes == []
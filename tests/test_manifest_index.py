@@ -0,0 +1,54 @@
+import json
+import os
+
+from src.utils.manifest_index import ManifestIndex, read_manifest_info
+
+
+def make_extension(version_path, manifest: dict, locales: dict[str, dict] | None = None) -> None:
+    os.makedirs(version_path)
+    (version_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    for locale, messages in (locales or {}).items():
+        os.makedirs(version_path / "_locales" / locale)
+        (version_path / "_locales" / locale / "messages.json").write_text(json.dumps(messages), encoding="utf-8")
+
+
+def test_name_is_resolved_from_the_default_locale_case_insensitively(tmp_path):
+    version_path = tmp_path / "abc" / "1.0"
+    make_extension(version_path, {"name": "__MSG_extName__", "version": "1.0", "default_locale": "ru"}, {
+        "ru": {"EXTNAME": {"message": "Кошелек"}},
+        "en": {"extName": {"message": "Wallet"}}
+    })
+
+    assert read_manifest_info(version_path / "manifest.json")["name"] == "Кошелек"
+
+
+def test_name_falls_back_to_english_and_action_title(tmp_path):
+    version_path = tmp_path / "abc" / "1.0"
+    make_extension(version_path, {
+        "name": "__MSG_missing__",
+        "default_locale": "de",
+        "action": {"default_title": "__MSG_title__"}
+    }, {"en": {"title": {"message": "Proxy"}}})
+
+    assert read_manifest_info(version_path / "manifest.json")["name"] == "Proxy"
+
+
+def test_unresolved_placeholder_gives_an_empty_name(tmp_path):
+    version_path = tmp_path / "abc" / "1.0"
+    make_extension(version_path, {"name": "__MSG_extName__"})
+
+    assert read_manifest_info(version_path / "manifest.json")["name"] == ""
+
+
+def test_index_rereads_only_changed_manifests(tmp_path):
+    version_path = tmp_path / "abc" / "1.0"
+    make_extension(version_path, {"name": "Old", "version": "1.0"})
+    index = ManifestIndex(tmp_path / "index.json")
+    assert index.get_info(version_path / "manifest.json")["name"] == "Old"
+    index.save()
+
+    (version_path / "manifest.json").write_text(json.dumps({"name": "New"}), encoding="utf-8")
+    os.utime(version_path / "manifest.json", ns=(0, 1))
+
+    assert ManifestIndex(tmp_path / "index.json").get_info(version_path / "manifest.json")["name"] == "New"
+    assert index.get_info(tmp_path / "missing" / "1.0" / "manifest.json") is None
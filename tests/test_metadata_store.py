@@ -0,0 +1,42 @@
+import json
+
+from src.utils.metadata_store import SqliteMetadataStore
+
+
+def make_store(tmp_path, comments: dict | None = None) -> SqliteMetadataStore:
+    comments_json_path = tmp_path / "comments_for_profiles.json"
+    if comments is not None:
+        comments_json_path.write_text(json.dumps(comments), encoding="utf-8")
+
+    return SqliteMetadataStore(tmp_path / "metadata.db", comments_json_path)
+
+
+def test_comments_are_imported_from_json_once(tmp_path):
+    store = make_store(tmp_path, {"1": "farm", "2": "main"})
+    assert store.get_comments() == {"1": "farm", "2": "main"}
+
+    (tmp_path / "comments_for_profiles.json").write_text(json.dumps({"3": "late"}), encoding="utf-8")
+    assert store.get_comments() == {"1": "farm", "2": "main"}
+    assert make_store(tmp_path).get_comments() == {"1": "farm", "2": "main"}
+
+
+def test_comment_search_uses_fts_and_short_substrings(tmp_path):
+    store = make_store(tmp_path)
+    store.set_comments({"1": "Binance farm", "2": "OKX main", "3": "binance main"})
+    store.set_comments({"2": "OKX farm"})  # update keeps the index in sync
+
+    assert store.find_profiles_by_comment("inanc") == {"1", "3"}
+    assert store.find_profiles_by_comment("farm") == {"1", "2"}
+    assert store.find_profiles_by_comment("main") == {"3"}
+    assert store.find_profiles_by_comment("ok") == {"2"}  # below the trigram length, case-insensitive scan
+    assert store.find_profiles_by_comment('"quoted"') == set()
+
+
+def test_tags_are_replaced_per_profile(tmp_path):
+    store = make_store(tmp_path)
+    store.set_tags(["1", "2"], ["farm", "eu"])
+    store.set_tags(["2"], ["us"])
+
+    assert store.get_tags() == {"1": ["eu", "farm"], "2": ["us"]}
+    assert store.get_all_tags() == ["eu", "farm", "us"]
+    assert store.find_profiles_by_tag("farm") == {"1"}
@@ -0,0 +1,61 @@
+import sys
+
+import src.chrome.chrome as chrome_module
+from src.chrome.chrome import Chrome
+from src.chrome.process_registry import ProcessRegistry
+from src.utils.metrics import Metrics, get_percentile, format_labels
+
+
+def test_percentiles_use_nearest_rank():
+    values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    assert get_percentile(values, 0.5) == 5
+    assert get_percentile(values, 0.95) == 10
+    assert get_percentile([3], 0.0) == 3
+
+
+def test_prometheus_rendering(tmp_path):
+    metrics = Metrics(tmp_path)
+    metrics.inc('launches_total', status='success')
+    metrics.inc('launches_total', 2, status='failed')
+    for value in (0.2, 3, 700):
+        metrics.observe('launch_ready_seconds', value, launch='first')
+
+    lines = metrics.to_prometheus().splitlines()
+
+    assert lines[:3] == [
+        '# TYPE chrome_profiles_launches_total counter',
+        'chrome_profiles_launches_total{status="failed"} 2',
+        'chrome_profiles_launches_total{status="success"} 1'
+    ]
+    assert '# TYPE chrome_profiles_launch_ready_seconds histogram' in lines
+    assert 'chrome_profiles_launch_ready_seconds_bucket{launch="first",le="0.25"} 1' in lines
+    assert 'chrome_profiles_launch_ready_seconds_bucket{launch="first",le="5"} 2' in lines
+    assert 'chrome_profiles_launch_ready_seconds_bucket{launch="first",le="600"} 2' in lines
+    assert 'chrome_profiles_launch_ready_seconds_bucket{launch="first",le="+Inf"} 3' in lines
+    assert 'chrome_profiles_launch_ready_seconds_count{launch="first"} 3' in lines
+
+
+def test_label_values_are_escaped():
+    assert format_labels(()) == ''
+    assert format_labels((("profile", 'a"b\\c\nd'),)) == '{profile="a\\"b\\\\c\\nd"}'
+
+
+def test_every_launch_records_its_latency(tmp_path, monkeypatch):
+    metrics = Metrics(tmp_path)
+    monkeypatch.setattr(chrome_module, "metrics", metrics)
+    monkeypatch.setattr(chrome_module, "process_registry", ProcessRegistry(tmp_path / "registry.json"))
+    monkeypatch.setattr(chrome_module, "record_profile_launch", lambda profile_name: None)
+    monkeypatch.setattr(chrome_module, "is_profile_sharded", lambda profile_name: True)
+    monkeypatch.setattr(chrome_module, "CHROME_PATH", sys.executable)
+    chrome = Chrome()
+
+    monkeypatch.setattr(chrome, "_Chrome__create_launch_flags", lambda *args: ['-c', 'pass'])
+    chrome.launch_profile("1").wait()
+
+    monkeypatch.setattr(chrome, "_Chrome__create_launch_flags", lambda *args: 1 / 0)
+    assert chrome.launch_profile("2") is None
+
+    histograms = {dict(labels)["status"]: values for (name, labels), values in metrics.histograms.items()
+                  if name == 'launch_seconds'}
+    assert len(histograms["success"]) == 1 and len(histograms["failed"]) == 1
@@ -0,0 +1,65 @@
+import socket
+
+from src.chrome.port_pool import DebugPortPool
+
+
+def is_port_free(port: int) -> bool:
+    with socket.socket() as sock:
+        try:
+            sock.bind(('127.0.0.1', port))
+            return True
+        except OSError:
+            return False
+
+
+def get_free_port_range(size: int) -> tuple[int, int]:
+    while True:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            start_port = min(sock.getsockname()[1], 65535 - size)
+
+        if all(is_port_free(port) for port in range(start_port, start_port + size)):
+            return start_port, start_port + size - 1
+
+
+def test_leases_are_unique_and_released_ports_are_reused():
+    start_port, end_port = get_free_port_range(2)
+    pool = DebugPortPool(start_port, end_port)
+
+    ports = {pool.lease("1"), pool.lease("2")}
+    assert None not in ports and len(ports) == 2
+    assert pool.lease("3") is None
+    assert pool.leased_count() == 2
+
+    pool.release(start_port)
+    pool.release(start_port)  # double release does not duplicate the port
+    assert pool.lease("3") == start_port
+    assert pool.lease("4") is None
+
+    for port in (start_port, end_port):
+        pool.release(port)
+
+
+def test_reserved_port_is_freed_for_chrome_on_unbind():
+    start_port, end_port = get_free_port_range(1)
+    pool = DebugPortPool(start_port, end_port)
+    port = pool.lease("1")
+
+    with socket.socket() as sock:
+        pool.unbind(port)
+        sock.bind(('127.0.0.1', port))  # the browser can bind it now
+
+    assert pool.leased_count() == 1
+    pool.release(port)
+    assert pool.leased_count() == 0
+
+
+def test_port_taken_by_another_process_is_skipped():
+    start_port, end_port = get_free_port_range(2)
+    pool = DebugPortPool(start_port, end_port)
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', start_port))
+        assert pool.lease("1") == end_port
+
+    pool.release(end_port)
@@ -0,0 +1,43 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import src.manager.preferences_patcher as patcher_module
+from src.manager.preferences_patcher import patch_profiles_preferences
+
+
+PATCHES = [(["browser", "has_seen_welcome_page"], True), (["signin", "allowed"], False)]
+
+
+@pytest.fixture
+def profiles_root(tmp_path, monkeypatch):
+    for name in ("1", "2"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "Preferences").write_text(json.dumps({"signin": {"allowed": True}}), encoding="utf-8")
+
+    monkeypatch.setattr(patcher_module, "get_profile_path", lambda name: tmp_path / str(name))
+    monkeypatch.setattr(patcher_module, "get_profile_user_data_dir", lambda name: tmp_path / str(name))
+    monkeypatch.setattr(patcher_module, "is_user_data_dir_in_use", lambda path: False)
+    return tmp_path
+
+
+def test_single_profile_is_patched_without_a_process_pool(profiles_root, monkeypatch):
+    monkeypatch.setattr(patcher_module, "ProcessPoolExecutor", None)
+
+    assert patch_profiles_preferences(["1"], PATCHES)["1"]["status"] == "patched"
+    assert patch_profiles_preferences(["1"], PATCHES)["1"]["status"] == "unchanged"
+
+    preferences = json.loads((profiles_root / "1" / "Preferences").read_text(encoding="utf-8"))
+    assert preferences == {"signin": {"allowed": False}, "browser": {"has_seen_welcome_page": True}}
+
+
+def test_batch_reports_every_profile(profiles_root, monkeypatch):
+    monkeypatch.setattr(patcher_module, "ProcessPoolExecutor", ThreadPoolExecutor)  # no fork in the test runner
+    monkeypatch.setattr(patcher_module, "is_user_data_dir_in_use", lambda path: path.name == "2")
+
+    results = patch_profiles_preferences(["1", "2", "3"], PATCHES)
+
+    assert {name: result["status"] for name, result in results.items()} == {
+        "1": "patched", "2": "running", "3": "missing"
+    }
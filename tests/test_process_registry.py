@@ -0,0 +1,73 @@
+import sys
+import subprocess
+
+import psutil
+import pytest
+
+import src.chrome.process_registry as process_registry_module
+from src.chrome.process_registry import ProcessRegistry
+
+
+BROWSER_WITH_HELPER = "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)"
+
+
+@pytest.fixture
+def browser():
+    process = subprocess.Popen([sys.executable, '-c', BROWSER_WITH_HELPER])
+    root = psutil.Process(process.pid)
+    while not root.children():
+        pass
+
+    helper = root.children()[0]
+    yield process, helper
+
+    for leftover in (helper, root):
+        try:
+            leftover.kill()
+        except psutil.Error:
+            pass
+    process.wait()
+
+
+def test_close_terminates_only_the_browser_root(tmp_path, browser):
+    process, helper = browser
+    registry = ProcessRegistry(tmp_path / "registry.json")
+    registry.register("1", process, {"debug": False})
+
+    assert registry.close("1", timeout=5)
+
+    assert process.poll() is not None
+    assert helper.is_running()  # a real browser shuts its own helpers down
+    assert registry.get_entry("1") is None
+    assert not registry.close("1")
+
+
+def test_handed_off_launch_is_not_tracked_as_a_process(tmp_path, monkeypatch):
+    browser_running = True
+    monkeypatch.setattr(process_registry_module, "is_user_data_dir_in_use", lambda path: browser_running)
+    launcher = subprocess.Popen([sys.executable, '-c', 'pass'])
+    launcher.wait()
+
+    registry = ProcessRegistry(tmp_path / "registry.json")
+    registry.register("1", launcher, {"debug": False}, handed_off=True)
+
+    assert registry.get_entry("1")["pid"] is None
+    assert registry.get_running() == {}
+    assert not registry.close("1")  # nothing of its own to close
+    assert ProcessRegistry(tmp_path / "registry.json").get_handed_off() == ["1"]
+
+    browser_running = False
+    assert registry.get_handed_off() == []
+    assert registry.get_entry("1") is None
+
+
+def test_close_goes_through_the_graceful_terminate(tmp_path, browser, monkeypatch):
+    process, _ = browser
+    terminated = []
+    monkeypatch.setattr(process_registry_module, "terminate_process_gracefully",
+                        lambda target: terminated.append(target.pid) or target.terminate())
+    registry = ProcessRegistry(tmp_path / "registry.json")
+    registry.register("1", process, {"debug": False})
+
+    assert registry.close("1", timeout=5)
+    assert terminated == [process.pid]
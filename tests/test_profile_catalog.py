@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+import src.utils.profile_catalog as profile_catalog_module
+from src.utils.profile_catalog import ProfileCatalog
+
+
+@pytest.fixture
+def profiles_root(tmp_path, monkeypatch):
+    root = tmp_path / "profiles"
+    for name in ("1", "2"):
+        os.makedirs(root / f"Profile {name}" / "Extensions" / "abc" / "1.0")
+        (root / f"Profile {name}" / "Extensions" / "abc" / "1.0" / "manifest.json").write_text("{}")
+
+    monkeypatch.setattr(profile_catalog_module, "CHROME_DATA_PATH", root)
+    return root
+
+
+def test_lookups_are_saved_in_one_batch(tmp_path, profiles_root):
+    catalog = ProfileCatalog(tmp_path / "catalog.json")
+
+    assert catalog.get_profiles(["1"])["1"]["extensions"]["abc"]["versions"] == ["1.0"]
+    assert catalog.get_profiles([2]).keys() == {"2"}
+    assert not (tmp_path / "catalog.json").exists()
+
+    catalog.save()
+    assert ProfileCatalog(tmp_path / "catalog.json").get_profiles(["1", "2"]).keys() == {"1", "2"}
+
+
+def test_stale_entries_do_not_rewrite_the_catalog(tmp_path, profiles_root, monkeypatch):
+    catalog = ProfileCatalog(tmp_path / "catalog.json")
+    catalog.get_profiles(["1"])
+    catalog.save()
+
+    writes = []
+    monkeypatch.setattr(profile_catalog_module, "write_json_atomic", lambda *args: writes.append(args))
+    for i in range(20):
+        (profiles_root / "Profile 1" / "Preferences").write_text("{}")
+        os.utime(profiles_root / "Profile 1", ns=(i, i))  # Chrome touches the profile dir every session
+        assert catalog.get_profiles(["1"])["1"]["has_preferences"]
+
+    assert writes == []
+    catalog.save()
+    assert len(writes) == 1
+
+
+def test_new_extension_versions_are_picked_up(tmp_path, profiles_root):
+    catalog = ProfileCatalog(tmp_path / "catalog.json")
+    catalog.get_profiles(["1"])
+
+    version_path = profiles_root / "Profile 1" / "Extensions" / "abc" / "2.0"
+    os.makedirs(version_path)
+    (version_path / "manifest.json").write_text("{}")
+
+    assert sorted(catalog.get_profiles(["1"])["1"]["extensions"]["abc"]["versions"]) == ["1.0", "2.0"]
+    assert catalog.get_profiles(["3"]) == {}
+
+
+def test_sizes_are_computed_once_until_the_profile_changes(tmp_path, profiles_root, monkeypatch):
+    catalog = ProfileCatalog(tmp_path / "catalog.json")
+    (profiles_root / "Profile 1" / "History").write_bytes(b"x" * 100)
+
+    assert catalog.get_profile_sizes(["1", "3"]) == {"1": 102}
+
+    walks = []
+    get_dir_size = profile_catalog_module.get_dir_size
+    monkeypatch.setattr(profile_catalog_module, "get_dir_size", lambda path: walks.append(path) or get_dir_size(path))
+    assert ProfileCatalog(tmp_path / "catalog.json").get_profile_sizes(["1"]) == {"1": 102}
+    assert walks == []
+
+    (profiles_root / "Profile 1" / "Cookies").write_bytes(b"x" * 10)
+    assert catalog.get_profile_sizes(["1"]) == {"1": 112}
+    assert len(walks) == 1
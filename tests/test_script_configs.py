@@ -0,0 +1,30 @@
+import json
+
+from src.utils.script_configs import load_script_configs, RUN_DELAY_SCHEMA
+
+
+SCRIPTS = {"setup": {"config_schema": RUN_DELAY_SCHEMA}}
+
+
+def load(tmp_path, config: dict):
+    (tmp_path / "setup").mkdir(exist_ok=True)
+    (tmp_path / "setup" / "config.json").write_text(json.dumps(config), encoding="utf-8")
+    return load_script_configs(tmp_path, SCRIPTS, ["setup"])
+
+
+def test_partial_pacing_override_is_accepted(tmp_path):
+    configs, errors = load(tmp_path, {"run_delay_sec": 0, "pacing": {"click_delay_sec": 0.2}})
+
+    assert errors == []
+    assert configs["setup"]["pacing"]["click_delay_sec"] == 0.2
+
+
+def test_malformed_pacing_fails_the_preflight(tmp_path):
+    assert load(tmp_path, {"run_delay_sec": 0, "pacing": 5})[1] == ['setup - config.json: pacing должен быть объектом']
+
+    _, errors = load(tmp_path, {"run_delay_sec": 0, "pacing": {
+        "click_delay_sec": "1", "wait_timeout_sec": -1, "poll_interval_sec": True, "timeout": 3
+    }})
+
+    assert len(errors) == 4
+    assert all(error.startswith('setup - config.json: ') for error in errors)
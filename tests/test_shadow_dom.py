@@ -0,0 +1,39 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.chrome.scripts.utils.shadow_dom import apply_shadow_controls
+from src.chrome.scripts.utils.waits import use_pacing
+
+
+CONTROLS = [{"path": ["#sync"], "attribute": "aria-pressed", "expected": "false"}]
+
+
+class FakeDriver:
+    def __init__(self, responses: list):
+        self.responses = responses
+        self.calls = 0
+
+    def execute_script(self, script, host_path, controls):
+        self.calls += 1
+        return self.responses[min(self.calls, len(self.responses)) - 1]
+
+
+def test_missing_host_on_recheck_is_not_applied():
+    lagging = [{"before": "true", "after": "true", "clicked": True}]
+    driver = FakeDriver([lagging, None])
+
+    with use_pacing({"poll_interval_sec": 0.01}), pytest.raises(TimeoutException):
+        apply_shadow_controls(driver, ["settings-ui"], CONTROLS, timeout=0.1)
+
+    assert driver.calls > 2
+
+
+def test_recheck_waits_until_the_attribute_is_reflected():
+    lagging = [{"before": "true", "after": "true", "clicked": True}]
+    applied = [{"before": "false", "after": "false", "clicked": False}]
+    driver = FakeDriver([lagging, None, [], applied])
+
+    with use_pacing({"poll_interval_sec": 0.01}):
+        assert apply_shadow_controls(driver, ["settings-ui"], CONTROLS, timeout=1) == lagging
+
+    assert driver.calls == 4